@@ -0,0 +1,58 @@
+"""Micro-benchmark of the FMOD result code checking.
+
+Compares checking a successful return code by constructing the RESULT enum
+member (which is what :py:func:`~pyfmodex.utils.ckresult` used to do) with the
+plain integer comparison used now, and times a hot property using it.
+
+Run with ``python benchmarks/bench_ckresult.py``. The FMOD library has to be
+found the same way as when running the test suite, for example by setting
+``PYFMODEX_DLL_PATH``.
+"""
+
+import timeit
+
+import pyfmodex
+from pyfmodex.enums import DSP_TYPE, OUTPUTTYPE, RESULT
+from pyfmodex.exceptions import FmodError
+from pyfmodex.utils import ckresult
+
+NUMBER = 200000
+
+
+def enum_ckresult(result):
+    """The result check as it was done before."""
+    result = RESULT(result)
+    if result is not RESULT.OK:
+        raise FmodError(result)
+
+
+def main():
+    """Run the benchmark and print the per call timings."""
+    system = pyfmodex.System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.init()
+    oscillator = system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)
+    channel = system.play_dsp(oscillator, paused=True)
+
+    def get_volume():
+        return channel.volume
+
+    def set_volume():
+        channel.volume = 0.5
+
+    for name, func in (
+        ("enum check", lambda: enum_ckresult(0)),
+        ("int check", lambda: ckresult(0)),
+        ("volume get", get_volume),
+        ("volume set", set_volume),
+    ):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print("%-12s %8.1f ns/call" % (name, best / NUMBER * 1e9))
+
+    channel.stop()
+    oscillator.release()
+    system.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Micro-benchmark of the per call overhead of the FMOD function dispatch.
+
+Compares resolving the C function by its formatted name on every call (which
+is what the wrappers used to do) with the pre-resolved functions used now. As
+the time spent inside FMOD varies a lot between runs, the cost of just finding
+the function to call is measured separately as well.
+
+Run with ``python benchmarks/bench_dispatch.py``. The FMOD library has to be
+found the same way as when running the test suite, for example by setting
+``PYFMODEX_DLL_PATH``.
+"""
+
+import timeit
+from ctypes import byref, c_float
+
+import pyfmodex
+from pyfmodex.enums import OUTPUTTYPE
+from pyfmodex.globalvars import DLL
+from pyfmodex.utils import ckresult
+
+NUMBER = 200000
+
+
+def main():
+    """Run the benchmark and print the per call timings."""
+    system = pyfmodex.System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.init()
+    group = system.master_channel_group
+
+    def raw_call():
+        vol = c_float()
+        ckresult(get_volume(group._ptr, byref(vol)))
+
+    def per_call_lookup():
+        vol = c_float()
+        funcname = "FMOD_%s_%s" % (group.__class__.__name__, "GetVolume")
+        ckresult(getattr(DLL, funcname)(group._ptr, byref(vol)))
+
+    def dispatched():
+        vol = c_float()
+        group._call_specific("GetVolume", byref(vol))
+
+    def resolve_per_call():
+        return getattr(DLL, "FMOD_%s_%s" % (group.__class__.__name__, "GetVolume"))
+
+    def resolve_dispatched():
+        return group._specific_functions["GetVolume"]
+
+    get_volume = DLL.FMOD_ChannelGroup_GetVolume
+    for name, func in (
+        ("raw C call", raw_call),
+        ("per call lookup", per_call_lookup),
+        ("dispatched", dispatched),
+        ("lookup only", resolve_per_call),
+        ("dispatch only", resolve_dispatched),
+    ):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print("%-16s %8.1f ns/call" % (name, best / NUMBER * 1e9))
+
+    system.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark of loading a triangle mesh into a Geometry object and editing
+it.
+
+Compares calling :py:meth:`~pyfmodex.geometry.Geometry.add_polygon` for every
+triangle with passing flat vertex and index arrays to
+:py:meth:`~pyfmodex.geometry.Geometry.add_mesh`. The mesh is a square grid of
+two triangles per cell. Then compares changing the occlusion and a vertex of
+every tenth triangle through
+:py:class:`~pyfmodex.geometry.PolygonAttributes` with committing the same
+changes from :py:meth:`~pyfmodex.geometry.Geometry.get_polygons`.
+
+Run with ``python benchmarks/bench_geometry.py [CELLS]``, where CELLS is the
+number of cells along a side of the grid (default 300, which gives 180000
+triangles). The FMOD library has to be found the same way as when running the
+test suite, for example by setting ``PYFMODEX_DLL_PATH``.
+"""
+
+import sys
+import time
+from array import array
+
+import pyfmodex
+from pyfmodex.enums import OUTPUTTYPE
+
+
+def grid(cells):
+    """Vertices and triangle indices of a square grid in the xz plane."""
+    side = cells + 1
+    vertices = array("f")
+    for row in range(side):
+        for col in range(side):
+            vertices.extend((col, 0.0, row))
+    indices = array("i")
+    for row in range(cells):
+        for col in range(cells):
+            corner = row * side + col
+            indices.extend((corner, corner + 1, corner + side))
+            indices.extend((corner + 1, corner + side + 1, corner + side))
+    return vertices, indices
+
+
+def add_polygons(geometry, vertices, indices):
+    """Add the triangles one add_polygon call at a time."""
+    points = [tuple(vertices[index : index + 3]) for index in range(0, len(vertices), 3)]
+    for index in range(0, len(indices), 3):
+        geometry.add_polygon(
+            1.0,
+            1.0,
+            False,
+            points[indices[index]],
+            points[indices[index + 1]],
+            points[indices[index + 2]],
+        )
+
+
+def timed(system, count, load):
+    """Seconds taken by loading into a new geometry object."""
+    geometry = system.create_geometry(count // 3, count)
+    start = time.perf_counter()
+    load(geometry)
+    duration = time.perf_counter() - start
+    geometry.release()
+    return duration
+
+
+def edit_polygons(geometry):
+    """Change every tenth triangle one polygon at a time."""
+    for index in range(0, geometry.num_polygons, 10):
+        polygon = geometry.get_polygon(index)
+        polygon.direct_occlusion = 0.5
+        vertex = polygon.get_vertex(0)
+        polygon.set_vertex(0, [vertex[0], 1.0, vertex[2]])
+
+
+def edit_arrays(polygons):
+    """Change every tenth triangle in the arrays and commit them."""
+    for polygon in range(0, len(polygons), 10):
+        polygons.direct_occlusion[polygon] = 0.5
+        polygons.vertices[3 * polygons.vertex_offsets[polygon] + 1] = 1.0
+    polygons.commit()
+
+
+def main():
+    """Run the benchmark and print the timings."""
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    vertices, indices = grid(cells)
+    count = len(indices)
+    system = pyfmodex.System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.init()
+    system.geometry_max_world_size = cells
+
+    print("%d triangles" % (count // 3))
+    for name, load in (
+        ("add_polygon", lambda geometry: add_polygons(geometry, vertices, indices)),
+        ("add_mesh", lambda geometry: geometry.add_mesh(vertices, indices, 1.0, 1.0, False)),
+    ):
+        print("%-12s %8.3f s" % (name, timed(system, count, load)))
+
+    geometry = system.create_geometry(count // 3, count)
+    geometry.add_mesh(vertices, indices, 1.0, 1.0, False)
+    start = time.perf_counter()
+    polygons = geometry.get_polygons()
+    print("%-12s %8.3f s" % ("get_polygons", time.perf_counter() - start))
+    for name, edit in (
+        ("edit each", lambda: edit_polygons(geometry)),
+        ("edit arrays", lambda: edit_arrays(polygons)),
+    ):
+        polygons.refresh()
+        start = time.perf_counter()
+        edit()
+        print("%-12s %8.3f s" % (name, time.perf_counter() - start))
+    geometry.release()
+
+    system.release()
+
+
+if __name__ == "__main__":
+    main()
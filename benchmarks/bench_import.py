@@ -0,0 +1,63 @@
+"""Benchmark of the import time of pyfmodex.
+
+Every measurement starts a fresh interpreter. Besides importing the package,
+the time needed to get to a created System is measured, and the time needed
+to import all modules the package used to import eagerly, which is what
+``import pyfmodex`` cost before the submodules were loaded lazily.
+
+Run with ``python benchmarks/bench_import.py``. The FMOD library has to be
+found the same way as when running the test suite, for example by setting
+``PYFMODEX_DLL_PATH``. Use ``python -X importtime -c "import pyfmodex"`` for a
+breakdown by module.
+"""
+
+import subprocess
+import sys
+import time
+
+RUNS = 20
+
+EAGER_MODULES = (
+    "channel",
+    "channel_group",
+    "constants",
+    "dsp",
+    "dsp_connection",
+    "geometry",
+    "reverb",
+    "reverb_presets",
+    "roomproperties",
+    "sound",
+    "sound_group",
+    "system",
+)
+
+SCENARIOS = (
+    ("python startup", "pass"),
+    ("import pyfmodex", "import pyfmodex"),
+    ("create a System", "import pyfmodex; pyfmodex.System()"),
+    (
+        "import all modules",
+        "import " + ", ".join("pyfmodex." + name for name in EAGER_MODULES),
+    ),
+)
+
+
+def best(code):
+    """Best wall clock time of running the code in a fresh interpreter."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark and print the timings."""
+    for name, code in SCENARIOS:
+        print("%-20s %7.1f ms" % (name, best(code) * 1e3))
+
+
+if __name__ == "__main__":
+    main()
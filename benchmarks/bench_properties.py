@@ -0,0 +1,153 @@
+"""Micro-benchmark of simple Channel properties.
+
+Compares the hand written accessors the properties used to have, which
+allocated ctypes values and went through the generic call helpers on every
+access, with the :py:class:`~pyfmodex.fmodobject.FmodProperty` descriptors
+used now. Both are accessed as properties, the old accessors through a
+subclass of :py:class:`~pyfmodex.channel.Channel` wrapping the same channel.
+
+Run with ``python benchmarks/bench_properties.py``. The FMOD library has to be
+found the same way as when running the test suite, for example by setting
+``PYFMODEX_DLL_PATH``.
+"""
+
+import timeit
+from ctypes import byref, c_bool, c_float, c_int
+
+import pyfmodex
+from pyfmodex.enums import DSP_TYPE, OUTPUTTYPE
+from pyfmodex.fmodobject import _dll
+from pyfmodex.utils import ckresult
+
+NUMBER = 2000
+REPEAT = 5
+ROUNDS = 100
+
+
+def legacy_volume(channel):
+    vol = c_float()
+    channel._call_specific("GetVolume", byref(vol))
+    return vol.value
+
+
+def legacy_set_volume(channel, vol):
+    channel._call_specific("SetVolume", c_float(vol))
+
+
+def legacy_pitch(channel):
+    val = c_float()
+    channel._call_specific("GetPitch", byref(val))
+    return val.value
+
+
+def legacy_set_pitch(channel, val):
+    channel._call_specific("SetPitch", c_float(val))
+
+
+def legacy_paused(channel):
+    paused = c_bool()
+    channel._call_specific("GetPaused", byref(paused))
+    return paused.value
+
+
+def legacy_set_paused(channel, paused):
+    channel._call_specific("SetPaused", paused)
+
+
+def legacy_mute(channel):
+    mute = c_bool()
+    channel._call_specific("GetMute", byref(mute))
+    return mute.value
+
+
+def legacy_set_mute(channel, mute):
+    channel._call_specific("SetMute", mute)
+
+
+def legacy_frequency(channel):
+    freq = c_float()
+    ckresult(_dll.FMOD_Channel_GetFrequency(channel._ptr, byref(freq)))
+    return freq.value
+
+
+def legacy_set_frequency(channel, freq):
+    ckresult(_dll.FMOD_Channel_SetFrequency(channel._ptr, c_float(freq)))
+
+
+def legacy_priority(channel):
+    pri = c_int()
+    ckresult(_dll.FMOD_Channel_GetPriority(channel._ptr, byref(pri)))
+    return pri.value
+
+
+def legacy_set_priority(channel, pri):
+    ckresult(_dll.FMOD_Channel_SetPriority(channel._ptr, pri))
+
+
+LEGACY_ACCESSORS = {
+    "volume": (legacy_volume, legacy_set_volume),
+    "pitch": (legacy_pitch, legacy_set_pitch),
+    "paused": (legacy_paused, legacy_set_paused),
+    "mute": (legacy_mute, legacy_set_mute),
+    "frequency": (legacy_frequency, legacy_set_frequency),
+    "priority": (legacy_priority, legacy_set_priority),
+}
+
+# Named Channel as well, the legacy accessors build the names of the library
+# functions from the class name.
+LegacyChannel = type(
+    "Channel",
+    (pyfmodex.channel.Channel,),
+    {name: property(*accessors) for name, accessors in LEGACY_ACCESSORS.items()},
+)
+
+
+def best(funcs):
+    """Best time per call of each function in nanoseconds.
+
+    The functions are timed in turns over many short rounds, so that changes
+    of the machine load during the run affect all of them alike.
+    """
+    timings = [float("inf")] * len(funcs)
+    for _ in range(ROUNDS):
+        for index, func in enumerate(funcs):
+            timing = min(timeit.repeat(func, number=NUMBER, repeat=REPEAT))
+            timings[index] = min(timings[index], timing / NUMBER * 1e9)
+    return timings
+
+
+def main():
+    """Run the benchmark and print the per access timings."""
+    system = pyfmodex.System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.init()
+    oscillator = system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)
+    channel = system.play_dsp(oscillator, paused=True)
+    legacy_channel = LegacyChannel(channel._ptr)
+
+    print("%-10s %12s %12s %12s %12s" % ("", "old get", "new get", "old set", "new set"))
+    for name, value in (
+        ("volume", 0.5),
+        ("pitch", 1.5),
+        ("paused", True),
+        ("mute", False),
+        ("frequency", 48000.0),
+        ("priority", 64),
+    ):
+        timings = best(
+            [
+                lambda: getattr(legacy_channel, name),
+                lambda: getattr(channel, name),
+                lambda: setattr(legacy_channel, name, value),
+                lambda: setattr(channel, name, value),
+            ]
+        )
+        print("%-10s %9.1f ns %9.1f ns %9.1f ns %9.1f ns" % (name, *timings))
+
+    channel.stop()
+    oscillator.release()
+    system.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Benchmarks of the hot wrapper paths, using pytest-benchmark.
+
+All systems use :py:attr:`~pyfmodex.enums.OUTPUTTYPE.NOSOUND_NRT` output, so
+no sound device is needed and mixing only happens in
+:py:meth:`~pyfmodex.system.System.update`.
+
+Besides the timings, the memory use of the calls is measured with
+:py:mod:`tracemalloc` and stored in the extra info of each benchmark: the
+number of memory blocks still allocated per call, and the peak number of bytes
+allocated at once during a run of calls. Retained blocks point at leaks or
+growing caches, the peak at large temporary buffers. Python offers no count of
+short-lived allocations, so this is not the number of allocations per call.
+
+The file is not collected by the test suite. Run it with::
+
+    python -m pytest benchmarks/bench_suite.py
+
+and compare runs with ``--benchmark-autosave`` and
+``--benchmark-compare``, see the pytest-benchmark documentation. The extra
+info is included in the ``--benchmark-json`` output.
+"""
+
+import os
+import tracemalloc
+from array import array
+from itertools import cycle
+
+import pytest
+
+import pyfmodex
+import pyfmodex.studio
+from pyfmodex.enums import DSP_TYPE, OUTPUTTYPE
+from pyfmodex.exceptions import FmodError
+from pyfmodex.flags import MODE
+from pyfmodex.spatial_world import SpatialAudioWorld
+
+pytest.importorskip("pytest_benchmark")
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests")
+MEMORY_CALLS = 1000
+
+
+def memory_use(func, calls=MEMORY_CALLS):
+    """Measure the Python memory use of calling a function.
+
+    :returns: Blocks retained per call, and the peak number of bytes
+        allocated during the calls on top of what was allocated before.
+    :rtype: dict
+    """
+    func()  # Fill any caches first.
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(ignore)
+        for _ in range(calls):
+            func()
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+    finally:
+        tracemalloc.stop()
+    # The peak is measured in a tracing session of its own, which starts
+    # without the snapshot above. tracemalloc.reset_peak needs Python 3.9.
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        for _ in range(calls):
+            func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "retained_blocks_per_call": blocks / calls,
+        "peak_bytes": peak - base,
+    }
+
+
+def run(benchmark, func):
+    """Benchmark a function, recording its memory use."""
+    benchmark.extra_info.update(memory_use(func))
+    benchmark(func)
+
+
+@pytest.fixture(scope="module")
+def system():
+    system = pyfmodex.System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.init(64)
+    yield system
+    system.release()
+
+
+@pytest.fixture(scope="module")
+def sound(system):
+    sound = system.create_sound(os.path.join(TESTS_DIR, "test.fsb"))
+    yield sound.get_subsound(0)
+    sound.release()
+
+
+@pytest.fixture
+def channel(system, sound):
+    channel = system.play_sound(sound, paused=True)
+    yield channel
+    channel.stop()
+
+
+@pytest.fixture(scope="module")
+def studio_system():
+    system = pyfmodex.studio.StudioSystem()
+    system.core_system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.initialize()
+    for name in ("Master Bank.bank", "Master Bank.strings.bank", "Vehicles.bank"):
+        system.load_bank_file(os.path.join(TESTS_DIR, name))
+    yield system
+    system.release()
+
+
+def test_system_update(benchmark, system):
+    oscillator = system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)
+    channel = system.play_dsp(oscillator)
+    run(benchmark, system.update)
+    channel.stop()
+    oscillator.release()
+
+
+def test_play_sound(benchmark, system, sound):
+    def play():
+        system.play_sound(sound, paused=True).stop()
+
+    run(benchmark, play)
+
+
+def test_channel_get_volume(benchmark, channel):
+    run(benchmark, lambda: channel.volume)
+
+
+def test_channel_set_volume(benchmark, channel):
+    def set_volume():
+        channel.volume = 0.5
+
+    run(benchmark, set_volume)
+
+
+def test_channel_get_position(benchmark, channel):
+    run(benchmark, lambda: channel.position)
+
+
+def test_channel_set_position(benchmark, channel):
+    def set_position():
+        channel.position = [1.0, 2.0, 3.0]
+
+    run(benchmark, set_position)
+
+
+def test_listener_commit(benchmark, system):
+    listener = system.listener()
+    run(benchmark, listener._commit)  # pylint: disable=protected-access
+
+
+def test_dsp_get_parameter_float(benchmark, system):
+    oscillator = system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)
+    run(benchmark, lambda: oscillator.get_parameter_float(1))
+    oscillator.release()
+
+
+def test_sound_read_data(benchmark, system):
+    sound = system.create_sound(os.path.join(TESTS_DIR, "test.fsb"), MODE.OPENONLY)
+    subsound = sound.get_subsound(0)
+
+    def read():
+        try:
+            subsound.read_data(4096)
+        except FmodError:
+            subsound.seek_data(0)
+
+    run(benchmark, read)
+    sound.release()
+
+
+def test_sound_read_into(benchmark, system):
+    sound = system.create_sound(os.path.join(TESTS_DIR, "test.fsb"), MODE.OPENONLY)
+    subsound = sound.get_subsound(0)
+    buffer = bytearray(4096)
+
+    def read():
+        if not subsound.read_into(buffer):
+            subsound.seek_data(0)
+
+    run(benchmark, read)
+    sound.release()
+
+
+def test_geometry_occlusion(benchmark, system):
+    geometry = system.create_geometry(1, 4)
+    geometry.add_polygon(
+        1.0, 1.0, True, (-10, -10, 5), (10, -10, 5), (10, 10, 5), (-10, 10, 5)
+    )
+    run(benchmark, lambda: system.get_geometry_occlusion((0, 0, 0), (0, 0, 10)))
+    geometry.release()
+
+
+def test_geometry_occlusion_batch(benchmark, system):
+    geometry = system.create_geometry(1, 4)
+    geometry.add_polygon(
+        1.0, 1.0, True, (-10, -10, 5), (10, -10, 5), (10, 10, 5), (-10, 10, 5)
+    )
+    sources = array("f", [0.0, 0.0, 10.0] * 500)
+    direct = array("f", [0.0] * 500)
+    reverb = array("f", [0.0] * 500)
+    run(
+        benchmark,
+        lambda: system.get_geometry_occlusion_batch(
+            (0, 0, 0), sources, direct, reverb
+        ),
+    )
+    geometry.release()
+
+
+def test_geometry_occlusion_loop(benchmark, system):
+    geometry = system.create_geometry(1, 4)
+    geometry.add_polygon(
+        1.0, 1.0, True, (-10, -10, 5), (10, -10, 5), (10, 10, 5), (-10, 10, 5)
+    )
+    sources = [(0.0, 0.0, 10.0)] * 500
+
+    def occlude():
+        for source in sources:
+            system.get_geometry_occlusion((0, 0, 0), source)
+
+    run(benchmark, occlude)
+    geometry.release()
+
+
+def test_spatial_world_update(benchmark, system):
+    world = SpatialAudioWorld(system, cell_size=50.0)
+    reverbs = []
+    for row in range(64):
+        for col in range(64):
+            reverb = system.create_reverb_3d()
+            reverb.position = [col * 50.0, 0.0, row * 50.0]
+            reverb.max_distance = 40.0
+            world.add_reverb(reverb)
+            reverbs.append(reverb)
+    path = [[step * 7.0, 0.0, step * 3.0] for step in range(400)]
+    steps = cycle(path)
+    run(benchmark, lambda: world.update([next(steps)]))
+    for reverb in reverbs:
+        reverb.release()
+
+
+def test_studio_set_parameter_by_name(benchmark, studio_system):
+    event = studio_system.get_event("event:/Vehicles/Car Engine")
+    instance = event.create_instance()
+    run(benchmark, lambda: instance.set_parameter_by_name("rpm", 4000))
+
+
+def test_studio_update(benchmark, studio_system):
+    run(benchmark, studio_system.update)
+
+
+def test_studio_set_parameter_by_id(benchmark, studio_system):
+    event = studio_system.get_event("event:/Vehicles/Car Engine")
+    instance = event.create_instance()
+    parameter_id = event.get_parameter_id("rpm")
+    run(benchmark, lambda: instance.set_parameter_by_id(parameter_id, 4000))
+
+
+def test_studio_set_parameters_by_ids(benchmark, studio_system):
+    event = studio_system.get_event("event:/Vehicles/Car Engine")
+    instance = event.create_instance()
+    ids = event.get_parameter_ids(["rpm", "load", "fl", "fr", "ce"])
+    values = [4000, 0.5, 1.0, 1.0, 1.0]
+    run(benchmark, lambda: instance.set_parameters_by_ids(ids, values))
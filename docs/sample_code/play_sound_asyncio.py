@@ -0,0 +1,57 @@
+"""Example code to show how to play sounds one after the other from asyncio,
+with the system updated by an update driver instead of a main loop.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pyfmodex
+from pyfmodex.aio import UpdateDriver
+from pyfmodex.flags import MODE
+
+MIN_FMOD_VERSION = 0x00020108
+
+mediadir = Path("media")
+soundnames = (
+    mediadir / "drumloop.wav",
+    mediadir / "jaguar.wav",
+    mediadir / "swish.wav",
+)
+
+
+async def main():
+    """Open the sounds without blocking and play them in turn."""
+    system = pyfmodex.System()
+    version = system.version
+    if version < MIN_FMOD_VERSION:
+        print(
+            f"FMOD lib version {version:#08x} doesn't meet "
+            f"minimum requirement of version {MIN_FMOD_VERSION:#08x}"
+        )
+        sys.exit(1)
+
+    system.init()
+
+    async with UpdateDriver(system, rate=50) as driver:
+        sounds = [
+            system.create_sound(str(filename), mode=MODE.LOOP_OFF | MODE.NONBLOCKING)
+            for filename in soundnames
+        ]
+        for filename, sound in zip(soundnames, sounds):
+            await driver.sound_ready(sound)
+            print(f"Playing {filename.stem}")
+            await driver.channel_ended(sound.play())
+
+        print(
+            f"{driver.ticks} updates, {driver.missed} missed, "
+            f"{driver.mean_duration * 1e3:.3f} ms on average"
+        )
+
+    # Shut down
+    for sound in sounds:
+        sound.release()
+    system.release()
+
+
+asyncio.run(main())
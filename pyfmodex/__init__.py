@@ -1,33 +1,80 @@
-"""FMOD python bindings."""
+"""FMOD python bindings.
+
+Submodules, the :py:class:`~pyfmodex.system.System` class and the reverb and
+room property helpers are imported on first access, so that importing the
+package stays cheap.
+"""
+
+from importlib import import_module
 
 from .fmodex import (get_disk_busy, get_memory_stats, initialize_debugging,
                      initialize_memory, set_disk_busy)
+from .exceptions import FmodError
 
-# Avoid recursive import hell
-from . import (channel, channel_group, dsp, dsp_connection, geometry,
-               globalvars, reverb, sound, sound_group, system)
+__version__ = "0.7.2"
 
-# import reverb presets
-from .reverb_presets import REVERB_PRESET, set_reverb_preset
+# Attributes imported on first access, by the module providing them.
+_lazy_attributes = {
+    "System": "system",
+    # reverb presets
+    "REVERB_PRESET": "reverb_presets",
+    "set_reverb_preset": "reverb_presets",
+    # structures to be used with Resonance Audio plugin
+    "MaterialNames": "roomproperties",
+    "RoomProperties": "roomproperties",
+}
 
-# import structures to be used with Resonance Audio plugin
-from .roomproperties import MaterialNames, RoomProperties
-from .utils import FmodError
+_lazy_modules = {
+    "callback_prototypes",
+    "channel",
+    "channel_control",
+    "channel_group",
+    "cone_settings",
+    "constants",
+    "dsp",
+    "dsp_connection",
+    "enums",
+    "exceptions",
+    "flags",
+    "fmodex",
+    "fmodobject",
+    "function_prototypes",
+    "geometry",
+    "globalvars",
+    "reverb",
+    "reverb_presets",
+    "roomproperties",
+    "sound",
+    "sound_group",
+    "structobject",
+    "structure_declarations",
+    "structures",
+    "system",
+    "utils",
+}
+
+__all__ = [
+    "FmodError",
+    "get_disk_busy",
+    "get_memory_stats",
+    "initialize_debugging",
+    "initialize_memory",
+    "set_disk_busy",
+    *sorted(_lazy_attributes),
+    *sorted(_lazy_modules),
+]
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        value = getattr(import_module("." + _lazy_attributes[name], __name__), name)
+    elif name in _lazy_modules:
+        value = import_module("." + name, __name__)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
 
-__version__ = "0.7.2"
 
-c = {}
-c["DSP"] = dsp.DSP
-c["DSP_Connection"] = dsp_connection.DSPConnection
-c["Geometry"] = geometry.Geometry
-c["Channel"] = channel.Channel
-c["ChannelGroup"] = channel_group.ChannelGroup
-c["Reverb3D"] = reverb.Reverb3D
-c["Sound"] = sound.Sound
-c["SoundGroup"] = sound_group.SoundGroup
-c["System"] = system.System
-globalvars.class_list = c
-
-from . import constants
-
-System = c["System"]
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes) | _lazy_modules)
@@ -0,0 +1,384 @@
+"""Driving System and StudioSystem updates from asyncio."""
+
+import asyncio
+import threading
+import time
+from weakref import WeakKeyDictionary
+
+from .callback_prototypes import SOUND_NONBLOCKCALLBACK
+from .enums import OPENSTATE, RESULT
+from .exceptions import FmodError
+from .flags import MODE
+from .structures import CREATESOUNDEXINFO
+
+
+class UpdateDriver:
+    """Calls the update method of a
+    :py:class:`~pyfmodex.system.System` or
+    :py:class:`~pyfmodex.studio.system.StudioSystem` at a fixed rate, either
+    as a task on the running event loop or on a dedicated thread.
+
+    Ticks are scheduled on a fixed grid, so the rate does not drift with the
+    time the updates take. When a tick is late by a whole period or more, the
+    ticks it overlaps are skipped rather than run back to back, and counted in
+    :py:attr:`missed`. The time spent in the updates is kept in
+    :py:attr:`last_duration`, :py:attr:`max_duration` and
+    :py:attr:`mean_duration`.
+
+    When an update raises, the driver stops, the exception is kept in
+    :py:attr:`error` and raised in the coroutines waiting for updates.
+
+    Coroutines can wait for the next update with :py:meth:`next_update`, or
+    for a condition checked after every update with :py:meth:`wait_for`, and
+    the helpers built on it like :py:meth:`channel_ended` and
+    :py:meth:`sound_ready`. With a dedicated thread, waiters are resumed on
+    their own event loop, where the conditions are checked too.
+
+    While a driver runs, pass ``update=False`` to
+    :py:meth:`~pyfmodex.studio.system.StudioSystem.load_bank_async` and leave
+    out the system in
+    :py:meth:`~pyfmodex.studio.event_description.EventDescription.load_sample_data_async`.
+    """
+
+    def __init__(self, system, rate=60.0):
+        """Constructor.
+
+        :param system: System or StudioSystem to update.
+        :param float rate: Number of updates per second.
+        """
+        self.system = system
+        self.period = 1.0 / rate
+        self.ticks = 0
+        self.missed = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self._total_duration = 0.0
+        self._waiters = []
+        self._lock = threading.Lock()
+        self._running = False
+        self._task = None
+        self._thread = None
+        self.error = None
+
+    @property
+    def mean_duration(self):
+        """Mean number of seconds an update took.
+
+        :type: float
+        """
+        return self._total_duration / self.ticks if self.ticks else 0.0
+
+    @property
+    def running(self):
+        """Whether the driver has been started and not stopped since.
+
+        :type: bool
+        """
+        return self._running
+
+    def reset_stats(self):
+        """Reset the tick counters and durations."""
+        self.ticks = 0
+        self.missed = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self._total_duration = 0.0
+
+    def _tick(self):
+        start = time.perf_counter()
+        self.system.update()
+        duration = time.perf_counter() - start
+        self.ticks += 1
+        self.last_duration = duration
+        self._total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+        with self._lock:
+            waiters = self._waiters
+            self._waiters = []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                pass  # The loop of the waiter has been closed
+
+    def _next_deadline(self, deadline, now):
+        deadline += self.period
+        if now >= deadline + self.period:
+            late = int((now - deadline) / self.period)
+            self.missed += late
+            deadline += late * self.period
+        return deadline
+
+    def _fail(self, error):
+        """Stop after a failed update, raising the error in the waiters."""
+        self._running = False
+        with self._lock:
+            self.error = error
+            waiters = self._waiters
+            self._waiters = []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_reject, future, error)
+            except RuntimeError:
+                pass  # The loop of the waiter has been closed
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        try:
+            while self._running:
+                self._tick()
+                deadline = self._next_deadline(deadline, loop.time())
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+        except Exception as error:  # pylint: disable=broad-except
+            self._fail(error)
+
+    def _run_thread(self):
+        deadline = time.monotonic()
+        try:
+            while self._running:
+                self._tick()
+                deadline = self._next_deadline(deadline, time.monotonic())
+                time.sleep(max(0.0, deadline - time.monotonic()))
+        except Exception as error:  # pylint: disable=broad-except
+            self._fail(error)
+
+    def start(self):
+        """Start updating as a task on the running event loop.
+
+        :returns: The task running the updates.
+        :rtype: asyncio.Task
+        """
+        if self._running:
+            raise RuntimeError("Update driver is already running")
+        self._running = True
+        self.error = None
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    def start_thread(self):
+        """Start updating on a dedicated daemon thread.
+
+        :returns: The thread running the updates.
+        :rtype: threading.Thread
+        """
+        if self._running:
+            raise RuntimeError("Update driver is already running")
+        self._running = True
+        self.error = None
+        self._thread = threading.Thread(
+            target=self._run_thread, name="pyfmodex update driver", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """Stop updating, after the update in progress if there is one.
+
+        Waits for a dedicated thread to finish. Coroutines waiting for
+        updates keep waiting until the driver is started again.
+        """
+        self._running = False
+        if self._thread is not None:
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def next_update(self):
+        """Wait for the next update to finish.
+
+        :rtype: asyncio.Future
+        :raises Exception: what the update raised, when it failed, also when
+            it failed before the call.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.error is not None and not self._running:
+                future.set_exception(self.error)
+            else:
+                self._waiters.append((loop, future))
+        return future
+
+    async def wait_for(self, predicate, timeout=None):
+        """Wait until a condition holds, checking it after every update.
+
+        :param predicate: Callable returning whether the condition holds.
+        :param float timeout: Maximum number of seconds to wait, or None to
+            wait indefinitely.
+        :raises asyncio.TimeoutError: when the timeout expires first.
+        """
+
+        async def check():
+            while not predicate():
+                await self.next_update()
+
+        await asyncio.wait_for(check(), timeout)
+
+    async def channel_ended(self, channel, timeout=None):
+        """Wait until a channel stops playing.
+
+        :param Channel channel: The channel.
+        :param float timeout: Maximum number of seconds to wait, or None to
+            wait indefinitely.
+        :raises asyncio.TimeoutError: when the timeout expires first.
+        """
+
+        def ended():
+            try:
+                return not channel.is_playing
+            except FmodError:
+                # Ended channels become invalid
+                return True
+
+        await self.wait_for(ended, timeout)
+
+    async def sound_ready(self, sound, timeout=None):
+        """Wait until a sound opened with
+        :py:attr:`~pyfmodex.flags.MODE.NONBLOCKING` is ready.
+
+        :param Sound sound: The sound.
+        :param float timeout: Maximum number of seconds to wait, or None to
+            wait indefinitely.
+        :raises FmodError: when opening the sound failed.
+        :raises asyncio.TimeoutError: when the timeout expires first.
+        """
+        await self.wait_for(
+            lambda: sound.open_state.state is OPENSTATE.READY, timeout
+        )
+
+
+class SoundOpener:
+    """Opens sounds with :py:attr:`~pyfmodex.flags.MODE.NONBLOCKING`,
+    letting coroutines await them becoming ready.
+
+    Completion is signalled by the
+    :py:attr:`~pyfmodex.structures.CREATESOUNDEXINFO.nonblockcallback`,
+    unless the given extended info already has a callback of its own, in
+    which case the open state of the sound is polled instead.
+
+    The number of sounds being opened at once is limited, further requests
+    wait for one of them to finish, so requesting many sounds at once does
+    not flood the asynchronous loader of FMOD. The limit applies to each
+    event loop the opener is used from.
+    """
+
+    def __init__(self, system, max_concurrent=16, poll_interval=0.01):
+        """Constructor.
+
+        :param System system: System to create the sounds with.
+        :param int max_concurrent: Maximum number of sounds being opened at
+            once.
+        :param float poll_interval: Seconds to sleep between polls of the
+            open state, when it has to be polled.
+        """
+        self.system = system
+        self.max_concurrent = max_concurrent
+        self.poll_interval = poll_interval
+        self.in_flight = 0
+        # Semaphores limiting the sounds being opened, by event loop
+        self._semaphores = WeakKeyDictionary()
+
+    async def open(self, name_or_addr, mode=MODE.THREED, exinfo=None):
+        """Open a sound, returning once it is ready.
+
+        :param str name_or_addr: Name of the file or URL to open, or the
+            address of a sound memory block, see
+            :py:meth:`~pyfmodex.system.System.create_sound`.
+        :param MODE mode: Behavior modifier for opening the sound,
+            :py:attr:`~pyfmodex.flags.MODE.NONBLOCKING` is added.
+        :param CREATESOUNDEXINFO exinfo: Extended information for creating the
+            sound. It is copied, not modified.
+        :returns: The ready sound.
+        :rtype: Sound
+        :raises FmodError: when the sound could not be opened.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        async with semaphore:
+            self.in_flight += 1
+            try:
+                return await self._open(name_or_addr, mode | MODE.NONBLOCKING, exinfo)
+            finally:
+                self.in_flight -= 1
+
+    async def _open(self, name_or_addr, mode, exinfo):
+        if exinfo is None:
+            exinfo = CREATESOUNDEXINFO()
+        elif exinfo.nonblockcallback:
+            return await self._poll(self.system.create_sound(name_or_addr, mode, exinfo))
+        else:
+            exinfo = CREATESOUNDEXINFO.from_buffer_copy(exinfo)
+        exinfo.nonblockcallback = _NONBLOCK_CALLBACK
+        sound = self.system.create_sound(name_or_addr, mode, exinfo)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        _opening[sound._ptr.value] = (loop, future)
+        try:
+            # The callback may have run before the sound was registered
+            if self._state(sound) is OPENSTATE.READY:
+                _resolve(future, RESULT.OK.value)
+            result = await future
+        finally:
+            _opening.pop(sound._ptr.value, None)
+        if result != RESULT.OK.value:
+            sound.release()
+            raise FmodError(RESULT(result))
+        return sound
+
+    async def _poll(self, sound):
+        while self._state(sound) is not OPENSTATE.READY:
+            await asyncio.sleep(self.poll_interval)
+        return sound
+
+    @staticmethod
+    def _state(sound):
+        # FMOD returns the error that made opening fail along with the ERROR
+        # state, so open_state raises it.
+        try:
+            return sound.open_state.state
+        except FmodError:
+            sound.release()
+            raise
+
+
+# Sounds being opened by a SoundOpener, by pointer value
+_opening = {}
+
+
+def _on_opened(sound, result):
+    try:
+        loop, future = _opening.pop(sound)
+    except KeyError:
+        return RESULT.OK.value
+    try:
+        loop.call_soon_threadsafe(_resolve, future, result)
+    except RuntimeError:
+        pass  # The loop has been closed
+    return RESULT.OK.value
+
+
+_NONBLOCK_CALLBACK = SOUND_NONBLOCKCALLBACK(_on_opened)
+
+
+def _resolve(future, result=None):
+    if not future.done():
+        future.set_result(result)
+
+
+def _reject(future, error):
+    if not future.done():
+        future.set_exception(error)
@@ -0,0 +1,192 @@
+"""Offline analysis of many sound files in parallel worker processes.
+
+Every worker process creates its own :py:class:`~pyfmodex.system.System`
+with :py:attr:`~pyfmodex.enums.OUTPUTTYPE.NOSOUND_NRT` output, decodes the
+files it is given with :py:func:`~pyfmodex.decoding.iter_sound_pcm` and
+applies a reducer to the decoded data. Only the reducer results are sent back
+to the calling process.
+
+A reducer is a picklable callable, usually a module level function, taking
+two arguments: a :py:class:`~pyfmodex.structobject.Structobject` with the
+fields `path`, `format`, `channels`, `bits`, `frequency` and `frames`
+describing the decoded sound, and an iterator of chunks of PCM data as
+yielded by :py:func:`~pyfmodex.decoding.iter_sound_pcm`. Some reducers are
+provided: :py:func:`duration`, :py:func:`peak` and :py:func:`rms`.
+
+:py:func:`peak` and :py:func:`rms` reduce whole chunks at once with NumPy
+when it is installed. Without it they fall back to iterating over the samples
+in C through builtins, which is several times slower.
+"""
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import mul
+
+from .decoding import iter_sound_pcm
+from .enums import OUTPUTTYPE, SOUND_FORMAT, TIMEUNIT
+from .flags import MODE
+from .structobject import Structobject as so
+
+# The System of a worker process, created by _init_worker.
+_system = None
+
+
+def _init_worker():
+    global _system  # pylint: disable=global-statement
+    from .system import System  # pylint: disable=import-outside-toplevel
+
+    _system = System()
+    _system.output = OUTPUTTYPE.NOSOUND_NRT
+    _system.init()
+
+
+def _reduce_file(reducer, chunk_frames, subsound, return_exceptions, path):
+    try:
+        sound = _system.create_sound(path, MODE.OPENONLY)
+        try:
+            source = sound.get_subsound(subsound) if sound.num_subsounds else sound
+            sound_format = source.format
+            info = so(
+                path=path,
+                format=sound_format.format,
+                channels=sound_format.channels,
+                bits=sound_format.bits,
+                frequency=source.default_frequency,
+                frames=source.get_length(TIMEUNIT.PCM),
+            )
+            chunks = iter_sound_pcm(source, chunk_frames)
+            try:
+                return reducer(info, chunks)
+            finally:
+                chunks.close()
+        finally:
+            sound.release()
+    except Exception as exc:  # pylint: disable=broad-except
+        if return_exceptions:
+            return exc
+        raise
+
+
+def map_files(
+    paths,
+    reducer,
+    max_workers=None,
+    chunk_frames=65536,
+    subsound=0,
+    chunksize=16,
+    return_exceptions=False,
+):
+    """Apply a reducer to each of the given sound files in worker processes.
+
+    Results are yielded in the order of the given paths as soon as they are
+    available.
+
+    :param paths: Paths of the files to analyse.
+    :type paths: iterable of str
+    :param reducer: Picklable callable taking the sound information and an
+        iterator of PCM chunks, see the module documentation.
+    :param int max_workers: Number of worker processes. Defaults to the number
+        of processors of the machine.
+    :param int chunk_frames: Maximum number of frames per PCM chunk.
+    :param int subsound: Index of the subsound to analyse in container formats
+        like FSB.
+    :param int chunksize: Number of files sent to a worker at once. Larger
+        values reduce the communication overhead for many small files.
+    :param bool return_exceptions: Yield the exception raised for a file in
+        place of its result instead of raising it and stopping.
+    :returns: Generator of (path, result) tuples.
+    :rtype: generator of tuples
+    """
+    paths = list(paths)
+    work = partial(_reduce_file, reducer, chunk_frames, subsound, return_exceptions)
+    # Forking would copy the state of an FMOD library already in use by this
+    # process, including locks held by its threads.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers, mp_context=context, initializer=_init_worker
+    ) as executor:
+        yield from zip(paths, executor.map(work, paths, chunksize=chunksize))
+
+
+def duration(info, chunks):  # pylint: disable=unused-argument
+    """Reducer returning the duration of a sound in seconds, without decoding
+    it.
+    """
+    return info.frames / info.frequency
+
+
+_SAMPLE_SCALES = {
+    SOUND_FORMAT.PCM8: 1 << 7,
+    SOUND_FORMAT.PCM16: 1 << 15,
+    SOUND_FORMAT.PCM32: 1 << 31,
+    SOUND_FORMAT.PCMFLOAT: 1,
+}
+
+
+def _samples(info, chunks):
+    """Flatten the chunks of a sound to an iterator of memoryviews of samples,
+    returning the scale of the samples alongside.
+    """
+    try:
+        scale = _SAMPLE_SCALES[info.format]
+    except KeyError:
+        raise ValueError("Unsupported sample format: %s" % info.format) from None
+    return scale, (chunk.cast("B").cast(chunk.format) for chunk in chunks)
+
+
+def _numpy():
+    """The NumPy module, or None when it is not installed."""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
+
+
+def _sum_of_squares(chunk):
+    """Sum of the squares of the samples in a chunk, without NumPy."""
+    sumprod = getattr(math, "sumprod", None)  # Python 3.12 and newer
+    if sumprod is not None:
+        return sumprod(chunk, chunk)
+    return sum(map(mul, chunk, chunk))
+
+
+def peak(info, chunks):
+    """Reducer returning the peak absolute sample value of a sound, from 0.0
+    to 1.0 for full scale.
+    """
+    scale, samples = _samples(info, chunks)
+    numpy = _numpy()
+    result = 0
+    for chunk in samples:
+        if not len(chunk):
+            continue
+        if numpy is not None:
+            values = numpy.frombuffer(chunk, chunk.format)
+            high, low = values.max().item(), values.min().item()
+        else:
+            high, low = max(chunk), min(chunk)
+        result = max(result, high, -low)
+    return min(result / scale, 1.0)
+
+
+def rms(info, chunks):
+    """Reducer returning the root mean square of the samples of a sound, from
+    0.0 to 1.0 for a full scale square wave.
+    """
+    scale, samples = _samples(info, chunks)
+    numpy = _numpy()
+    total = 0.0
+    count = 0
+    for chunk in samples:
+        if numpy is not None:
+            values = numpy.frombuffer(chunk, chunk.format).astype(numpy.float64)
+            total += float(values @ values)
+        else:
+            total += _sum_of_squares(chunk)
+        count += len(chunk)
+    if not count:
+        return 0.0
+    return math.sqrt(total / count) / scale
@@ -0,0 +1,121 @@
+"""Queued delivery of ChannelControl callbacks."""
+
+from collections import namedtuple
+from ctypes import c_void_p
+
+from .callback_prototypes import CHANNELCONTROL_CALLBACK
+from .enums import CHANNELCONTROL_CALLBACK_TYPE
+from .globalvars import get_class
+
+_CONTROL_CLASSES = ("Channel", "ChannelGroup")
+
+#: A ChannelControl notification taken from a
+#: :py:class:`ChannelCallbackQueue`.
+#:
+#: - control: The Channel or ChannelGroup the notification is about.
+#: - type: The :py:class:`~pyfmodex.enums.CHANNELCONTROL_CALLBACK_TYPE`.
+#: - data1, data2: The callback data as integers, or None when NULL. For
+#:   :py:attr:`~pyfmodex.enums.CHANNELCONTROL_CALLBACK_TYPE.SYNCPOINT`, data1
+#:   is the index of the sync point, for
+#:   :py:attr:`~pyfmodex.enums.CHANNELCONTROL_CALLBACK_TYPE.VIRTUALVOICE` it
+#:   is 1 when the Channel became virtual and None when it became real.
+ChannelCallback = namedtuple("ChannelCallback", "control type data1 data2")
+
+
+class ChannelCallbackQueue:
+    """Collects ChannelControl notifications to be handled in bulk.
+
+    Instead of running a Python callable for every notification as
+    :py:meth:`~pyfmodex.channel_control.ChannelControl.set_callback` does, the
+    callback of the Channels and ChannelGroups attached to a queue only stores
+    the raw notification in a preallocated ring of slots. Wrapping the
+    notifications into :py:class:`ChannelCallback` records and handling them
+    happens later, in :py:meth:`drain` or :py:meth:`dispatch`, typically
+    called right after :py:meth:`~pyfmodex.system.System.update`.
+
+    When the ring is full, notifications are dropped and counted in
+    :py:attr:`dropped`.
+
+    Notifications that pass values back to FMOD, like
+    :py:attr:`~pyfmodex.enums.CHANNELCONTROL_CALLBACK_TYPE.OCCLUSION`, cannot
+    be answered from a queue; their data pointers are only valid during the
+    callback.
+    """
+
+    def __init__(self, capacity=1024):
+        """Constructor.
+
+        :param int capacity: Maximum number of notifications held between
+            drains.
+        """
+        self._capacity = capacity
+        self._slots = [None] * capacity
+        self._written = 0
+        self._read = 0
+        self.dropped = 0
+        self._callback = CHANNELCONTROL_CALLBACK(self._push)
+
+    def __len__(self):
+        return self._written - self._read
+
+    def _push(self, control, control_type, callback_type, data1, data2):
+        # pylint: disable=too-many-arguments
+        written = self._written
+        if written - self._read >= self._capacity:
+            self.dropped += 1
+            return 0
+        self._slots[written % self._capacity] = (
+            control,
+            control_type,
+            callback_type,
+            data1,
+            data2,
+        )
+        self._written = written + 1
+        return 0
+
+    def attach(self, control):
+        """Have the notifications of a Channel or ChannelGroup go to this
+        queue, replacing any callback set on it.
+
+        :param ChannelControl control: Channel or ChannelGroup.
+        """
+        control._cb = self._callback
+        control._call_specific("SetCallback", self._callback)
+
+    def drain(self):
+        """Take the queued notifications, oldest first.
+
+        :rtype: list of ChannelCallback
+        """
+        read = self._read
+        written = self._written
+        records = []
+        for index in range(read, written):
+            slot = index % self._capacity
+            control, control_type, callback_type, data1, data2 = self._slots[slot]
+            self._slots[slot] = None
+            records.append(
+                ChannelCallback(
+                    get_class(_CONTROL_CLASSES[control_type])._from_handle(
+                        c_void_p(control)
+                    ),
+                    CHANNELCONTROL_CALLBACK_TYPE(callback_type),
+                    data1,
+                    data2,
+                )
+            )
+        self._read = written
+        return records
+
+    def dispatch(self, handler):
+        """Drain the queue, calling a handler for every notification.
+
+        :param handler: Callable taking a :py:class:`ChannelCallback`.
+        :returns: Number of notifications handled.
+        :rtype: int
+        """
+        records = self.drain()
+        for record in records:
+            handler(record)
+        return len(records)
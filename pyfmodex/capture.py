@@ -0,0 +1,150 @@
+"""A DSP tapping the audio passing through it into a ring buffer."""
+
+from ctypes import (addressof, c_char, c_int, c_uint, c_void_p, cast,
+                    create_string_buffer, memmove)
+
+from .callback_prototypes import DSP_READ_CALLBACK, func
+from .constants import PLUGIN_SDK_VERSION
+from .flags import CHANNELMASK
+from .structobject import Structobject as so
+from .structures import DSP_DESCRIPTION
+
+# DSP_READ_CALLBACK with plain addresses instead of pointer objects, which
+# keeps the work done per block in the callback to a minimum.
+_TAP_READ_CALLBACK = func(
+    c_int, c_void_p, c_void_p, c_void_p, c_uint, c_int, c_void_p
+)
+
+
+class CaptureTap:
+    """A DSP copying the float samples passing through it into a preallocated
+    ring buffer, to be read from another thread.
+
+    Insert :py:attr:`dsp` where the signal should be captured, for example at
+    the head of the master ChannelGroup with
+    :py:meth:`~pyfmodex.channel_control.ChannelControl.add_dsp`, or feed it
+    with :py:meth:`~pyfmodex.dsp.DSP.add_input`. The audio passes through
+    unchanged.
+
+    The mixer thread only writes to the ring buffer and the reading thread
+    only advances past the data it consumed, so no lock is needed between
+    them. When the reader falls behind and a block does not fit in the ring
+    buffer anymore, the block is dropped and counted in :py:attr:`overruns`.
+
+    The callback still runs Python code on the mixer thread, so it needs the
+    GIL. Keep the capacity large enough to cover the longest time the reader
+    may not get to run.
+    """
+
+    def __init__(self, system, speaker_mode=None, capacity=48000):
+        """Constructor.
+
+        :param System system: System to create the DSP with.
+        :param SPEAKERMODE speaker_mode: Speaker mode the input is mixed to
+            before being captured. Defaults to the speaker mode of the
+            software mixer.
+        :param int capacity: Size of the ring buffer in frames.
+        """
+        if speaker_mode is None:
+            speaker_mode = system.software_format.speaker_mode
+        self.channels = system.get_speaker_mode_channels(speaker_mode)
+        self._frame_size = self.channels * 4
+        self._size = capacity * self._frame_size
+        self._ring = create_string_buffer(self._size)
+        self._address = addressof(self._ring)
+        self._written = 0
+        self._read = 0
+        self.overruns = 0
+
+        self._read_callback = _TAP_READ_CALLBACK(self._capture)
+        desc = DSP_DESCRIPTION()
+        desc.pluginsdkversion = PLUGIN_SDK_VERSION
+        desc.name = b"pyfmodex capture tap"
+        desc.numinputbuffers = 1
+        desc.numoutputbuffers = 1
+        desc.read = cast(self._read_callback, DSP_READ_CALLBACK)
+        self.dsp = system.create_dsp(desc)
+        # Have the input mixed to the given speaker mode, instead of getting
+        # the channel count of whatever is playing.
+        self.dsp.channel_format = so(
+            channel_mask=CHANNELMASK(0), num_channels=0, source_speaker_mode=speaker_mode
+        )
+
+    def _capture(self, state, inbuffer, outbuffer, length, inchannels, outchannels):
+        # pylint: disable=unused-argument,too-many-arguments
+        size = length * inchannels * 4
+        memmove(outbuffer, inbuffer, size)
+        written = self._written
+        if written + size - self._read > self._size:
+            self.overruns += 1
+            return 0
+        start = written % self._size
+        first = min(size, self._size - start)
+        memmove(self._address + start, inbuffer, first)
+        if first < size:
+            memmove(self._address, inbuffer + first, size - first)
+        self._written = written + size
+        return 0
+
+    @property
+    def available(self):
+        """Number of captured frames waiting to be read.
+
+        :type: int
+        """
+        return (self._written - self._read) // self._frame_size
+
+    def read_into(self, buffer):
+        """Move captured frames into a buffer.
+
+        :param buffer: Writable buffer object, like a bytearray or a NumPy
+            array, receiving the interleaved float samples.
+        :returns: Number of frames moved, at most as many as fit in the
+            buffer.
+        :rtype: int
+        """
+        view = memoryview(buffer).cast("B")
+        read = self._read
+        size = min(self._written - read, len(view)) // self._frame_size * self._frame_size
+        if not size:
+            return 0
+        target = addressof((c_char * len(view)).from_buffer(view))
+        start = read % self._size
+        first = min(size, self._size - start)
+        memmove(target, self._address + start, first)
+        if first < size:
+            memmove(target + first, self._address, size - first)
+        self._read = read + size
+        return size // self._frame_size
+
+    def read(self, max_frames=None, as_numpy=False):
+        """Read the captured frames.
+
+        :param int max_frames: Maximum number of frames to read, or None to
+            read all available ones.
+        :param bool as_numpy: Return a NumPy array instead of a memoryview.
+        :returns: The frames read, with one row of float samples per frame
+            and one column per channel. Empty when nothing was captured.
+        :rtype: memoryview or NumPy array
+        """
+        frames = self.available
+        if max_frames is not None:
+            frames = min(frames, max_frames)
+        data = bytearray(frames * self._frame_size)
+        frames = self.read_into(data)
+        if as_numpy:
+            import numpy  # pylint: disable=import-outside-toplevel
+
+            return numpy.frombuffer(data, dtype=numpy.float32).reshape(
+                frames, self.channels
+            )
+        if not frames:
+            # Views with a zero length dimension cannot be created by casting
+            return memoryview(data).cast("f")
+        return memoryview(data).cast("f", (frames, self.channels))
+
+    def release(self):
+        """Release the DSP, which has to be removed from the DSP network
+        first.
+        """
+        self.dsp.release()
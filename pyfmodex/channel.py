@@ -5,7 +5,7 @@ hierarchy.
 from ctypes import *
 
 from .channel_control import ChannelControl
-from .fmodobject import _dll
+from .fmodobject import FmodProperty, _dll
 from .globalvars import get_class
 from .utils import check_type, ckresult
 
@@ -33,7 +33,7 @@ class Channel(ChannelControl):
         """
         grp_ptr = c_void_p()
         ckresult(_dll.FMOD_Channel_GetChannelGroup(self._ptr, byref(grp_ptr)))
-        return get_class("ChannelGroup")(grp_ptr)
+        return get_class("ChannelGroup")._from_handle(grp_ptr)
 
     @channel_group.setter
     def channel_group(self, group):
@@ -52,32 +52,22 @@ class Channel(ChannelControl):
         ckresult(_dll.FMOD_Channel_GetCurrentSound(self._ptr, byref(snd_ptr)))
         return get_class("Sound")(snd_ptr)
 
-    @property
+    @FmodProperty("Frequency", c_float)
     def frequency(self):
         """The playback frequency or playback rate.
 
         :type: float
         """
-        freq = c_float()
-        ckresult(_dll.FMOD_Channel_GetFrequency(self._ptr, byref(freq)))
-        return freq.value
-
-    @frequency.setter
-    def frequency(self, freq):
-        ckresult(_dll.FMOD_Channel_SetFrequency(self._ptr, c_float(freq)))
 
-    @property
+    @FmodProperty("Index", c_int, settable=False)
     def index(self):
         """The index of this object in the :py:class:`~pyfmodex.system.System`
         :py:class:`~pyfmodex.channel.Channel` pool.
 
         :type: int
         """
-        idx = c_int()
-        self._call_fmod("FMOD_Channel_GetIndex", byref(idx))
-        return idx.value
 
-    @property
+    @FmodProperty("LoopCount", c_int)
     def loop_count(self):
         """The number of times to loop before stopping.
 
@@ -97,13 +87,6 @@ class Channel(ChannelControl):
 
         :type: int
         """
-        loopcount = c_int()
-        ckresult(_dll.FMOD_Channel_GetLoopCount(self._ptr, byref(loopcount)))
-        return loopcount.value
-
-    @loop_count.setter
-    def loop_count(self, count):
-        ckresult(_dll.FMOD_Channel_SetLoopCount(self._ptr, c_int(count)))
 
     def get_loop_points(self, startunit, endunit):
         """Retrieve the loop start and end points.
@@ -202,7 +185,7 @@ class Channel(ChannelControl):
         """
         ckresult(_dll.FMOD_Channel_SetPosition(self._ptr, pos, unit.value))
 
-    @property
+    @FmodProperty("Priority", c_int)
     def priority(self):
         """The priority used for virtual Channel ordering, where 0 represents
         most important and 256 represents least important.
@@ -214,13 +197,6 @@ class Channel(ChannelControl):
         :py:attr:`~pyfmodex.channel_control.ChannelControl.audibility` value
         will be stolen first.
         """
-        pri = c_int()
-        ckresult(_dll.FMOD_Channel_GetPriority(self._ptr, byref(pri)))
-        return pri.value
-
-    @priority.setter
-    def priority(self, pri):
-        ckresult(_dll.FMOD_Channel_SetPriority(self._ptr, pri))
 
     @property
     def is_virtual(self):
@@ -7,15 +7,16 @@
 # That's not our fault... :-)
 
 from ctypes import *
+from weakref import WeakValueDictionary
 
 from .callback_prototypes import CHANNELCONTROL_CALLBACK
 from .cone_settings import ConeSettings
 from .flags import MODE
-from .fmodobject import FmodObject
+from .fmodobject import FmodObject, FmodProperty, get_function
 from .globalvars import get_class
 from .structobject import Structobject as so
 from .structures import VECTOR
-from .utils import check_type
+from .utils import check_type, ckresult
 
 
 class ChannelControl(FmodObject):
@@ -28,10 +29,55 @@ class ChannelControl(FmodObject):
         super().__init__(ptr)
         self._custom_rolloff_curve = None # To keep the custom rolloff curve alive
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolved FMOD_<class name>_<suffix> functions, by their suffix
+        cls._specific_functions = {}
+        # Live wrappers, by the value of their handle
+        cls._wrappers = WeakValueDictionary()
+
+    @classmethod
+    def _from_handle(cls, ptr):
+        """Get the wrapper of an FMOD handle.
+
+        As long as a wrapper of the handle exists, that one is returned, so
+        that state kept in it, like callback references, is not lost and no
+        new object has to be created.
+
+        :param c_void_p ptr: The handle.
+        """
+        try:
+            return cls._wrappers[ptr.value]
+        except KeyError:
+            wrapper = cls._wrappers[ptr.value] = cls(ptr)
+            return wrapper
+
+    @classmethod
+    def _forget_system(cls, system):
+        """Drop the wrappers of the handles of a system about to be released,
+        and of handles that are no longer valid, as their values may be
+        reused by objects created later.
+
+        :param System system: The system.
+        """
+        get_system_object = get_function("FMOD_%s_GetSystemObject" % cls.__name__)
+        sptr = c_void_p()
+        for key, wrapper in list(cls._wrappers.items()):
+            result = get_system_object(wrapper._ptr, byref(sptr))
+            if result or sptr.value == system._ptr.value:
+                cls._wrappers.pop(key, None)
+
     def _call_specific(self, specific_function_suffix, *args):
-        return self._call_fmod(
-            "FMOD_%s_%s" % (self.__class__.__name__, specific_function_suffix), *args
-        )
+        try:
+            function = self._specific_functions[specific_function_suffix]
+        except KeyError:
+            function = get_function(
+                "FMOD_%s_%s" % (self.__class__.__name__, specific_function_suffix)
+            )
+            self._specific_functions[specific_function_suffix] = function
+        result = function(self._ptr, *args)
+        if result:
+            ckresult(result)
 
     def add_dsp(self, index, dsp):
         """Add a DSP unit to the specified index in the DSP chain.
@@ -85,6 +131,21 @@ class ChannelControl(FmodObject):
         vel = VECTOR.from_list(attrs[1])
         self._call_specific("Set3DAttributes", byref(pos), byref(vel))
 
+    def set_3d_attributes(self, pos, vel):
+        """Set the 3D position and velocity used to apply panning, attenuation
+        and doppler in one call.
+
+        :param pos: Position in 3D space, or None to leave it unchanged.
+        :type pos: list of x, y, z coordinate floats
+        :param vel: Velocity in 3D space, or None to leave it unchanged.
+        :type vel: list of x, y, z coordinate floats
+        """
+        if pos is not None:
+            pos = byref(VECTOR.from_list(pos))
+        if vel is not None:
+            vel = byref(VECTOR.from_list(vel))
+        self._call_specific("Set3DAttributes", pos, vel)
+
     @property
     def position(self):
         """The position in 3D space used to apply panning and attenuation.
@@ -95,7 +156,7 @@ class ChannelControl(FmodObject):
 
     @position.setter
     def position(self, pos):
-        self._threed_attrs = (pos, self._threed_attrs[1])
+        self.set_3d_attributes(pos, None)
 
     @property
     def velocity(self):
@@ -107,7 +168,7 @@ class ChannelControl(FmodObject):
 
     @velocity.setter
     def velocity(self, vel):
-        self._threed_attrs = (self._threed_attrs[0], vel)
+        self.set_3d_attributes(None, vel)
 
     @property
     def cone_orientation(self):
@@ -201,22 +262,15 @@ class ChannelControl(FmodObject):
             c_float(cfg.center_frequency),
         )
 
-    @property
+    @FmodProperty("3DDopplerLevel", c_float)
     def doppler_level(self):
         """The amount by which doppler is scaled.
 
         :type: Doppler scale (float) where 0 represents no doppler, 1
             represents natural doppler and 5 represents exaggerated doppler.
         """
-        level = c_float()
-        self._call_specific("Get3DDopplerLevel", byref(level))
-        return level.value
-
-    @doppler_level.setter
-    def doppler_level(self, level):
-        self._call_specific("Set3DDopplerLevel", c_float(level))
 
-    @property
+    @FmodProperty("3DLevel", c_float)
     def level(self):
         """The blend between 3D panning and 2D panning.
 
@@ -227,13 +281,6 @@ class ChannelControl(FmodObject):
         :type: 3D pan level (float) where 0 represents panning/attenuating
             solely with 2D panning functions and 1 represents solely 3D.
         """
-        level = c_float()
-        self._call_specific("Get3DLevel", byref(level))
-        return level.value
-
-    @level.setter
-    def level(self, level):
-        self._call_specific("Set3DLevel", c_float(level))
 
     @property
     def _min_max_distance(self):
@@ -349,7 +396,7 @@ class ChannelControl(FmodObject):
     def reverb_occlusion(self, occ):
         self._occlusion = (self._occlusion[0], occ)
 
-    @property
+    @FmodProperty("3DSpread", c_float)
     def threed_spread(self):
         """The spread of a 3D sound in speaker space.
 
@@ -357,20 +404,8 @@ class ChannelControl(FmodObject):
 
         :type: float
         """
-        spread = c_float()
-        self._call_specific("Get3DSpread", byref(spread))
-        return spread.value
 
-    @threed_spread.setter
-    def threed_spread(self, spread):
-        """The spread of a 3D sound in speaker space.
-
-        :param float angle: Angle over which the sound is spread. Between 0 and
-            360.
-        """
-        self._call_specific("Set3DSpread", c_float(spread))
-
-    @property
+    @FmodProperty("Audibility", c_float, settable=False)
     def audibility(self):
         """An estimation of the output volume.
 
@@ -387,9 +422,6 @@ class ChannelControl(FmodObject):
         :returns: Estimated audibility.
         :rtype: float
         """
-        aud = c_float()
-        self._call_specific("GetAudibility", byref(aud))
-        return aud.value
 
     def get_dsp(self, index):
         """The DSP unit at the specified index in the DSP chain.
@@ -515,7 +547,7 @@ class ChannelControl(FmodObject):
         self._call_specific("GetFadePoints", byref(num), clocks, volumes)
         return list(clocks), list(volumes)
 
-    @property
+    @FmodProperty("LowPassGain", c_float)
     def low_pass_gain(self):
         """The gain of the dry signal when built in lowpass / distance
         filtering is applied.
@@ -529,13 +561,6 @@ class ChannelControl(FmodObject):
 
         :type: float
         """
-        gain = c_float()
-        self._call_specific("GetLowPassGain", byref(gain))
-        return gain.value
-
-    @low_pass_gain.setter
-    def low_pass_gain(self, gain):
-        self._call_specific("SetLowPassGain", c_float(gain))
 
     def get_mix_matrix(self, hop=0):
         """Retrieve a 2 dimensional pan matrix that maps the signal from input
@@ -636,7 +661,7 @@ class ChannelControl(FmodObject):
     def mode(self, mode):
         self._call_specific("SetMode", mode.value)
 
-    @property
+    @FmodProperty("Mute", c_bool)
     def mute(self):
         """The mute state.
 
@@ -656,25 +681,15 @@ class ChannelControl(FmodObject):
 
         :type: bool
         """
-        mute = c_bool()
-        self._call_specific("GetMute", byref(mute))
-        return mute.value
 
-    @mute.setter
-    def mute(self, m):
-        self._call_specific("SetMute", m)
-
-    @property
+    @FmodProperty("NumDSPs", c_int, settable=False)
     def num_dsps(self):
         """The number of DSP units in the DSP chain.
 
         :type: int
         """
-        num = c_int()
-        self._call_specific("GetNumDSPs", byref(num))
-        return num.value
 
-    @property
+    @FmodProperty("Paused", c_bool)
     def paused(self):
         """The paused state.
 
@@ -688,15 +703,8 @@ class ChannelControl(FmodObject):
 
         :type: bool
         """
-        paused = c_bool()
-        self._call_specific("GetPaused", byref(paused))
-        return paused.value
-
-    @paused.setter
-    def paused(self, pausedstate):
-        self._call_specific("SetPaused", pausedstate)
 
-    @property
+    @FmodProperty("Pitch", c_float)
     def pitch(self):
         """The relative pitch / playback rate.
 
@@ -711,13 +719,6 @@ class ChannelControl(FmodObject):
 
         :type: float
         """
-        val = c_float()
-        self._call_specific("GetPitch", byref(val))
-        return val.value
-
-    @pitch.setter
-    def pitch(self, val):
-        self._call_specific("SetPitch", c_float(val))
 
     def get_reverb_wet(self, instance):
         """Get the wet / send level for a particular reverb instance.
@@ -768,7 +769,7 @@ class ChannelControl(FmodObject):
         self._call_specific("GetSystemObject", byref(sptr))
         return get_class("System")(sptr)
 
-    @property
+    @FmodProperty("Volume", c_float)
     def volume(self):
         """The volume level.
 
@@ -782,15 +783,8 @@ class ChannelControl(FmodObject):
 
         :type: float
         """
-        vol = c_float()
-        self._call_specific("GetVolume", byref(vol))
-        return vol.value
-
-    @volume.setter
-    def volume(self, vol):
-        self._call_specific("SetVolume", c_float(vol))
 
-    @property
+    @FmodProperty("VolumeRamp", c_bool)
     def volume_ramp(self):
         """Ramp state: whether volume changes are ramped or instantaneous.
 
@@ -803,13 +797,6 @@ class ChannelControl(FmodObject):
 
         :type: bool
         """
-        ramp = c_bool()
-        self._call_specific("GetVolumeRamp", byref(ramp))
-        return ramp.value
-
-    @volume_ramp.setter
-    def volume_ramp(self, ramp):
-        self._call_specific("SetVolumeRamp", ramp)
 
     @property
     def is_playing(self):
@@ -858,7 +845,7 @@ class ChannelControl(FmodObject):
         :param CHANNELCONTROL_CALLBACK callback: Callback to invoke.
         """
         cbi = CHANNELCONTROL_CALLBACK(callback)
-        self._cb = callback
+        self._cb = cbi
         self._call_specific("SetCallback", cbi)
 
     def set_fade_point_ramp(self, dsp_clock, volume):
@@ -47,7 +47,7 @@ class ChannelGroup(ChannelControl):
         """
         c_ptr = c_void_p()
         self._call_fmod("FMOD_ChannelGroup_GetChannel", idx, byref(c_ptr))
-        return get_class("Channel")(c_ptr)
+        return get_class("Channel")._from_handle(c_ptr)
 
     def get_group(self, idx):
         """Retrieve the ChannelGroup at the specified index in the list of
@@ -59,7 +59,7 @@ class ChannelGroup(ChannelControl):
         """
         grp_ptr = c_void_p()
         ckresult(_dll.FMOD_ChannelGroup_GetGroup(self._ptr, idx, byref(grp_ptr)))
-        return ChannelGroup(grp_ptr)
+        return ChannelGroup._from_handle(grp_ptr)
 
     @property
     def name(self):
@@ -99,7 +99,7 @@ class ChannelGroup(ChannelControl):
         """
         grp_ptr = c_void_p()
         self._call_fmod("FMOD_ChannelGroup_GetParentGroup", byref(grp_ptr))
-        return ChannelGroup(grp_ptr) if grp_ptr.value else None
+        return ChannelGroup._from_handle(grp_ptr) if grp_ptr.value else None
 
     def release(self):
         """Free the memory for the group.
@@ -110,3 +110,5 @@ class ChannelGroup(ChannelControl):
         :py:class:`~pyfmodex.channel_group.ChannelGroup`.
         """
         self._call_fmod("FMOD_ChannelGroup_Release")
+        # The handle may be reused by a group created later.
+        self._wrappers.pop(self._ptr.value, None)
@@ -1,7 +1,7 @@
 """3D cone shape settings."""
 from ctypes import byref, c_float
 
-from .fmodobject import _dll
+from .fmodobject import get_function
 from .utils import ckresult
 
 
@@ -45,10 +45,10 @@ class ConeSettings:
         self._in = c_float()
         self._out = c_float()
         self._outvol = c_float()
-        self._get_func = "FMOD_%s_Get3DConeSettings" % class_name
-        self._set_func = "FMOD_%s_Set3DConeSettings" % class_name
+        self._get_func = get_function("FMOD_%s_Get3DConeSettings" % class_name)
+        self._set_func = get_function("FMOD_%s_Set3DConeSettings" % class_name)
         ckresult(
-            getattr(_dll, self._get_func)(
+            self._get_func(
                 self._sptr, byref(self._in), byref(self._out), byref(self._outvol)
             )
         )
@@ -103,5 +103,5 @@ class ConeSettings:
     def _commit(self):
         """Apply a changed code setting."""
         ckresult(
-            getattr(_dll, self._set_func)(self._sptr, self._in, self._out, self._outvol)
+            self._set_func(self._sptr, self._in, self._out, self._outvol)
         )
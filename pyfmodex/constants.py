@@ -27,6 +27,10 @@ MAX_CHANNEL_WIDTH = 32
 #: Maximum number of listeners supported.
 MAX_LISTENERS = 8
 
+#: Version of the plugin SDK, to be set as
+#: :py:class:`~pyfmodex.structures.DSP_DESCRIPTION` pluginsdkversion.
+PLUGIN_SDK_VERSION = 110
+
 #: PORT_INDEX is an output type specific index for when there are multiple
 #: instances of a port type.
 #:
@@ -0,0 +1,86 @@
+"""Offline decoding of sounds to PCM data in chunks of bounded size."""
+
+from .enums import TIMEUNIT
+from .flags import MODE
+from .sound import _PCM_VIEW_FORMATS
+
+
+def iter_sound_pcm(sound, chunk_frames=4096, as_numpy=False):
+    """Decode an opened sound chunk by chunk.
+
+    The sound should be opened with :py:attr:`~pyfmodex.flags.MODE.OPENONLY`
+    (see :py:meth:`~pyfmodex.sound.Sound.read_data`). Decoding starts at the
+    beginning of the sound and ends after its length in PCM samples, which
+    keeps subsounds of container formats from reading on into the next
+    subsound.
+
+    All chunks are decoded into the same buffer, so memory use does not depend
+    on the length of the sound. This also means that a chunk is only valid
+    until the next one is requested; copy it if it has to be kept.
+
+    For 8, 16 and 32 bit integer and floating point PCM data, the chunks are
+    two dimensional, one row of samples per frame and one column per channel.
+    For other formats, like 24 bit PCM, the chunks are flat arrays of bytes.
+
+    :param Sound sound: The sound to decode.
+    :param int chunk_frames: Maximum number of frames (samples per channel)
+        in a chunk.
+    :param bool as_numpy: Yield NumPy arrays instead of memoryviews. Requires
+        NumPy to be installed.
+    :returns: Generator of chunks of PCM data.
+    :rtype: generator of memoryviews or NumPy arrays
+    :raises ValueError: when the sound does not decode to PCM data.
+    """
+    sound_format = sound.format
+    frame_size = sound_format.channels * sound_format.bits // 8
+    if not frame_size:
+        raise ValueError("Sound does not decode to PCM data: %s" % sound_format.format)
+    view_format = _PCM_VIEW_FORMATS.get(sound_format.format)
+    if as_numpy:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        dtype = numpy.dtype(view_format or "B")
+    remaining = sound.get_length(TIMEUNIT.PCM)
+    buffer = bytearray(chunk_frames * frame_size)
+    whole = memoryview(buffer)
+    sound.seek_data(0)
+    while remaining:
+        if remaining < chunk_frames:
+            frames = sound.read_into(whole[: remaining * frame_size]) // frame_size
+        else:
+            frames = sound.read_into(buffer) // frame_size
+        if not frames:
+            break
+        remaining -= frames
+        chunk = whole[: frames * frame_size]
+        if view_format:
+            chunk = chunk.cast(view_format, (frames, sound_format.channels))
+        if as_numpy:
+            chunk = numpy.frombuffer(chunk, dtype=dtype).reshape(chunk.shape)
+        yield chunk
+
+
+def iter_pcm(system, path, chunk_frames=4096, as_numpy=False, subsound=0):
+    """Open a sound file and decode it chunk by chunk.
+
+    This is a convenience function opening the file with
+    :py:attr:`~pyfmodex.flags.MODE.OPENONLY`, decoding it with
+    :py:func:`iter_sound_pcm` and releasing the sound again once the
+    generator is exhausted or closed.
+
+    :param System system: System to open the sound with.
+    :param str path: Path of the file to decode.
+    :param int chunk_frames: Maximum number of frames (samples per channel)
+        in a chunk.
+    :param bool as_numpy: Yield NumPy arrays instead of memoryviews.
+    :param int subsound: Index of the subsound to decode if the file is a
+        container format like FSB.
+    :returns: Generator of chunks of PCM data, see :py:func:`iter_sound_pcm`.
+    :rtype: generator of memoryviews or NumPy arrays
+    """
+    sound = system.create_sound(path, MODE.OPENONLY)
+    try:
+        source = sound.get_subsound(subsound) if sound.num_subsounds else sound
+        yield from iter_sound_pcm(source, chunk_frames, as_numpy)
+    finally:
+        sound.release()
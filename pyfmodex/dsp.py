@@ -3,7 +3,7 @@ from ctypes import *
 
 from .enums import DSP_TYPE, SPEAKERMODE
 from .flags import CHANNELMASK
-from .fmodobject import FmodObject
+from .fmodobject import FmodObject, FmodProperty
 from .globalvars import get_class
 from .structobject import Structobject as so
 from .structures import DSP_METERING_INFO, DSP_PARAMETER_DESC
@@ -83,7 +83,7 @@ class DSP(FmodObject):
             connection_ptr = connection._ptr
         self._call_fmod("FMOD_DSP_DisconnectFrom", dsp_ptr, connection_ptr)
 
-    @property
+    @FmodProperty("Active", c_bool)
     def active(self):
         """The processing active state.
 
@@ -96,15 +96,8 @@ class DSP(FmodObject):
 
         :type: bool
         """
-        active_state = c_bool()
-        self._call_fmod("FMOD_DSP_GetActive", byref(active_state))
-        return active_state.value
-
-    @active.setter
-    def active(self, active_state):
-        self._call_fmod("FMOD_DSP_SetActive", active_state)
 
-    @property
+    @FmodProperty("Bypass", c_bool)
     def bypass(self):
         """The processing bypass state.
 
@@ -113,13 +106,6 @@ class DSP(FmodObject):
 
         :type: bool
         """
-        bypass = c_bool()
-        self._call_fmod("FMOD_DSP_GetBypass", byref(bypass))
-        return bypass.value
-
-    @bypass.setter
-    def bypass(self, bypass):
-        self._call_fmod("FMOD_DSP_SetBypass", bypass)
 
     @property
     def channel_format(self):
@@ -177,7 +163,7 @@ class DSP(FmodObject):
         self._call_fmod("FMOD_DSP_GetDataParameterIndex", data_type, byref(index))
         return index.value
 
-    @property
+    @FmodProperty("Idle", c_bool, settable=False)
     def idle(self):
         """The idle state.
 
@@ -191,9 +177,6 @@ class DSP(FmodObject):
 
         :type: bool
         """
-        res = c_bool()
-        self._call_fmod("FMOD_DSP_GetIdle", byref(res))
-        return res.value
 
     @property
     def info(self):
@@ -346,7 +329,7 @@ class DSP(FmodObject):
         )
         return input_info, output_info
 
-    @property
+    @FmodProperty("NumInputs", c_int, settable=False)
     def num_inputs(self):
         """The number of DSP units in the input list.
 
@@ -356,11 +339,8 @@ class DSP(FmodObject):
 
         :type: int
         """
-        num = c_int()
-        self._call_fmod("FMOD_DSP_GetNumInputs", byref(num))
-        return num.value
 
-    @property
+    @FmodProperty("NumOutputs", c_int, settable=False)
     def num_outputs(self):
         """The number of DSP units in the output list.
 
@@ -370,11 +350,8 @@ class DSP(FmodObject):
 
         :type: int
         """
-        num = c_int()
-        self._call_fmod("FMOD_DSP_GetNumOutputs", byref(num))
-        return num.value
 
-    @property
+    @FmodProperty("NumParameters", c_int, settable=False)
     def num_parameters(self):
         """The number of parameters exposed by this unit.
 
@@ -383,9 +360,6 @@ class DSP(FmodObject):
 
         :type: int
         """
-        num = c_int()
-        self._call_fmod("FMOD_DSP_GetNumParameters", byref(num))
-        return num.value
 
     def get_output(self, index):
         """Retrieve the DSP unit at the specified index in the output list.
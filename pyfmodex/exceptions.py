@@ -14,3 +14,6 @@ class FmodError(Exception):
 
     def __str__(self):
         return self.message
+
+    def __reduce__(self):
+        return self.__class__, (self.result,)
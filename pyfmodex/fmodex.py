@@ -10,15 +10,15 @@ Raises a RuntimeError when that fails.
 # Not our fault... :-)
 
 import os
-import platform
 import sys
 from ctypes import CDLL, c_int, byref
 
+# The platform module is not used for the checks below, as importing it and
+# determining the architecture with it is slow.
 if os.environ.get("PYFMODEX_DLL_PATH") is not None:
     _dll = CDLL(os.environ.get("PYFMODEX_DLL_PATH"))
 else:
-    arch = platform.architecture()[0]
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
         from ctypes import windll
 
         try:
@@ -30,17 +30,16 @@ else:
             except:
                 raise RuntimeError("Pyfmodex could not find the fmod library") from exc
 
-    elif platform.system() == "Linux":
+    elif sys.platform.startswith("linux"):
         _dll = CDLL("libfmod.so")
 
-    elif platform.system() == "Darwin":
-        if arch == "32bit":
+    elif sys.platform == "darwin":
+        if sys.maxsize <= 2**32:
             raise RuntimeError("No 32-bit fmod library for Mac Os exists")
         _dll = CDLL("libfmod.dylib")
 from . import globalvars
 
 globalvars.DLL = _dll
-from .callback_prototypes import DEBUG_CALLBACK
 from .structobject import Structobject as so
 from .utils import ckresult
 
@@ -188,6 +187,8 @@ def initialize_debugging(flags, mode, callback, filename):
     :param str filename: Filename to use when mode is set to file, only
         required when using that mode.
     """
+    from .callback_prototypes import DEBUG_CALLBACK  # pylint: disable=import-outside-toplevel
+
     ckresult(
         _dll.FMOD_Debug_Initialize(flags, mode, DEBUG_CALLBACK(callback), filename)
     )
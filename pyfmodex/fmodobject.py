@@ -1,8 +1,136 @@
 """A base FMOD object."""
 
+import threading
+from ctypes import byref, c_bool, c_int
+
 from .globalvars import DLL as _dll
 from .utils import ckresult
 
+# Functions of the C library which were already resolved, by their name.
+_functions = {}
+
+
+def get_function(funcname):
+    """Get a function of the FMOD C library by its name.
+
+    The symbol is looked up in the library only once, subsequent calls return
+    the already resolved function object with its result type set to the
+    FMOD_RESULT integer.
+
+    :param str funcname: Name of the C function, for example
+        FMOD_Channel_GetVolume.
+    :rtype: ctypes function pointer
+    """
+    try:
+        return _functions[funcname]
+    except KeyError:
+        function = getattr(_dll, funcname)
+        function.restype = c_int
+        _functions[funcname] = function
+        return function
+
+
+class FmodProperty:
+    """A property getting and setting a single value with the
+    FMOD_<Class>_Get<Name> and FMOD_<Class>_Set<Name> functions of the C
+    library.
+
+    Used to decorate a method which only provides the docstring::
+
+        @FmodProperty("Volume", c_float)
+        def volume(self):
+            "Documentation of the property."
+
+    The class name in the function names is the one of the first pyfmodex
+    class in the method resolution order of the instance, so properties
+    defined in :py:class:`~pyfmodex.channel_control.ChannelControl` call the
+    Channel or ChannelGroup functions as appropriate.
+
+    On first access from a class, the functions are resolved with
+    :py:func:`get_function` and a plain property specialized for them is set
+    on that class, so later accesses do not go through this descriptor.
+
+    Values are retrieved into storage reused by all later accesses from the
+    same thread. It is not shared between threads, as ctypes releases the GIL
+    while the C function runs.
+    """
+
+    def __init__(self, name, ctype, settable=True):
+        """Constructor.
+
+        :param str name: Name of the property in the C library functions, for
+            example Volume.
+        :param ctype: ctypes type of the value.
+        :param bool settable: Whether there is a Set<Name> function.
+        """
+        self._name = name
+        self._ctype = ctype
+        self._settable = settable
+        self._attribute = None
+        self.__doc__ = None
+
+    def __call__(self, method):
+        self.__doc__ = method.__doc__
+        return self
+
+    def __set_name__(self, owner, name):
+        self._attribute = name
+
+    def _specialize(self, cls):
+        """Set a property calling the functions of a class on it."""
+        for klass in cls.__mro__:
+            if klass.__module__.partition(".")[0] == __package__:
+                break
+        prefix = "FMOD_%s_" % klass.__name__
+        getter = get_function(prefix + "Get" + self._name)
+        ctype = self._ctype
+        storage = threading.local()
+
+        def fget(obj):
+            try:
+                value, ref = storage.value
+            except AttributeError:
+                value = ctype()
+                ref = byref(value)
+                storage.value = value, ref
+            result = getter(obj._ptr, ref)
+            if result:
+                ckresult(result)
+            return value.value
+
+        fset = None
+        if self._settable:
+            setter = get_function(prefix + "Set" + self._name)
+            # ctypes passes Python ints (and bools) as C ints by itself, which
+            # is also what FMOD_BOOL is, so only other types are wrapped.
+            if ctype in (c_int, c_bool):
+
+                def fset(obj, value):
+                    result = setter(obj._ptr, value)
+                    if result:
+                        ckresult(result)
+
+            else:
+
+                def fset(obj, value):
+                    result = setter(obj._ptr, ctype(value))
+                    if result:
+                        ckresult(result)
+
+        prop = property(fget, fset, doc=self.__doc__)
+        setattr(cls, self._attribute, prop)
+        return prop
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self._specialize(obj.__class__).__get__(obj)
+
+    def __set__(self, obj, value):
+        if not self._settable:
+            raise AttributeError("can't set attribute")
+        self._specialize(obj.__class__).__set__(obj, value)
+
 
 class FmodObject(object):
     """A base FMOD object.
@@ -19,8 +147,13 @@ class FmodObject(object):
         self._cb = None
 
     def _call_fmod(self, funcname, *args):
-        result = getattr(_dll, funcname)(self._ptr, *args)
-        ckresult(result)
+        try:
+            function = _functions[funcname]
+        except KeyError:
+            function = get_function(funcname)
+        result = function(self._ptr, *args)
+        if result:
+            ckresult(result)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -1,5 +1,8 @@
 """Geometry related classes."""
+from array import array
 from ctypes import *
+from itertools import compress
+from operator import ne
 
 from .fmodobject import FmodObject
 from .globalvars import DLL as _dll
@@ -142,9 +145,216 @@ class PolygonAttributes:
         )
 
 
+class PolygonArrays:
+    """The attributes and vertices of a range of polygons, copied into
+    contiguous arrays for editing in bulk.
+
+    The arrays can be changed in place, element by element or through their
+    buffers, for example with NumPy arrays made with ``numpy.frombuffer``.
+    :py:meth:`commit` compares them with the state last read from or written
+    to FMOD and only passes the polygons and vertices that changed.
+
+    - direct_occlusion, reverb_occlusion: array.array of type "f" with an
+      occlusion factor per polygon.
+    - double_sided: array.array of type "B" with 1 for every double sided
+      polygon and 0 for every single sided one.
+    - vertices: array.array of type "f" with three coordinates per vertex, the
+      vertices of all polygons one after the other.
+    - vertex_offsets: array.array of type "i" with the index in
+      :py:attr:`vertices` of the first vertex of every polygon, followed by
+      the total number of vertices. Polygons cannot change their number of
+      vertices.
+    """
+
+    def __init__(self, geometry, start, stop):
+        self._ptr = geometry._ptr
+        self.indices = range(start, stop)
+        self.refresh()
+
+    def __len__(self):
+        return len(self.indices)
+
+    def refresh(self):
+        """Read the polygons from FMOD again, discarding uncommitted
+        changes.
+        """
+        ptr = self._ptr
+        get_attributes = _dll.FMOD_Geometry_GetPolygonAttributes
+        get_num_vertices = _dll.FMOD_Geometry_GetPolygonNumVertices
+        get_vertex = _dll.FMOD_Geometry_GetPolygonVertex
+        direct = c_float()
+        reverb = c_float()
+        double = c_bool()
+        num = c_int()
+        direct_ref, reverb_ref, double_ref = byref(direct), byref(reverb), byref(double)
+        num_ref = byref(num)
+        self.direct_occlusion = array("f", bytes(4 * len(self)))
+        self.reverb_occlusion = array("f", bytes(4 * len(self)))
+        self.double_sided = array("B", bytes(len(self)))
+        offsets = array("i", [0])
+        for polygon, index in enumerate(self.indices):
+            ckresult(get_attributes(ptr, index, direct_ref, reverb_ref, double_ref))
+            ckresult(get_num_vertices(ptr, index, num_ref))
+            self.direct_occlusion[polygon] = direct.value
+            self.reverb_occlusion[polygon] = reverb.value
+            self.double_sided[polygon] = double.value
+            offsets.append(offsets[-1] + num.value)
+        self.vertex_offsets = offsets
+
+        varray = (VECTOR * offsets[-1])()
+        # Polygon and index in the polygon, by vertex
+        owners = []
+        for polygon, index in enumerate(self.indices):
+            first = offsets[polygon]
+            for vertex in range(offsets[polygon + 1] - first):
+                owners.append((index, vertex))
+                ckresult(
+                    get_vertex(
+                        ptr, index, vertex, byref(varray, (first + vertex) * sizeof(VECTOR))
+                    )
+                )
+        self._owners = owners
+        self.vertices = array("f", bytes(varray))
+        self._snapshot()
+
+    def _snapshot(self):
+        self._committed = (
+            array("f", self.direct_occlusion),
+            array("f", self.reverb_occlusion),
+            array("B", self.double_sided),
+            array("f", self.vertices),
+        )
+
+    def _check_sizes(self):
+        for name, size in (
+            ("direct_occlusion", len(self)),
+            ("reverb_occlusion", len(self)),
+            ("double_sided", len(self)),
+            ("vertices", 3 * self.vertex_offsets[-1]),
+        ):
+            if len(getattr(self, name)) != size:
+                raise ValueError("%s must have %d items" % (name, size))
+
+    @property
+    def dirty(self):
+        """Indices of the polygons changed since they were last read or
+        committed.
+
+        :rtype: list of int
+        """
+        self._check_sizes()
+        return sorted(self._changed_attributes() | self._changed_vertices().keys())
+
+    def _changed_attributes(self):
+        """Indices of the polygons with changed attributes."""
+        direct, reverb, double, _ = self._committed
+        changed = set()
+        for current, committed in (
+            (self.direct_occlusion, direct),
+            (self.reverb_occlusion, reverb),
+            (self.double_sided, double),
+        ):
+            if current != committed:
+                changed.update(compress(range(len(current)), map(ne, current, committed)))
+        start = self.indices.start
+        return {start + polygon for polygon in changed}
+
+    def _changed_vertices(self):
+        """Changed vertices as lists of indices in the polygon, by polygon
+        index.
+        """
+        vertices = self.vertices
+        committed = self._committed[3]
+        changed = {}
+        if vertices == committed:
+            return changed
+        owners = self._owners
+        # Narrow down to the changed floats a block at a time, edits usually
+        # touch few and neighbouring polygons
+        block = 3 * 256
+        for start in range(0, len(vertices), block):
+            stop = start + block
+            if vertices[start:stop] == committed[start:stop]:
+                continue
+            last = None
+            for offset in compress(
+                range(start, stop), map(ne, vertices[start:stop], committed[start:stop])
+            ):
+                vertex = offset // 3
+                if vertex != last:
+                    last = vertex
+                    index, local = owners[vertex]
+                    changed.setdefault(index, []).append(local)
+        return changed
+
+    def commit(self):
+        """Pass the changed polygons to FMOD.
+
+        :returns: Number of polygons changed.
+        :rtype: int
+        :raises ValueError: when an array has been replaced by one of another
+            length.
+        """
+        self._check_sizes()
+        attributes = self._changed_attributes()
+        vertices = self._changed_vertices()
+        ptr = self._ptr
+        set_attributes = _dll.FMOD_Geometry_SetPolygonAttributes
+        set_vertex = _dll.FMOD_Geometry_SetPolygonVertex
+        start = self.indices.start
+        for index in attributes:
+            polygon = index - start
+            ckresult(
+                set_attributes(
+                    ptr,
+                    index,
+                    c_float(self.direct_occlusion[polygon]),
+                    c_float(self.reverb_occlusion[polygon]),
+                    c_bool(self.double_sided[polygon]),
+                )
+            )
+        position = VECTOR()
+        position_ref = byref(position)
+        offsets = self.vertex_offsets
+        for index, changed in vertices.items():
+            first = offsets[index - start]
+            for local in changed:
+                offset = 3 * (first + local)
+                position.x, position.y, position.z = self.vertices[offset : offset + 3]
+                ckresult(set_vertex(ptr, index, local, position_ref))
+        self._snapshot()
+        return len(attributes | vertices.keys())
+
+
 class Geometry(FmodObject):
     """Geometry methods."""
 
+    def __init__(self, ptr):
+        super().__init__(ptr)
+        # Number of vertices taken up by the polygons, None until needed
+        self._used_vertices = None
+
+    @property
+    def _num_used_vertices(self):
+        """The number of vertices taken up by the polygons of this object.
+
+        Counted once for objects which already have polygons when the wrapper
+        is created, then kept up to date by :py:meth:`add_polygon` and
+        :py:meth:`add_mesh`.
+
+        :type: int
+        """
+        if self._used_vertices is None:
+            num = c_int()
+            used = 0
+            for index in range(self.num_polygons):
+                ckresult(
+                    _dll.FMOD_Geometry_GetPolygonNumVertices(self._ptr, index, byref(num))
+                )
+                used += num.value
+            self._used_vertices = used
+        return self._used_vertices
+
     def add_polygon(self, directocclusion, reverbocclusion, doublesided, *vertices):
         """Add a polygon.
 
@@ -191,8 +401,114 @@ class Geometry(FmodObject):
             varray,
             byref(idx),
         )
+        if self._used_vertices is not None:
+            self._used_vertices += len(vertices)
         return idx.value
 
+    def add_mesh(
+        self,
+        vertices,
+        indices,
+        directocclusion,
+        reverbocclusion,
+        doublesided,
+        vertices_per_polygon=3,
+    ):
+        """Add the polygons of a mesh given as flat arrays.
+
+        The polygons share the same occlusion factors and sidedness, see
+        :py:meth:`add_polygon` for their meaning and for the requirements on
+        the polygons. All vertices of the mesh are gathered into a single
+        array, which is then passed to FMOD polygon by polygon without further
+        conversions.
+
+        :param vertices: Vertex positions in object space, three 32 bit floats
+            per vertex, as a contiguous object supporting the buffer protocol
+            like an array.array of type "f" or a float32 NumPy array of
+            shape (n, 3).
+        :param indices: Vertex indices, `vertices_per_polygon` consecutive
+            ones per polygon, as a contiguous object supporting the buffer
+            protocol with 32 bit integer items, like an array.array of type
+            "i" or an int32 NumPy array. None to use the vertices in order.
+        :param float directocclusion: Occlusion factor of the polygons for the
+            direct path.
+        :param float reverbocclusion: Occlusion factor of the polygons for the
+            reverb path.
+        :param bool doublesided: Double sidedness of the polygons.
+        :param int vertices_per_polygon: Number of vertices of each polygon.
+        :returns: Indices of the added polygons.
+        :rtype: range
+        :raises ValueError: when the arrays have the wrong type or size, an
+            index is out of range or the mesh does not fit in the limits of
+            this object.
+        """
+        vertex_view = memoryview(vertices)
+        if vertex_view.format.lstrip("<=@") != "f":
+            raise ValueError("Vertices must be 32 bit floats")
+        vertex_data = vertex_view.cast("B")
+        if len(vertex_data) % sizeof(VECTOR):
+            raise ValueError("Vertex data does not consist of three floats per vertex")
+        num_vertices = len(vertex_data) // sizeof(VECTOR)
+        if indices is None:
+            index_list = None
+            count = num_vertices
+        else:
+            index_view = memoryview(indices)
+            index_format = index_view.format.lstrip("<=@")
+            if index_view.itemsize != 4 or index_format not in ("i", "I", "l"):
+                raise ValueError("Indices must be 32 bit integers")
+            index_list = index_view.cast("B").cast("i").tolist()
+            count = len(index_list)
+            if count and not 0 <= min(index_list) <= max(index_list) < num_vertices:
+                raise ValueError("Vertex index out of range")
+        if count % vertices_per_polygon:
+            raise ValueError(
+                "Number of vertices is not a multiple of %d" % vertices_per_polygon
+            )
+        num_polygons = count // vertices_per_polygon
+        max_polygons, max_vertices = self._creation_limits
+        first = self.num_polygons
+        used = self._num_used_vertices
+        if first + num_polygons > max_polygons or used + count > max_vertices:
+            raise ValueError(
+                "Mesh of %d polygons and %d vertices exceeds the limits of %d "
+                "polygons and %d vertices" % (num_polygons, count, max_polygons, max_vertices)
+            )
+
+        if index_list is None:
+            gathered = vertex_data
+        else:
+            raw = vertex_data.tobytes()
+            size = sizeof(VECTOR)
+            points = [raw[offset : offset + size] for offset in range(0, len(raw), size)]
+            gathered = b"".join(map(points.__getitem__, index_list))
+        varray = (VECTOR * count).from_buffer_copy(gathered)
+
+        add = _dll.FMOD_Geometry_AddPolygon
+        ptr = self._ptr
+        direct = c_float(directocclusion)
+        reverb = c_float(reverbocclusion)
+        double = c_bool(doublesided)
+        stride = vertices_per_polygon * sizeof(VECTOR)
+        idx = c_int()
+        idx_ref = byref(idx)
+        for offset in range(0, num_polygons * stride, stride):
+            result = add(
+                ptr,
+                direct,
+                reverb,
+                double,
+                vertices_per_polygon,
+                byref(varray, offset),
+                idx_ref,
+            )
+            if result:
+                # Count again when needed, some polygons were added
+                self._used_vertices = None
+                ckresult(result)
+        self._used_vertices = used + count
+        return range(first, first + num_polygons)
+
     @property
     def active(self):
         """Whether an object is processed by the geometry engine.
@@ -255,6 +571,19 @@ class Geometry(FmodObject):
         """
         return PolygonAttributes(self._ptr, index)
 
+    def get_polygons(self, start=0, stop=None):
+        """The attributes and vertices of a range of polygons, for reading
+        and changing them in bulk.
+
+        :param int start: Index of the first polygon.
+        :param int stop: Index after the last polygon, defaults to the number
+            of polygons.
+        :rtype: PolygonArrays
+        """
+        if stop is None:
+            stop = self.num_polygons
+        return PolygonArrays(self, start, stop)
+
     @property
     def position(self):
         """The 3D position of the object.
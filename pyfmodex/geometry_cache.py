@@ -0,0 +1,225 @@
+"""On disk cache of serialized geometry."""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+from .exceptions import FmodError
+
+
+class GeometryCache:
+    """A directory of serialized geometry objects, keyed by a hash of the
+    mesh data and parameters they were built from.
+
+    :py:meth:`get` builds a geometry object from a mesh with
+    :py:meth:`~pyfmodex.geometry.Geometry.add_mesh` only the first time the
+    mesh is requested, storing the result of
+    :py:meth:`~pyfmodex.geometry.Geometry.save`. Later requests, also from
+    later runs, memory map the stored data and hand it to
+    :py:meth:`~pyfmodex.system.System.load_geometry`.
+
+    Once the files in the directory take up more than the size limit, the
+    least recently used ones are deleted. Requests are counted in
+    :py:attr:`hits` and :py:attr:`misses`, deleted files in
+    :py:attr:`evictions`.
+    """
+
+    suffix = ".geo"
+
+    def __init__(self, system, directory, max_size=256 * 1024 * 1024):
+        """Constructor.
+
+        :param System system: System to create the geometry objects with.
+        :param str directory: Directory to store the serialized geometry in,
+            created if missing.
+        :param int max_size: Number of bytes the stored files may take up.
+        """
+        self.system = system
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        # File sizes by file name
+        self._files = {
+            entry.name: entry.stat().st_size
+            for entry in os.scandir(directory)
+            if entry.name.endswith(self.suffix) and entry.is_file()
+        }
+
+    @property
+    def size(self):
+        """Number of bytes taken up by the stored files.
+
+        :type: int
+        """
+        return sum(self._files.values())
+
+    def __len__(self):
+        return len(self._files)
+
+    @staticmethod
+    def key(
+        vertices,
+        indices,
+        directocclusion,
+        reverbocclusion,
+        doublesided,
+        vertices_per_polygon=3,
+        max_polygons=None,
+        max_vertices=None,
+    ):
+        """The key identifying a mesh, see :py:meth:`get` for the
+        parameters.
+
+        :rtype: str
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(
+            struct.pack(
+                "<ffBiqq",
+                directocclusion,
+                reverbocclusion,
+                bool(doublesided),
+                vertices_per_polygon,
+                -1 if max_polygons is None else max_polygons,
+                -1 if max_vertices is None else max_vertices,
+            )
+        )
+        with memoryview(vertices) as view:
+            digest.update(struct.pack("<q", view.nbytes))
+            digest.update(view.cast("B"))
+        if indices is not None:
+            with memoryview(indices) as view:
+                digest.update(view.cast("B"))
+        return digest.hexdigest()
+
+    def get(
+        self,
+        vertices,
+        indices,
+        directocclusion,
+        reverbocclusion,
+        doublesided,
+        vertices_per_polygon=3,
+        max_polygons=None,
+        max_vertices=None,
+    ):
+        """Get a geometry object for a mesh, loading it from the cache if
+        possible.
+
+        :param vertices: Vertex positions, see
+            :py:meth:`~pyfmodex.geometry.Geometry.add_mesh`.
+        :param indices: Vertex indices, see
+            :py:meth:`~pyfmodex.geometry.Geometry.add_mesh`.
+        :param float directocclusion: Occlusion factor of the polygons for the
+            direct path.
+        :param float reverbocclusion: Occlusion factor of the polygons for the
+            reverb path.
+        :param bool doublesided: Double sidedness of the polygons.
+        :param int vertices_per_polygon: Number of vertices of each polygon.
+        :param int max_polygons: Maximum number of polygons of the geometry
+            object, defaults to the number of polygons in the mesh.
+        :param int max_vertices: Maximum number of vertices of the geometry
+            object, defaults to the number of polygon vertices in the mesh.
+        :returns: Newly created geometry object.
+        :rtype: Geometry
+        """
+        name = (
+            self.key(
+                vertices,
+                indices,
+                directocclusion,
+                reverbocclusion,
+                doublesided,
+                vertices_per_polygon,
+                max_polygons,
+                max_vertices,
+            )
+            + self.suffix
+        )
+        path = os.path.join(self.directory, name)
+        if name in self._files:
+            try:
+                geometry = self._load(path)
+            except (OSError, ValueError, FmodError):
+                # Deleted, emptied or damaged by someone else, build it again
+                self._files.pop(name)
+            else:
+                self.hits += 1
+                os.utime(path)
+                return geometry
+
+        self.misses += 1
+        if indices is None:
+            with memoryview(vertices) as view:
+                count = view.nbytes // 12
+        else:
+            with memoryview(indices) as view:
+                count = view.nbytes // view.itemsize
+        geometry = self.system.create_geometry(
+            count // vertices_per_polygon if max_polygons is None else max_polygons,
+            count if max_vertices is None else max_vertices,
+        )
+        geometry.add_mesh(
+            vertices,
+            indices,
+            directocclusion,
+            reverbocclusion,
+            doublesided,
+            vertices_per_polygon,
+        )
+        self._store(name, geometry.save())
+        return geometry
+
+    def _load(self, path):
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY) as data:
+                return self.system.load_geometry(data)
+
+    def _store(self, name, data):
+        """Write a file atomically and evict old ones if needed."""
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, os.path.join(self.directory, name))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._files[name] = len(data)
+        self._evict(keep=name)
+
+    def _evict(self, keep):
+        size = self.size
+        if size <= self.max_size:
+            return
+
+        def last_used(name):
+            try:
+                return os.stat(os.path.join(self.directory, name)).st_mtime_ns
+            except FileNotFoundError:
+                return 0
+
+        by_age = sorted((name for name in self._files if name != keep), key=last_used)
+        for name in by_age:
+            if size <= self.max_size:
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            size -= self._files.pop(name)
+            self.evictions += 1
+
+    def clear(self):
+        """Delete all stored files."""
+        for name in self._files:
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+        self._files.clear()
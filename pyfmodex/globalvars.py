@@ -1,14 +1,38 @@
 """Global variables."""
 
-# Will be filled in __init__.py.
+from importlib import import_module
+
+# Classes looked up by get_class, filled in as they are first needed.
 class_list = {}
 DLL = None
 
+# Module and attribute name of the classes available through get_class, so
+# their modules are only imported when one of them is used.
+_class_locations = {
+    "Channel": ("channel", "Channel"),
+    "ChannelGroup": ("channel_group", "ChannelGroup"),
+    "DSP": ("dsp", "DSP"),
+    "DSP_Connection": ("dsp_connection", "DSPConnection"),
+    "Geometry": ("geometry", "Geometry"),
+    "Reverb3D": ("reverb", "Reverb3D"),
+    "Sound": ("sound", "Sound"),
+    "SoundGroup": ("sound_group", "SoundGroup"),
+    "System": ("system", "System"),
+}
+
 
 def get_class(classname):
     """Get the class object from the given string.
 
+    The module defining the class is imported on first use.
+
     :param str classname: Class name.
     :rtype: class
     """
-    return class_list[classname]
+    try:
+        return class_list[classname]
+    except KeyError:
+        module_name, attribute = _class_locations[classname]
+        module = import_module("." + module_name, __package__)
+        cls = class_list[classname] = getattr(module, attribute)
+        return cls
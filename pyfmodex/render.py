@@ -0,0 +1,171 @@
+"""Faster than realtime rendering of mixes."""
+
+from .capture import CaptureTap
+from .enums import CHANNELCONTROL_DSP_INDEX, OUTPUTTYPE, SPEAKERMODE
+from .globalvars import get_class
+from .structobject import Structobject as so
+
+
+class Renderer:
+    """A System mixing only on demand, as fast as possible.
+
+    The system uses :py:attr:`~pyfmodex.enums.OUTPUTTYPE.NOSOUND_NRT` output,
+    or :py:attr:`~pyfmodex.enums.OUTPUTTYPE.WAVWRITER_NRT` when a file to
+    write to is given. Nothing is mixed until :py:meth:`render` is called,
+    which mixes the requested number of frames without waiting for a sound
+    device. The mixed output of the master ChannelGroup can be captured and is
+    returned by :py:meth:`render`.
+
+    Sounds and DSPs are scheduled at sample accurate positions with
+    :py:meth:`play_sound` and :py:meth:`play_dsp`. Positions are DSP clocks of
+    the master ChannelGroup, which count the frames rendered since the
+    Renderer was created. The same clocks can be used for
+    :py:meth:`~pyfmodex.channel_control.ChannelControl.add_fade_point` on
+    channels playing on the master ChannelGroup.
+
+    Use :py:attr:`system` to create sounds, DSPs and groups. A Renderer can be
+    used as a context manager, releasing the system on exit.
+    """
+
+    def __init__(
+        self,
+        sample_rate=48000,
+        speaker_mode=SPEAKERMODE.STEREO,
+        block_size=1024,
+        path=None,
+        capture=True,
+        max_channels=256,
+    ):
+        """Constructor.
+
+        :param int sample_rate: Sample rate of the mix.
+        :param SPEAKERMODE speaker_mode: Speaker setup of the mix.
+        :param int block_size: Number of frames mixed per
+            :py:meth:`~pyfmodex.system.System.update`.
+        :param str path: Path of a wav file to write the mix to.
+        :param bool capture: Whether to capture the mix in memory to be
+            returned by :py:meth:`render`.
+        :param int max_channels: Maximum number of virtual channels.
+        """
+        self.system = get_class("System")()
+        self.system.output = (
+            OUTPUTTYPE.WAVWRITER_NRT if path else OUTPUTTYPE.NOSOUND_NRT
+        )
+        self.system.software_format = so(
+            sample_rate=sample_rate, speaker_mode=speaker_mode, raw_speakers=0
+        )
+        self.system.dsp_buffer_size.size = block_size
+        self.system.init(max_channels, extra=path.encode() if path else None)
+        self.sample_rate = sample_rate
+        self.channels = self.system.get_speaker_mode_channels(speaker_mode)
+        self._block_size = block_size
+        self._position = 0
+        self._tap = None
+        if capture:
+            # Rendering reads the tap after every block, so it only has to
+            # hold the frames mixed beyond what was requested.
+            self._tap = CaptureTap(self.system, speaker_mode, 2 * block_size)
+            self.system.master_channel_group.add_dsp(
+                CHANNELCONTROL_DSP_INDEX.HEAD, self._tap.dsp
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    @property
+    def position(self):
+        """Number of frames rendered so far, which is the DSP clock of the
+        master ChannelGroup where the next :py:meth:`render` starts.
+
+        :type: int
+        """
+        return self._position
+
+    def to_clock(self, seconds):
+        """Convert a time to a DSP clock of the master ChannelGroup.
+
+        :param float seconds: Time since the Renderer was created.
+        :rtype: int
+        """
+        return round(seconds * self.sample_rate)
+
+    def _schedule(self, channel, start, end):
+        channel.delay = so(dsp_start=start, dsp_end=end or 0, stop_channels=True)
+        channel.paused = False
+        return channel
+
+    def play_sound(self, sound, start=0, end=None, channel_group=None):
+        """Play a Sound at a sample accurate position.
+
+        :param Sound sound: Sound to play.
+        :param int start: DSP clock of the parent ChannelGroup to start
+            playing at. Clocks in the past start playing right away.
+        :param int end: DSP clock of the parent ChannelGroup to stop playing
+            at, or None to play until the sound ends.
+        :param ChannelGroup channel_group: Group to output to instead of the
+            master.
+        :returns: Newly playing channel.
+        :rtype: Channel
+        """
+        channel = self.system.play_sound(sound, channel_group, paused=True)
+        return self._schedule(channel, start, end)
+
+    def play_dsp(self, dsp, start=0, end=None, channel_group=None):
+        """Play a DSP along with any of its inputs at a sample accurate
+        position.
+
+        :param DSP dsp: Unit to play.
+        :param int start: DSP clock of the parent ChannelGroup to start
+            playing at. Clocks in the past start playing right away.
+        :param int end: DSP clock of the parent ChannelGroup to stop playing
+            at, or None to play until stopped.
+        :param ChannelGroup channel_group: Group to output to instead of the
+            master.
+        :returns: Newly playing channel.
+        :rtype: Channel
+        """
+        channel = self.system.play_dsp(dsp, channel_group, paused=True)
+        return self._schedule(channel, start, end)
+
+    def render(self, frames):
+        """Mix the given number of frames.
+
+        The mixer works in blocks of the block size given to the constructor,
+        frames mixed beyond the requested number are kept for the next call.
+
+        :param int frames: Number of frames to render.
+        :returns: The captured mix with one row of float samples per frame
+            and one column per channel, or None when not capturing.
+        :rtype: memoryview
+        """
+        target = self._position + frames
+        if self._tap is None:
+            # Whole blocks are mixed, so the frames mixed so far are the
+            # position rounded up to the block size.
+            mixed = -(-self._position // self._block_size) * self._block_size
+            while mixed < target:
+                self.system.update()
+                mixed += self._block_size
+            self._position = target
+            return None
+        data = bytearray(frames * self.channels * 4)
+        view = memoryview(data)
+        done = self._tap.read_into(view)
+        while done < frames:
+            self.system.update()
+            done += self._tap.read_into(view[done * self.channels * 4 :])
+        self._position = target
+        return view.cast("f", (frames, self.channels))
+
+    def release(self):
+        """Release the system along with the sounds and DSPs created with it,
+        finishing the wav file if one is being written.
+
+        Releasing a Renderer again does nothing.
+        """
+        if self.system is not None:
+            self.system.release()
+            self.system = None
@@ -2,7 +2,7 @@
 
 from ctypes import *
 
-from .fmodobject import FmodObject
+from .fmodobject import FmodObject, FmodProperty
 from .structures import REVERB_PROPERTIES, VECTOR
 from .utils import check_type
 
@@ -84,19 +84,12 @@ class Reverb3D(FmodObject):
         attrs[2] = maxdist
         self._threed_attrs = attrs
 
-    @property
+    @FmodProperty("Active", c_bool)
     def active(self):
         """The active state of the reverb sphere.
 
         :type: bool
         """
-        active = c_bool()
-        self._call_fmod("FMOD_Reverb3D_GetActive", byref(active))
-        return active.value
-
-    @active.setter
-    def active(self, active):
-        self._call_fmod("FMOD_Reverb3D_SetActive", active)
 
     @property
     def properties(self):
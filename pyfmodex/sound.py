@@ -5,10 +5,12 @@
 # pylint: disable=too-many-public-methods
 # That's not our fault... :-)
 
+import struct
+from contextlib import contextmanager
 from ctypes import *
 
 from .cone_settings import ConeSettings
-from .enums import OPENSTATE, SOUND_FORMAT, SOUND_TYPE, TIMEUNIT
+from .enums import OPENSTATE, RESULT, SOUND_FORMAT, SOUND_TYPE, TIMEUNIT
 from .flags import MODE
 from .fmodobject import FmodObject, _dll
 from .globalvars import get_class
@@ -16,6 +18,21 @@ from .structobject import Structobject as so
 from .structures import TAG, VECTOR
 from .utils import check_type, ckresult, prepare_str
 
+# memoryview item formats for the PCM sample formats Python has a type for.
+_PCM_VIEW_FORMATS = {
+    SOUND_FORMAT.PCM8: "b",
+    SOUND_FORMAT.PCM16: "h",
+    SOUND_FORMAT.PCM32: "i",
+    SOUND_FORMAT.PCMFLOAT: "f",
+}
+
+
+def _memory_view(ptr, length, view_format):
+    """A writable memoryview of length bytes at the address of ptr."""
+    if not length:
+        return memoryview(bytearray()).cast(view_format)
+    return memoryview((c_char * length).from_address(ptr)).cast("B").cast(view_format)
+
 
 class Sound(FmodObject):
     """Container for sample data that can be played on a
@@ -646,7 +663,8 @@ class Sound(FmodObject):
         direct manipulation.
 
         You must always unlock the data again after you have finished with it,
-        using :py:meth:`unlock`.
+        using :py:meth:`unlock`. See :py:meth:`locked` for a more convenient
+        way to do so.
 
         With this method you get access to the raw audio data. If the data is
         8, 16, 24 or 32bit PCM data, mono or stereo data, you must take this
@@ -703,6 +721,53 @@ class Sound(FmodObject):
         )
         return ((ptr1, len1), (ptr2, len2))
 
+    @contextmanager
+    def locked(self, offset, length):
+        """Give direct access to a portion or all the sample data of a sound
+        for the duration of a with block.
+
+        This is a context manager around :py:meth:`lock` and
+        :py:meth:`unlock`. It yields two writable memoryviews mapped directly
+        onto the sample data, without copying it. The second one is empty
+        unless offset + length exceeds the length of the sample buffer. For
+        8, 16 and 32 bit integer and floating point PCM data, the views are
+        indexed by samples (interleaved for multichannel sounds), otherwise
+        they are indexed by bytes.
+
+        The sample data is unlocked when the block is left, even when an
+        exception was raised in it. The views must not be used afterwards.
+
+        :param int offset: Offset into the sound's buffer to be retrieved, in
+            bytes.
+        :param int length: Length of the data required to be retrieved, in
+            bytes.
+        :rtype: two-tuple of memoryviews
+        :raises ValueError: when the views are indexed by samples and offset
+            or length is not a multiple of the sample size.
+        """
+        view_format = _PCM_VIEW_FORMATS.get(self.format.format, "B")
+        sample_size = struct.calcsize(view_format)
+        if offset % sample_size or length % sample_size:
+            raise ValueError(
+                "Offset and length must be multiples of the sample size of %d "
+                "bytes" % sample_size
+            )
+        (ptr1, len1), (ptr2, len2) = self.lock(offset, length)
+        views = ()
+        try:
+            views = (
+                _memory_view(ptr1.value, len1.value, view_format),
+                _memory_view(ptr2.value, len2.value, view_format),
+            )
+            yield views
+        finally:
+            for view in views:
+                try:
+                    view.release()
+                except BufferError:
+                    pass  # Still exported, e.g. to a NumPy array
+            self.unlock((ptr1, len1), (ptr2, len2))
+
     def release(self):
         """Free this sound object.
 
@@ -817,6 +882,37 @@ class Sound(FmodObject):
         self._call_fmod("FMOD_Sound_ReadData", buf, length, byref(actual))
         return buf.raw, actual.value
 
+    def read_into(self, buffer):
+        """Read data from an opened sound directly into a caller provided
+        buffer, using FMOD's internal codecs.
+
+        This works like :py:meth:`read_data`, but decodes into `buffer`
+        without allocating or copying any intermediate buffer, so the same
+        buffer can be reused for reading a whole sound piece by piece. As many
+        bytes as `buffer` is long are requested.
+
+        Reaching the end of the data is not treated as an error: the method
+        returns the number of bytes which could still be read, which is 0 once
+        all data has been read.
+
+        :param buffer: Writable contiguous object supporting the buffer
+            protocol, for example a bytearray, memoryview, NumPy array or
+            mmap.
+        :returns: Number of bytes written to the start of `buffer`.
+        :rtype: int
+        :raises TypeError: when `buffer` is read-only.
+        """
+        view = memoryview(buffer)
+        if view.readonly:
+            raise TypeError("Cannot read sound data into a read-only buffer")
+        length = view.nbytes
+        data = (c_char * length).from_buffer(view)
+        actual = c_uint()
+        result = _dll.FMOD_Sound_ReadData(self._ptr, data, length, byref(actual))
+        if result != RESULT.FILE_EOF.value:
+            ckresult(result)
+        return actual.value
+
     def seek_data(self, offset):
         """Seek a sound for use with data reading, using FMOD's internal
         codecs.
@@ -0,0 +1,133 @@
+"""Reuse of opened sounds across requests for the same file."""
+
+from collections import OrderedDict
+from ctypes import _SimpleCData, c_void_p
+
+from .enums import TIMEUNIT
+from .flags import MODE
+
+
+def _exinfo_key(exinfo):
+    """The plain value fields of extended info, identifying how a sound is
+    created from it. Pointers and callbacks are left out.
+    """
+    if exinfo is None:
+        return None
+    return tuple(
+        getattr(exinfo, name)
+        for name, ctype in exinfo._fields_
+        if issubclass(ctype, _SimpleCData) and ctype is not c_void_p
+    )
+
+
+def _footprint(sound, mode):
+    """Number of bytes of decoded sample data held by a sound."""
+    if mode & MODE.CREATESTREAM:
+        return 0
+    num_subsounds = sound.num_subsounds
+    if num_subsounds:
+        return sum(
+            sound.get_subsound(index).get_length(TIMEUNIT.PCMBYTES)
+            for index in range(num_subsounds)
+        )
+    return sound.get_length(TIMEUNIT.PCMBYTES)
+
+
+class SoundCache:
+    """A cache of sounds keyed by the path, mode and extended info they are
+    created with, so that a file used again is not decoded again.
+
+    The memory used by the cached sounds is estimated as the size of their
+    decoded PCM data, streams count as nothing. Once the estimate exceeds the
+    budget, the least recently requested sounds are released until it fits
+    again. Sounds that are playing on any Channel, and the sound just
+    requested, are kept even if that means exceeding the budget.
+
+    Cached sounds must only be released through the cache. Requests are
+    counted in :py:attr:`hits` and :py:attr:`misses`, released sounds in
+    :py:attr:`evictions`.
+    """
+
+    def __init__(self, system, budget=64 * 1024 * 1024):
+        """Constructor.
+
+        :param System system: System to create the sounds with.
+        :param int budget: Number of bytes the cached sounds may use.
+        """
+        self.system = system
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (sound, size) by key, least recently used first
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path, mode=MODE.THREED, exinfo=None):
+        """Get a sound, creating it only when it is not cached yet.
+
+        :param str path: Name of the file to open.
+        :param MODE mode: Behavior modifier for opening the sound.
+        :param CREATESOUNDEXINFO exinfo: Extended information for creating the
+            sound.
+        :rtype: Sound
+        :raises ValueError: when opening with
+            :py:attr:`~pyfmodex.flags.MODE.NONBLOCKING`, as the size of the
+            sound is not known yet.
+        """
+        key = (path, mode.value, _exinfo_key(exinfo))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if mode & MODE.NONBLOCKING:
+            raise ValueError("Sounds opened with MODE.NONBLOCKING cannot be cached")
+        self.misses += 1
+        sound = self.system.create_sound(path, mode, exinfo)
+        size = _footprint(sound, mode)
+        self._entries[key] = (sound, size)
+        self.size += size
+        if self.size > self.budget:
+            self._evict()
+        return sound
+
+    def _playing_sounds(self):
+        """Pointer values of the sounds playing on any Channel, and of their
+        parent sounds.
+        """
+        playing = set()
+        groups = [self.system.master_channel_group]
+        while groups:
+            group = groups.pop()
+            for index in range(group.num_channels):
+                sound = group.get_channel(index).current_sound
+                if sound._ptr.value is not None:
+                    playing.add(sound._ptr.value)
+                    playing.add(sound.subsound_parent._ptr.value)
+            groups.extend(group.get_group(index) for index in range(group.num_groups))
+        return playing
+
+    def _evict(self):
+        playing = self._playing_sounds()
+        # The last entry is the sound just requested
+        for key in list(self._entries)[:-1]:
+            if self.size <= self.budget:
+                break
+            sound, size = self._entries[key]
+            if sound._ptr.value in playing:
+                continue
+            del self._entries[key]
+            sound.release()
+            self.size -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Release all cached sounds, playing or not."""
+        for sound, _ in self._entries.values():
+            sound.release()
+        self._entries.clear()
+        self.size = 0
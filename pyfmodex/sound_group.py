@@ -2,27 +2,20 @@
 from ctypes import byref, c_float, c_int, c_void_p, create_string_buffer
 
 from .enums import SOUNDGROUP_BEHAVIOR
-from .fmodobject import FmodObject
+from .fmodobject import FmodObject, FmodProperty
 from .globalvars import get_class
 
 
 class SoundGroup(FmodObject):
     """An interface that manages Sound Groups."""
 
-    @property
+    @FmodProperty("MaxAudible", c_int)
     def max_audible(self):
         """The maximum number of playbacks to be audible at once in a sound
         group.
 
         :type: int
         """
-        val = c_int()
-        self._call_fmod("FMOD_SoundGroup_GetMaxAudible", byref(val))
-        return val.value
-
-    @max_audible.setter
-    def max_audible(self, val):
-        self._call_fmod("FMOD_SoundGroup_SetMaxAudible", val)
 
     @property
     def max_audible_behavior(self):
@@ -38,7 +31,7 @@ class SoundGroup(FmodObject):
     def max_audible_behavior(self, behavior):
         self._call_fmod("FMOD_SoundGroup_SetMaxAudibleBehavior", behavior.value)
 
-    @property
+    @FmodProperty("MuteFadeSpeed", c_float)
     def mute_fade_speed(self):
         """The current mute fade time.
 
@@ -57,13 +50,6 @@ class SoundGroup(FmodObject):
 
         :type: float
         """
-        speed = c_float()
-        self._call_fmod("FMOD_SoundGroup_GetMuteFadeSpeed", byref(speed))
-        return speed.value
-
-    @mute_fade_speed.setter
-    def mute_fade_speed(self, speed):
-        self._call_fmod("FMOD_SoundGroup_SetMuteFadeSpeed", c_float(speed))
 
     @property
     def name(self):
@@ -75,7 +61,7 @@ class SoundGroup(FmodObject):
         self._call_fmod("FMOD_SoundGroup_GetName", buf, 512)
         return buf.value
 
-    @property
+    @FmodProperty("NumPlaying", c_int, settable=False)
     def num_playing(self):
         """The number of currently playing channels for the sound group.
 
@@ -87,19 +73,13 @@ class SoundGroup(FmodObject):
 
         :type: int
         """
-        num = c_int()
-        self._call_fmod("FMOD_SoundGroup_GetNumPlaying", byref(num))
-        return num.value
 
-    @property
+    @FmodProperty("NumSounds", c_int, settable=False)
     def num_sounds(self):
         """The current number of sounds in this sound group.
 
         :type: int
         """
-        num = c_int()
-        self._call_fmod("FMOD_SoundGroup_GetNumSounds", byref(num))
-        return num.value
 
     def get_sound(self, idx):
         """The sound in this group at the given index.
@@ -122,19 +102,12 @@ class SoundGroup(FmodObject):
         self._call_fmod("FMOD_SoundGroup_GetSystemObject", byref(sysptr))
         return get_class("System")(sysptr)
 
-    @property
+    @FmodProperty("Volume", c_float)
     def volume(self):
         """The volume of the sound group.
 
         :type: float
         """
-        vol = c_float()
-        self._call_fmod("FMOD_SoundGroup_GetVolume", byref(vol))
-        return vol.value
-
-    @volume.setter
-    def volume(self, vol):
-        self._call_fmod("FMOD_SoundGroup_SetVolume", c_float(vol))
 
     def release(self):
         """Release the soundgroup object and return all sounds back to the
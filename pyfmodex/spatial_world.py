@@ -0,0 +1,268 @@
+"""Activation of Reverb3D and Geometry objects by distance to the
+listeners.
+"""
+
+import math
+import time
+
+
+class _Entry:
+    """An object managed by a SpatialAudioWorld."""
+
+    __slots__ = ("obj", "is_reverb", "center", "radius", "reach", "cells")
+
+    def __init__(self, obj, is_reverb, reach):
+        self.obj = obj
+        self.is_reverb = is_reverb
+        self.reach = reach
+        self.center = None
+        self.radius = 0.0
+        self.cells = ()
+
+    def near(self, positions, margin):
+        """Whether any of the positions is within reach of the object."""
+        limit = self.radius + self.reach + margin
+        limit *= limit
+        cx, cy, cz = self.center
+        for x, y, z in positions:
+            dx, dy, dz = x - cx, y - cy, z - cz
+            if dx * dx + dy * dy + dz * dz <= limit:
+                return True
+        return False
+
+
+class SpatialAudioWorld:
+    """Keeps only the Reverb3D and Geometry objects near the listeners
+    active, so that FMOD does not weigh every reverb sphere and occluding
+    object of a large world on each update.
+
+    A reverb sphere is near a listener when the listener is within its
+    maximum distance. A geometry object, given as a bounding sphere, is near
+    when the listener is within :py:attr:`geometry_distance` of that sphere,
+    so that it can still occlude sounds that are that far from the listener.
+    Once active, objects stay active until the listener is further away by
+    :py:attr:`margin`, which keeps objects on the edge from being switched on
+    and off every update.
+
+    The objects are kept in a uniform grid over the horizontal x and z axes,
+    every object in the cells its reach overlaps, so a culling pass only looks
+    at the objects in the cells of the listeners. Objects overlapping too many
+    cells are checked on every pass instead. Only objects whose state changes
+    are passed to FMOD.
+
+    The number of active objects is reported by :py:attr:`num_active`,
+    :py:attr:`num_active_reverbs` and :py:attr:`num_active_geometry`, the time
+    taken by the culling passes in :py:attr:`last_duration`,
+    :py:attr:`max_duration` and :py:attr:`mean_duration`.
+    """
+
+    #: Number of cells an object may overlap before it is checked on every
+    #: pass instead of being stored in the grid.
+    max_cells = 256
+
+    def __init__(self, system, cell_size=64.0, geometry_distance=100.0, margin=0.0):
+        """Constructor.
+
+        :param System system: System the objects belong to, whose listeners
+            are used when no positions are passed to :py:meth:`update`.
+        :param float cell_size: Width and depth of the grid cells.
+        :param float geometry_distance: Distance from the listener within
+            which geometry objects are active.
+        :param float margin: Distance beyond the activation distance at which
+            active objects are deactivated again.
+        """
+        self.system = system
+        self.cell_size = cell_size
+        self.geometry_distance = geometry_distance
+        self.margin = margin
+        self.passes = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self._total_duration = 0.0
+        # Entries by pointer value of their objects
+        self._entries = {}
+        # Entries by (x, z) cell
+        self._grid = {}
+        # Entries overlapping more than max_cells cells
+        self._large = set()
+        self._active = set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return obj._ptr.value in self._entries
+
+    @property
+    def num_active(self):
+        """Number of objects made active by the last culling pass.
+
+        :type: int
+        """
+        return len(self._active)
+
+    @property
+    def num_active_reverbs(self):
+        """Number of reverb spheres made active by the last culling pass.
+
+        :type: int
+        """
+        return sum(1 for entry in self._active if entry.is_reverb)
+
+    @property
+    def num_active_geometry(self):
+        """Number of geometry objects made active by the last culling pass.
+
+        :type: int
+        """
+        return sum(1 for entry in self._active if not entry.is_reverb)
+
+    @property
+    def mean_duration(self):
+        """Mean number of seconds a culling pass took.
+
+        :type: float
+        """
+        return self._total_duration / self.passes if self.passes else 0.0
+
+    def reset_stats(self):
+        """Reset the pass counter and durations."""
+        self.passes = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self._total_duration = 0.0
+
+    def add_reverb(self, reverb):
+        """Manage a reverb sphere, using its current position and maximum
+        distance.
+
+        The reverb is made inactive until the next :py:meth:`update`.
+
+        :param Reverb3D reverb: The reverb sphere.
+        """
+        entry = _Entry(reverb, True, 0.0)
+        self._add(entry)
+        self.move(reverb)
+
+    def add_geometry(self, geometry, radius, position=None):
+        """Manage a geometry object.
+
+        The geometry object is made inactive until the next :py:meth:`update`.
+
+        :param Geometry geometry: The geometry object.
+        :param float radius: Radius of a sphere around the position containing
+            all polygons of the object.
+        :param position: Center of the sphere, defaults to the position of the
+            object.
+        :type position: list of three coordinate floats
+        """
+        entry = _Entry(geometry, False, self.geometry_distance)
+        self._add(entry)
+        self.move(
+            geometry, geometry.position if position is None else position, radius
+        )
+
+    def _add(self, entry):
+        key = entry.obj._ptr.value
+        if key in self._entries:
+            raise ValueError("Object is already managed")
+        self._entries[key] = entry
+        entry.obj.active = False
+
+    def move(self, obj, position=None, radius=None):
+        """Update the bounds of a managed object after it moved or changed
+        size.
+
+        :param obj: The Reverb3D or Geometry object.
+        :param position: New center, for reverb spheres defaults to their
+            position.
+        :type position: list of three coordinate floats
+        :param float radius: New radius, for reverb spheres defaults to their
+            maximum distance.
+        """
+        entry = self._entries[obj._ptr.value]
+        if entry.is_reverb and (position is None or radius is None):
+            center, _, max_distance = obj._threed_attrs
+            position = center if position is None else position
+            radius = max_distance if radius is None else radius
+        if position is not None:
+            entry.center = tuple(position)
+        if radius is not None:
+            entry.radius = radius
+        self._unlink(entry)
+        extent = entry.radius + entry.reach + self.margin
+        x, _, z = entry.center
+        first_x, last_x = self._cell(x - extent), self._cell(x + extent)
+        first_z, last_z = self._cell(z - extent), self._cell(z + extent)
+        if (last_x - first_x + 1) * (last_z - first_z + 1) > self.max_cells:
+            self._large.add(entry)
+            return
+        entry.cells = [
+            (cell_x, cell_z)
+            for cell_x in range(first_x, last_x + 1)
+            for cell_z in range(first_z, last_z + 1)
+        ]
+        for cell in entry.cells:
+            self._grid.setdefault(cell, set()).add(entry)
+
+    def remove(self, obj):
+        """Stop managing an object, leaving its active state as it is.
+
+        :param obj: The Reverb3D or Geometry object.
+        """
+        entry = self._entries.pop(obj._ptr.value)
+        self._unlink(entry)
+        self._active.discard(entry)
+
+    def _unlink(self, entry):
+        self._large.discard(entry)
+        for cell in entry.cells:
+            entries = self._grid[cell]
+            entries.discard(entry)
+            if not entries:
+                del self._grid[cell]
+        entry.cells = ()
+
+    def _cell(self, coordinate):
+        return math.floor(coordinate / self.cell_size)
+
+    def update(self, positions=None):
+        """Run a culling pass, activating the objects near any of the
+        listeners and deactivating the others.
+
+        :param positions: Positions to cull around, defaults to the positions
+            of the 3D listeners of the system.
+        :type positions: list of lists of three coordinate floats
+        :returns: Number of active objects.
+        :rtype: int
+        """
+        start = time.perf_counter()
+        if positions is None:
+            system = self.system
+            positions = [
+                system.listener(index).position
+                for index in range(system.num_3d_listeners)
+            ]
+        candidates = set(self._large)
+        for x, _, z in positions:
+            candidates.update(self._grid.get((self._cell(x), self._cell(z)), ()))
+        active = self._active
+        margin = self.margin
+        near = {
+            entry
+            for entry in candidates
+            if entry.near(positions, margin if entry in active else 0.0)
+        }
+        for entry in active - near:
+            entry.obj.active = False
+        for entry in near - active:
+            entry.obj.active = True
+        self._active = near
+
+        duration = time.perf_counter() - start
+        self.passes += 1
+        self.last_duration = duration
+        self._total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+        return len(near)
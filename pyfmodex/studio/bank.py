@@ -4,6 +4,7 @@ runtime mixing and playback.
 
 from ctypes import byref, c_int, c_void_p
 
+from .enums import LOADING_STATE
 from .event_description import EventDescription
 from .studio_object import StudioObject
 
@@ -36,3 +37,32 @@ class Bank(StudioObject):
         for pointer in array:
             descs.append(EventDescription(pointer))
         return descs
+
+    @property
+    def loading_state(self):
+        """The loading state.
+
+        Raises the error that made a non-blocking load fail.
+        """
+        state = c_int()
+        self._call("GetLoadingState", byref(state))
+        return LOADING_STATE(state.value)
+
+    def load_sample_data(self):
+        """Loads non-streaming sample data for all events in the bank."""
+        self._call("LoadSampleData")
+
+    def unload(self):
+        """Unloads the bank.
+
+        This also unloads any sample data loaded through the bank. A bank
+        that failed to load has to be unloaded as well.
+        """
+        self._call("Unload")
+
+    @property
+    def sample_loading_state(self):
+        """Retrieves the sample data loading state."""
+        state = c_int()
+        self._call("GetSampleLoadingState", byref(state))
+        return LOADING_STATE(state.value)
@@ -2,9 +2,12 @@
 
 from ctypes import byref, c_int, c_void_p, create_string_buffer
 
+from ..utils import prepare_str
 from .event_instance import EventInstance
 from .studio_object import StudioObject
 from .enums import LOADING_STATE
+from .structures import PARAMETER_DESCRIPTION, PARAMETER_ID
+from .utils import wait_until_loaded
 
 class EventDescription(StudioObject):
     """The description for an FMOD Studio Event.
@@ -16,6 +19,11 @@ class EventDescription(StudioObject):
 
     function_prefix = "FMOD_Studio_EventDescription"
 
+    def __init__(self, ptr):
+        super().__init__(ptr)
+        # Parameter IDs by lower case name
+        self._parameter_ids = {}
+
     @property
     def path(self):
         """The path."""
@@ -38,6 +46,62 @@ class EventDescription(StudioObject):
         self._call("GetParameterDescriptionCount", byref(count))
         return count.value
 
+    def get_parameter_description_by_index(self, index):
+        """A parameter description by index.
+
+        :param int index: Parameter index, from 0 up to
+            :py:attr:`parameter_description_count`.
+        :rtype: PARAMETER_DESCRIPTION
+        """
+        description = PARAMETER_DESCRIPTION()
+        self._call("GetParameterDescriptionByIndex", index, byref(description))
+        return description
+
+    def get_parameter_description_by_name(self, name):
+        """A parameter description by name.
+
+        :param str name: Parameter name (case-insensitive).
+        :rtype: PARAMETER_DESCRIPTION
+        """
+        description = PARAMETER_DESCRIPTION()
+        self._call(
+            "GetParameterDescriptionByName", prepare_str(name), byref(description)
+        )
+        return description
+
+    def get_parameter_id(self, name):
+        """The ID of a parameter, to set it on instances without a lookup by
+        name.
+
+        IDs are cached on this wrapper object, only the first request of a
+        name through it asks FMOD for it. As
+        :py:meth:`~pyfmodex.studio.system.StudioSystem.get_event` returns a
+        new wrapper on every call, keep the description around, or the IDs
+        themselves, instead of getting the event again for every lookup.
+
+        :param str name: Parameter name (case-insensitive).
+        :rtype: PARAMETER_ID
+        """
+        key = name.lower()
+        try:
+            return self._parameter_ids[key]
+        except KeyError:
+            parameter_id = self.get_parameter_description_by_name(name).id
+            # Copy out of the description
+            parameter_id = PARAMETER_ID(parameter_id.data1, parameter_id.data2)
+            self._parameter_ids[key] = parameter_id
+            return parameter_id
+
+    def get_parameter_ids(self, names):
+        """The IDs of several parameters, as an array to pass to
+        :py:meth:`~pyfmodex.studio.event_instance.EventInstance.set_parameters_by_ids`.
+
+        :param names: Parameter names (case-insensitive).
+        :type names: sequence of str
+        :rtype: ctypes array of PARAMETER_ID
+        """
+        return (PARAMETER_ID * len(names))(*map(self.get_parameter_id, names))
+
     @property
     def user_property_count(self):
         """The number of user properties attached to the event."""
@@ -49,6 +113,27 @@ class EventDescription(StudioObject):
         """Loads non-streaming sample data used by the event."""
         self._call("LoadSampleData")
 
+    async def load_sample_data_async(self, system=None, poll_interval=0.01):
+        """Load non-streaming sample data used by the event, returning once
+        it has been loaded.
+
+        The loading state is polled, sleeping in between, so other tasks keep
+        running meanwhile.
+
+        :param StudioSystem system: System to update between polls, to submit
+            the load request and advance loading. Leave out when the system is
+            updated elsewhere.
+        :param float poll_interval: Seconds to sleep between polls.
+        :raises FmodError: when loading fails with a result from FMOD.
+        :raises RuntimeError: when loading fails without one.
+        """
+        self.load_sample_data()
+        await wait_until_loaded(
+            lambda: self.sample_loading_state,
+            None if system is None else system.update,
+            poll_interval,
+        )
+
     @property
     def sample_loading_state(self):
         """Retrieves the sample data loading state."""
@@ -1,12 +1,13 @@
 """An instance of an FMOD Studio Event."""
 
-from ctypes import byref, c_bool, c_float, c_int, c_void_p
+from ctypes import Array, byref, c_bool, c_float, c_int, c_void_p
 
 from ..channel_group import ChannelGroup
 from ..structures import THREED_ATTRIBUTES
 from ..structures import VECTOR
 from ..utils import prepare_str
 from .enums import PLAYBACK_STATE
+from .structures import PARAMETER_ID
 from .studio_object import StudioObject
 
 
@@ -147,6 +148,49 @@ class EventInstance(StudioObject):
             "SetParameterByName", prepare_str(name), c_float(value), ignoreseekspeed
         )
 
+    def get_parameter_by_id(self, parameter_id):
+        """A parameter value.
+
+        :param PARAMETER_ID parameter_id: Parameter ID, see
+            :py:meth:`~pyfmodex.studio.event_description.EventDescription.get_parameter_id`.
+        """
+        val = c_float()
+        actual = c_float()
+        self._call("GetParameterByID", parameter_id, byref(val), byref(actual))
+        return (val.value, actual.value)
+
+    def set_parameter_by_id(self, parameter_id, value, ignoreseekspeed=False):
+        """Set a parameter value by ID.
+
+        :param PARAMETER_ID parameter_id: Parameter ID, see
+            :py:meth:`~pyfmodex.studio.event_description.EventDescription.get_parameter_id`.
+        :param float value: Value for given ID.
+        :param bool ignoreseekspeed: Specifies whether to ignore the
+            parameter's seek speed and set the value immediately.
+        """
+        self._call("SetParameterByID", parameter_id, c_float(value), ignoreseekspeed)
+
+    def set_parameters_by_ids(self, parameter_ids, values, ignoreseekspeed=False):
+        """Set several parameter values by ID in a single call.
+
+        :param parameter_ids: Parameter IDs, see
+            :py:meth:`~pyfmodex.studio.event_description.EventDescription.get_parameter_ids`.
+        :type parameter_ids: ctypes array or sequence of PARAMETER_ID
+        :param values: Values for the given IDs, in the same order.
+        :type values: ctypes array or sequence of float
+        :param bool ignoreseekspeed: Specifies whether to ignore the
+            parameters' seek speed and set the values immediately.
+        :raises ValueError: when the number of IDs and values differ.
+        """
+        count = len(parameter_ids)
+        if len(values) != count:
+            raise ValueError("Got %d parameter IDs but %d values" % (count, len(values)))
+        if not isinstance(parameter_ids, Array):
+            parameter_ids = (PARAMETER_ID * count)(*parameter_ids)
+        if not isinstance(values, Array):
+            values = (c_float * count)(*values)
+        self._call("SetParametersByIDs", parameter_ids, values, count, ignoreseekspeed)
+
     def get_3d_attributes(self) -> list[list[float]]:
         """Get the 3D attributes of this EventInstance.
 
@@ -196,7 +240,7 @@ class EventInstance(StudioObject):
         """
         ptr = c_void_p()
         self._call("GetChannelGroup", byref(ptr))
-        return ChannelGroup(ptr)
+        return ChannelGroup._from_handle(ptr)
 
     @property
     def reverb_level(self):
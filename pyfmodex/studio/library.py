@@ -1,10 +1,8 @@
 """Util method to get the FMOD LIBRARY from the filesystem into ctypes."""
 
 import os
-import platform
 import sys
 
-arch = platform.architecture()[0]
 if os.name == "nt":
     from ctypes import windll
     library_type = windll
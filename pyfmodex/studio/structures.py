@@ -5,6 +5,8 @@
 
 from ctypes import Structure, c_char_p, c_float, c_int, c_uint, sizeof
 
+from ..structures import GUID
+
 
 class ADVANCEDSETTINGS(Structure):
     """Settings for advanced features like configuring memory and cpu usage.
@@ -71,23 +73,44 @@ class BUFFER_USAGE(Structure):
     _fields_ = [("studiocommandqueue", BUFFER_INFO), ("studiohandle", BUFFER_INFO)]
 
 
+class PARAMETER_ID(Structure):
+    """Identifier of a parameter, for looking it up without comparing names.
+
+    :ivar int data1: First half of the ID.
+    :ivar int data2: Second half of the ID.
+    """
+
+    _fields_ = [("data1", c_uint), ("data2", c_uint)]
+
+    def __eq__(self, other):
+        if isinstance(other, PARAMETER_ID):
+            return (self.data1, self.data2) == (other.data1, other.data2)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.data1, self.data2))
+
+
 class PARAMETER_DESCRIPTION(Structure):
     """An event parameter.
 
     :ivar str name: Parameter name.
-    :ivar int index: Parameter id.
+    :ivar PARAMETER_ID id: Parameter ID.
     :ivar float minimum: Minimum parameter value.
     :ivar float maximum: Maximum parameter value.
     :ivar float defaultvalue: Default parameter value.
     :ivar int type: Parameter type.
+    :ivar int flags: Parameter flags.
+    :ivar GUID guid: Parameter GUID.
     """
-    # TODO: id vs index, flags -> because of FMOD API update to 2.0?
 
     _fields_ = [
         ("name", c_char_p),
-        ("index", c_int),
+        ("id", PARAMETER_ID),
         ("minimum", c_float),
         ("maximum", c_float),
         ("defaultvalue", c_float),
         ("type", c_int),
+        ("flags", c_uint),
+        ("guid", GUID),
     ]
@@ -1,5 +1,7 @@
 """Parent class for most other classes related to FMOD Stdio."""
 
+from ctypes import c_int
+
 from ..utils import ckresult
 from .library import get_library
 
@@ -8,7 +10,7 @@ class StudioObject:
     """A base FMOD studio object."""
 
     function_prefix = ''  # to be overridden in subclasses
-    
+
     def __init__(self, ptr):
         """Constructor.
 
@@ -17,10 +19,32 @@ class StudioObject:
         self._ptr = ptr
         self._lib = get_library()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolved <function_prefix>_<suffix> functions, by their suffix
+        cls._functions = {}
+
+    def _get_function(self, specific_function_suffix):
+        """Get the library function for the given suffix, resolving the
+        symbol only on first use.
+        """
+        try:
+            return self._functions[specific_function_suffix]
+        except KeyError:
+            func_name = "%s_%s" % (self.function_prefix, specific_function_suffix)
+            function = getattr(self._lib, func_name)
+            function.restype = c_int
+            self._functions[specific_function_suffix] = function
+            return function
+
     def _call(self, specific_function_suffix, *args):
-        func_name = "%s_%s" % (self.function_prefix, specific_function_suffix)
-        result = getattr(self._lib, func_name)(self._ptr, *args)
-        ckresult(result)
+        try:
+            function = self._functions[specific_function_suffix]
+        except KeyError:
+            function = self._get_function(specific_function_suffix)
+        result = function(self._ptr, *args)
+        if result:
+            ckresult(result)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -31,6 +55,5 @@ class StudioObject:
     def is_valid(self):
         """Check that the System reference is valid and has been initialized.
         """
-        func_name = "%s_%s" % (self.function_prefix, "IsValid")
-        result = getattr(self._lib, func_name)(self._ptr)
+        result = self._get_function("IsValid")(self._ptr)
         return bool(result)
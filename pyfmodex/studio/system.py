@@ -10,7 +10,7 @@ from .flags import LOAD_BANK_FLAGS, STUDIO_INIT_FLAGS
 from .library import get_library
 from .structures import ADVANCEDSETTINGS, BUFFER_USAGE
 from .studio_object import StudioObject
-from .utils import fmod_version
+from .utils import fmod_version, wait_until_loaded
 from .. import System
 
 class StudioSystem(StudioObject):
@@ -153,6 +153,41 @@ class StudioSystem(StudioObject):
         self._call("LoadBankFile", filename, flags.value, byref(bank_ptr))
         return Bank(bank_ptr)
 
+    async def load_bank_async(
+        self, filename, flags=LOAD_BANK_FLAGS.NORMAL, update=True, poll_interval=0.01
+    ):
+        """Load the metadata of a Studio bank from file without blocking,
+        returning once it has been loaded.
+
+        The bank is loaded with
+        :py:attr:`~pyfmodex.studio.flags.LOAD_BANK_FLAGS.NONBLOCKING` and its
+        loading state is polled, sleeping in between, so other tasks keep
+        running meanwhile.
+
+        :param str filename: Name of the file on disk.
+        :param Flags flags: Flags to control bank loading.
+        :param bool update: Whether to update the system between polls. Pass
+            False when the system is updated elsewhere.
+        :param float poll_interval: Seconds to sleep between polls.
+        :returns: The loaded bank.
+        :rtype: Bank
+        :raises FmodError: when loading fails, with the result of the failed
+            load. The bank is unloaded again.
+        """
+        bank = self.load_bank_file(filename, flags | LOAD_BANK_FLAGS.NONBLOCKING)
+        try:
+            await wait_until_loaded(
+                lambda: bank.loading_state,
+                self.update if update else None,
+                poll_interval,
+            )
+        except BaseException:
+            # A bank that failed to load, or whose loading was cancelled,
+            # still has to be unloaded.
+            bank.unload()
+            raise
+        return bank
+
     def update(self):
         """Update the FMOD Studio System.
 
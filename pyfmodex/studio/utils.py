@@ -1,7 +1,11 @@
 """Handy util methods."""
 
+import asyncio
+
 import pyfmodex
 
+from .enums import LOADING_STATE
+
 
 def fmod_version():
     """FMOD API version number."""
@@ -10,3 +14,27 @@ def fmod_version():
     system.close()
     system.release()
     return version
+
+
+async def wait_until_loaded(get_state, update=None, poll_interval=0.01):
+    """Wait for a loading state to become LOADED, sleeping between polls.
+
+    :param get_state: Callable returning the current LOADING_STATE. Errors
+        it raises, like the result of a failed bank load raised by
+        :py:attr:`~pyfmodex.studio.bank.Bank.loading_state`, are passed on.
+    :param update: Callable to run between polls, like the update method of
+        the system, or None when the system is updated elsewhere.
+    :param float poll_interval: Seconds to sleep between polls.
+    :raises FmodError: when loading fails, with the result FMOD reports.
+    :raises RuntimeError: when loading fails without FMOD reporting a result,
+        as for sample data.
+    """
+    while True:
+        state = get_state()
+        if state is LOADING_STATE.LOADED:
+            return
+        if state is LOADING_STATE.ERROR:
+            raise RuntimeError("Loading failed without a result from FMOD")
+        if update is not None:
+            update()
+        await asyncio.sleep(poll_interval)
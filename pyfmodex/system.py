@@ -1,7 +1,8 @@
 """Module containing all classes related to the Fmod System class."""
 
+from array import array
 from ctypes import byref, create_string_buffer, sizeof
-from ctypes import c_bool, c_float, c_int, c_uint, c_longlong, c_void_p
+from ctypes import c_bool, c_char, c_float, c_int, c_uint, c_longlong, c_void_p
 
 from .callback_prototypes import ROLLOFF_CALLBACK, SYSTEM_CALLBACK
 from .callback_prototypes import FILE_ASYNCCANCEL_CALLBACK, FILE_CLOSE_CALLBACK
@@ -16,7 +17,7 @@ from .globalvars import get_class
 from .structobject import Structobject as so
 from .structures import ADVANCEDSETTINGS, VECTOR, REVERB_PROPERTIES, GUID
 from .structures import DSP_DESCRIPTION
-from .utils import ckresult, prepare_str, check_type
+from .utils import ckresult, prepare_array, prepare_str, check_type
 
 class Listener:
     """A 3D sound listener."""
@@ -236,6 +237,36 @@ class ThreedSettings:
         self._rolloffscale = rscale
 
 
+# SoundOpeners used by System.open_sound_async, by pointer value of the system
+_sound_openers = {}
+
+
+def _indices_within(coords, center, distance):
+    """Indices of the positions within a distance of a point.
+
+    :param memoryview coords: Positions as three 32 bit floats each.
+    :param center: The point.
+    :type center: list of three coordinate floats
+    :param float distance: The distance.
+    :rtype: list of int
+    """
+    limit = distance * distance
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        cx, cy, cz = center
+        points = zip(coords[0::3], coords[1::3], coords[2::3])
+        return [
+            index
+            for index, (x, y, z) in enumerate(points)
+            if (x - cx) * (x - cx) + (y - cy) * (y - cy) + (z - cz) * (z - cz) <= limit
+        ]
+    offsets = numpy.frombuffer(coords, numpy.float32).reshape(-1, 3)
+    offsets = offsets - numpy.asarray(center, numpy.float64)
+    squared = numpy.einsum("ij,ij->i", offsets, offsets)
+    return numpy.flatnonzero(squared <= limit).tolist()
+
+
 class System(FmodObject):  # pylint: disable=too-many-public-methods
     """Management object from which all resources are created and played."""
 
@@ -361,7 +392,7 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         name = prepare_str(name)
         cgp = c_void_p()
         ckresult(_dll.FMOD_System_CreateChannelGroup(self._ptr, name, byref(cgp)))
-        return get_class("ChannelGroup")(cgp)
+        return get_class("ChannelGroup")._from_handle(cgp)
 
     def create_dsp(self, dspdesc):
         """Create a DSP object given a plugin description structure.
@@ -598,6 +629,36 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         )
         return get_class("Sound")(snd_ptr)
 
+    async def open_sound_async(
+        self, name_or_addr, mode=MODE.THREED, exinfo=None, opener=None
+    ):
+        """Open a sound without blocking, returning once it is ready.
+
+        The sound is created with :py:attr:`~pyfmodex.flags.MODE.NONBLOCKING`
+        by a :py:class:`~pyfmodex.aio.SoundOpener`. Unless one is given, the
+        opener shared by all wrappers of this system is used, which limits the
+        number of sounds being opened at once to 16 per event loop.
+
+        :param str name_or_addr: Name of the file or URL to open, or the
+            address of a sound memory block, see :py:meth:`create_sound`.
+        :param MODE mode: Behavior modifier for opening the sound.
+        :param CREATESOUNDEXINFO exinfo: Extended information for creating the
+            sound.
+        :param SoundOpener opener: Opener to open the sound with, for another
+            limit.
+        :returns: The ready sound.
+        :rtype: Sound
+        :raises FmodError: when the sound could not be opened.
+        """
+        if opener is None:
+            try:
+                opener = _sound_openers[self._ptr.value]
+            except KeyError:
+                from .aio import SoundOpener  # pylint: disable=import-outside-toplevel
+
+                opener = _sound_openers[self._ptr.value] = SoundOpener(self)
+        return await opener.open(name_or_addr, mode, exinfo)
+
     def create_sound_group(self, name):
         """Create a SoundGroup object.
 
@@ -747,7 +808,7 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         """
         c_ptr = c_void_p()
         ckresult(_dll.FMOD_System_GetChannel(self._ptr, aaidee, byref(c_ptr)))
-        return get_class("Channel")(c_ptr)
+        return get_class("Channel")._from_handle(c_ptr)
 
     @property
     def channels_playing(self):
@@ -1021,6 +1082,98 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         )
         return so(direct=direct.value, reverb=reverb.value)
 
+    def get_geometry_occlusion_batch(
+        self,
+        listener,
+        sources,
+        direct=None,
+        reverb=None,
+        max_distance=None,
+        executor=None,
+        chunk_size=1024,
+    ):
+        """Calculate geometry occlusion between a listener and many sound
+        sources.
+
+        Works like :py:meth:`get_geometry_occlusion` for every source, without
+        creating Python objects per source. The occlusion values are written
+        into the given output arrays, or into new ones.
+
+        :param list listener: The listener position.
+        :param sources: Source positions, three 32 bit floats per source, as a
+            contiguous object supporting the buffer protocol like an
+            array.array of type "f" or a float32 NumPy array of shape (n, 3).
+        :param direct: Writable array of 32 bit floats with an item per
+            source receiving the direct occlusion values, like an array.array
+            of type "f" or a float32 NumPy array.
+        :param reverb: Writable array of 32 bit floats with an item per
+            source receiving the reverb occlusion values.
+        :param float max_distance: Sources farther away from the listener are
+            skipped, leaving their output values unchanged. None to calculate
+            the occlusion of all sources.
+        :param executor: A :py:class:`concurrent.futures.Executor`, like a
+            ThreadPoolExecutor, to calculate chunks of sources on. FMOD
+            serializes API calls, so this offers no speedup over calculating
+            them in the calling thread.
+        :param int chunk_size: Number of sources per chunk given to the
+            executor.
+        :returns: The direct and reverb occlusion arrays.
+        :rtype: two-tuple
+        :raises ValueError: when the arrays do not match the number of
+            sources.
+        """
+        source_view = memoryview(sources)
+        if source_view.format.lstrip("<=@") != "f":
+            raise ValueError("Source positions must be 32 bit floats")
+        source_data = source_view.cast("B")
+        if len(source_data) % sizeof(VECTOR):
+            raise ValueError("Source data does not consist of three floats per source")
+        count = len(source_data) // sizeof(VECTOR)
+        if direct is None:
+            direct = array("f", bytes(4 * count))
+        if reverb is None:
+            reverb = array("f", bytes(4 * count))
+        outputs = []
+        for output in (direct, reverb):
+            output = memoryview(output)
+            if output.format.lstrip("<=@") != "f" or output.nbytes != 4 * count:
+                raise ValueError("Output array does not have a float per source")
+            outputs.append((c_float * count).from_buffer(output.cast("B")))
+        direct_array, reverb_array = outputs
+        source_array = (VECTOR * count).from_buffer_copy(source_data)
+        listener_vector = VECTOR.from_list(listener)
+
+        if max_distance is None:
+            indices = range(count)
+        else:
+            indices = _indices_within(source_data.cast("f"), listener, max_distance)
+
+        def occlude(chunk):
+            occlusion = _dll.FMOD_System_GetGeometryOcclusion
+            ptr = self._ptr
+            listener_ref = byref(listener_vector)
+            for index in chunk:
+                result = occlusion(
+                    ptr,
+                    listener_ref,
+                    byref(source_array, 12 * index),
+                    byref(direct_array, 4 * index),
+                    byref(reverb_array, 4 * index),
+                )
+                if result:
+                    ckresult(result)
+
+        if executor is None:
+            occlude(indices)
+        else:
+            chunks = [
+                indices[start : start + chunk_size]
+                for start in range(0, len(indices), chunk_size)
+            ]
+            for _ in executor.map(occlude, chunks):
+                pass
+        return direct, reverb
+
     @property
     def geometry_max_world_size(self):
         """The maximum world size for the geometry engine from the centerpoint
@@ -1063,7 +1216,7 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         """
         grp_ptr = c_void_p()
         ckresult(_dll.FMOD_System_GetMasterChannelGroup(self._ptr, byref(grp_ptr)))
-        return get_class("ChannelGroup")(grp_ptr)
+        return get_class("ChannelGroup")._from_handle(grp_ptr)
 
     @property
     def master_sound_group(self):
@@ -1744,16 +1897,30 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         faster start time.
 
         :param data: Pre-saved geometry data from
-            :py:meth:`~pyfmodex.geometry.Geometry.save`.
+            :py:meth:`~pyfmodex.geometry.Geometry.save`, as bytes or any
+            object supporting the buffer protocol, like an mmap. Writable
+            buffers and bytes are passed to FMOD without copying them.
         :returns: Newly created geometry object.
         :rtype: Geometry
         """
-        cdata = create_string_buffer(data)
-        print(len(data))
+        with memoryview(data) as view:
+            size = view.nbytes
+            readonly = view.readonly
+        if isinstance(data, bytes):
+            cdata = data
+        elif readonly:
+            cdata = (c_char * size).from_buffer_copy(data)
+        else:
+            cdata = (c_char * size).from_buffer(data)
         geo_ptr = c_void_p()
-        ckresult(
-            _dll.FMOD_System_LoadGeometry(self._ptr, cdata, len(data), byref(geo_ptr))
-        )
+        try:
+            ckresult(
+                _dll.FMOD_System_LoadGeometry(self._ptr, cdata, size, byref(geo_ptr))
+            )
+        finally:
+            # Keep a raised error from pinning the buffer, an mmap could not
+            # be closed while it is exported
+            del cdata
         return get_class("Geometry")(geo_ptr)
 
     def load_plugin(self, filename, priority):
@@ -1875,7 +2042,7 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         self._call_fmod(
             "FMOD_System_PlayDSP", dsp._ptr, group_ptr, paused, byref(c_ptr)
         )
-        return get_class("Channel")(c_ptr)
+        return get_class("Channel")._from_handle(c_ptr)
 
     def play_sound(self, snd, channel_group=None, paused=False):
         """Play a Sound on a Channel.
@@ -1922,7 +2089,7 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
                 self._ptr, snd._ptr, group_ptr, paused, byref(c_ptr)
             )
         )
-        return get_class("Channel")(c_ptr)
+        return get_class("Channel")._from_handle(c_ptr)
 
     def record_start(self, aaidee, snd, loop=False):
         """Start the recording engine recording to a pre-created Sound object.
@@ -2021,8 +2188,54 @@ class System(FmodObject):  # pylint: disable=too-many-public-methods
         This will internally call :py:meth:`close`, so calling :py:meth:`close`
         before this function is not necessary.
         """
+        _sound_openers.pop(self._ptr.value, None)
+        for name in ("Channel", "ChannelGroup"):
+            get_class(name)._forget_system(self)
         ckresult(_dll.FMOD_System_Release(self._ptr))
 
+    def set_3d_attributes_batch(self, channels, positions, velocities=None):
+        """Set the 3D position and optionally the velocity of many Channels or
+        ChannelGroups at once.
+
+        The coordinates are read straight from the given buffers, so moving
+        many emitters per frame does not need any per channel vector objects
+        nor reading back the current attributes first.
+
+        :param channels: Channels or ChannelGroups to update.
+        :type channels: sequence of ChannelControl
+        :param positions: N x 3 positions, one [x, y, z] row per channel, as
+            a contiguous float32 buffer (:py:class:`array.array` of type 'f',
+            NumPy array, memoryview) or a sequence of coordinate lists.
+        :param velocities: N x 3 velocities in the same layout as `positions`,
+            or None to leave the velocities unchanged.
+        :raises ValueError: when the buffers do not hold three coordinates per
+            channel.
+        :raises FmodError: when updating a channel fails, for example because
+            it has already stopped. Channels preceding it in `channels` are
+            updated already.
+        """
+        count = len(channels)
+        positions = prepare_array(positions, c_float)
+        if len(positions) != count * 3:
+            raise ValueError(
+                "Expected %d position coordinates, got %d" % (count * 3, len(positions))
+            )
+        if velocities is not None:
+            velocities = prepare_array(velocities, c_float)
+            if len(velocities) != count * 3:
+                raise ValueError(
+                    "Expected %d velocity coordinates, got %d"
+                    % (count * 3, len(velocities))
+                )
+        stride = sizeof(VECTOR)
+        for index, channel in enumerate(channels):
+            offset = index * stride
+            channel._call_specific(
+                "Set3DAttributes",
+                byref(positions, offset),
+                None if velocities is None else byref(velocities, offset),
+            )
+
     def set_3d_rolloff_callback(self, callback):
         """Set a callback to allow custom calculation of distance
         attenuation.
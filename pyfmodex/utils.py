@@ -1,20 +1,25 @@
 """Util functions."""
 
 import sys
+from ctypes import c_float, c_int, c_long, sizeof
 
-from .enums import RESULT
 from .exceptions import FmodError
 
 
 def ckresult(result):
     """Check if the result of our C API call is OK.
 
-    :param RESULT result: C API call return code.
+    The return code is compared as a plain integer first, so the
+    :py:class:`~pyfmodex.enums.RESULT` enum member is only looked up, and the
+    enums module only imported, when the call failed.
+
+    :param int result: C API call return code.
     :raises FmodError: when return code from C API call is not OK.
     """
-    result = RESULT(result)
-    if result is not RESULT.OK:
-        raise FmodError(result)
+    if result:
+        from .enums import RESULT  # pylint: disable=import-outside-toplevel
+
+        raise FmodError(RESULT(result))
 
 
 def check_type(obj, cls, msg="Bad type of passed argument (%s), expected %s"):
@@ -45,3 +50,48 @@ def prepare_str(string, encoding=None):
     if hasattr(string, "encode"):
         return string.encode(encoding)
     return string
+
+
+# Buffer protocol item formats which can be shared with a ctypes array as is.
+_BUFFER_FORMATS = {c_float: {"f"}, c_int: {"i"}}
+if sizeof(c_long) == sizeof(c_int):
+    _BUFFER_FORMATS[c_int].add("l")
+
+
+def prepare_array(data, ctype=c_float):
+    """Make a flat ctypes array from a block of numbers.
+
+    Contiguous objects supporting the buffer protocol with items matching
+    `ctype` (for example an :py:class:`array.array`, a NumPy array or a
+    memoryview) are used directly without copying their data, unless they are
+    read-only, in which case they are copied once. Any other sequence,
+    including sequences of sequences like a list of [x, y, z] lists, is
+    flattened and copied.
+
+    :param data: The numbers.
+    :param ctype: Type of the array items, c_float or c_int.
+    :returns: Array of all numbers in `data` in row-major order.
+    :rtype: ctypes array
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        view = None
+    if view is not None and view.c_contiguous and view.itemsize == sizeof(ctype):
+        fmt = view.format.lstrip("@=")
+        if sys.byteorder == "little":
+            fmt = fmt.lstrip("<")
+        if fmt in _BUFFER_FORMATS[ctype]:
+            array_type = ctype * (view.nbytes // view.itemsize)
+            if view.readonly:
+                return array_type.from_buffer_copy(view)
+            return array_type.from_buffer(view)
+    if view is not None:
+        data = view.tolist()
+    values = []
+    for item in data:
+        if hasattr(item, "__len__"):
+            values.extend(item)
+        else:
+            values.append(item)
+    return (ctype * len(values))(*values)
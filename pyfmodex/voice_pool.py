@@ -0,0 +1,175 @@
+"""Voice management with game side priorities on top of the virtual Channel
+system.
+"""
+
+from .enums import SOUNDGROUP_BEHAVIOR
+from .exceptions import FmodError
+
+
+class VoicePool:
+    """A limited set of voices for playing many short sounds, with the voices
+    to give up chosen by priority and audibility.
+
+    FMOD virtualizes Channels on its own once more are playing than there are
+    real ones, based on the :py:attr:`~pyfmodex.channel.Channel.priority` and
+    audibility it knows of. A VoicePool additionally caps the number of
+    Channels it plays itself. When a sound is started while all voices are in
+    use, the pool stops the voice least worth keeping: a virtual one before an
+    audible one, and among those the one with the lowest
+    :py:attr:`~pyfmodex.channel_control.ChannelControl.audibility`. Voices
+    with a more important priority than the new sound are never stolen, if
+    there is no other voice the new sound is rejected instead.
+
+    Identical sounds started more than a given number of times in the same
+    frame are throttled, since playing them at once is rarely audible as more
+    than a louder single sound. A frame ends with :py:meth:`update`, which
+    should be called along with :py:meth:`~pyfmodex.system.System.update`.
+
+    The ChannelGroups the voices play on are created up front and reused, as
+    are the wrappers of the Channels for as long as they play. The number of
+    stolen, rejected and throttled voices is counted in :py:attr:`stolen`,
+    :py:attr:`rejected` and :py:attr:`throttled`.
+    """
+
+    def __init__(self, system, max_voices=32, groups=("default",), per_frame=1):
+        """Constructor.
+
+        :param System system: System to play the sounds with.
+        :param int max_voices: Maximum number of voices playing at once.
+        :param groups: Names of the ChannelGroups to create, the first one is
+            the default group to play on.
+        :type groups: iterable of str
+        :param int per_frame: Number of times the same sound may be started on
+            the same group in a frame, or 0 for no limit.
+        """
+        self.system = system
+        self.max_voices = max_voices
+        self.per_frame = per_frame
+        self.groups = {name: system.create_channel_group(name) for name in groups}
+        self._default_group = next(iter(self.groups.values()))
+        self._sound_groups = []
+        self._voices = []
+        self._started = {}
+        self.stolen = 0
+        self.rejected = 0
+        self.throttled = 0
+
+    def __len__(self):
+        return len(self._voices)
+
+    @property
+    def voices(self):
+        """The Channels started by the pool that were playing at the last
+        :py:meth:`update`, or started since.
+
+        :type: list of Channel
+        """
+        return list(self._voices)
+
+    def limit(self, sound, max_audible, behavior=SOUNDGROUP_BEHAVIOR.STEALLOWEST):
+        """Limit the number of audible playbacks of a sound.
+
+        The sound is moved to a newly created
+        :py:class:`~pyfmodex.sound_group.SoundGroup`, which is released along
+        with the pool.
+
+        :param Sound sound: Sound to limit.
+        :param int max_audible: Number of playbacks that may be audible at
+            once.
+        :param SOUNDGROUP_BEHAVIOR behavior: What happens to playbacks beyond
+            the limit.
+        :returns: Group of the sound.
+        :rtype: SoundGroup
+        """
+        sound_group = self.system.create_sound_group("voice pool")
+        sound_group.max_audible = max_audible
+        sound_group.max_audible_behavior = behavior
+        sound.sound_group = sound_group
+        self._sound_groups.append(sound_group)
+        return sound_group
+
+    def _playing(self, channel):
+        try:
+            return channel.is_playing
+        except FmodError:
+            # Ended channels become invalid, stolen ones report so
+            return False
+
+    def _victim(self, priority):
+        """Voice to steal for a sound of the given priority, or None."""
+        victim = None
+        victim_key = None
+        for channel in self._voices:
+            try:
+                if channel.priority < priority:
+                    continue
+                key = (not channel.is_virtual, channel.audibility, -channel.priority)
+            except FmodError:
+                # Ended after the last update, take it right away
+                return channel
+            if victim is None or key < victim_key:
+                victim = channel
+                victim_key = key
+        return victim
+
+    def play(self, sound, group=None, priority=128, paused=False):
+        """Play a Sound on one of the voices.
+
+        :param Sound sound: Sound to play.
+        :param str group: Name of the group to play on, defaults to the first
+            group.
+        :param int priority: Priority of the voice, from 0 (most important)
+            to 256 (least important).
+        :param bool paused: Whether to start in the paused state, to set up
+            the Channel before it is audible.
+        :returns: The playing Channel, or None when the sound was throttled
+            or rejected.
+        :rtype: Channel
+        """
+        channel_group = self._default_group if group is None else self.groups[group]
+        key = (sound._ptr.value, channel_group._ptr.value)
+        count = self._started.get(key, 0)
+        if self.per_frame and count >= self.per_frame:
+            self.throttled += 1
+            return None
+        if len(self._voices) >= self.max_voices:
+            victim = self._victim(priority)
+            if victim is None:
+                self.rejected += 1
+                return None
+            self._voices.remove(victim)
+            try:
+                victim.stop()
+                self.stolen += 1
+            except FmodError:
+                pass
+        channel = self.system.play_sound(sound, channel_group, paused=True)
+        channel.priority = priority
+        if not paused:
+            channel.paused = False
+        self._voices.append(channel)
+        self._started[key] = count + 1
+        return channel
+
+    def update(self):
+        """End the frame, forgetting the sounds started in it and the voices
+        that stopped playing.
+        """
+        self._started.clear()
+        self._voices = [channel for channel in self._voices if self._playing(channel)]
+
+    def stop(self):
+        """Stop all voices."""
+        for channel_group in self.groups.values():
+            channel_group.stop()
+        self._voices.clear()
+
+    def release(self):
+        """Stop all voices and release the groups created by the pool."""
+        self.stop()
+        for channel_group in self.groups.values():
+            channel_group.release()
+        for sound_group in self._sound_groups:
+            sound_group.release()
+        self.groups.clear()
+        self._sound_groups.clear()
@@ -1,22 +1,20 @@
+import asyncio
 import os
 import platform
 
 import pyfmodex
 import pyfmodex.studio
 import pytest
-from pyfmodex.enums import DSP_TYPE, DSPCONNECTION_TYPE, SPEAKERMODE
-from pyfmodex.studio.enums import LOADING_STATE
+from pyfmodex.enums import DSP_TYPE, DSPCONNECTION_TYPE, OUTPUTTYPE, SPEAKERMODE
 from pyfmodex.flags import MODE
+from pyfmodex.structobject import Structobject as so
 from pyfmodex.structures import CREATESOUNDEXINFO
 from pyfmodex.utils import prepare_str
 
 
 @pytest.fixture(scope="session")
 def instance(system_with_banks, event):
-    event.load_sample_data()
-    system_with_banks.flush_commands()
-    while event.sample_loading_state is not LOADING_STATE.LOADED:
-        pass
+    asyncio.run(event.load_sample_data_async(system_with_banks))
     yield event.create_instance()
 
 
@@ -83,6 +81,19 @@ def initialized_system():
     system.release()
 
 
+@pytest.fixture
+def nrt_system():
+    system = pyfmodex.System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.software_format = so(
+        sample_rate=48000, speaker_mode=SPEAKERMODE.STEREO, raw_speakers=0
+    )
+    system.dsp_buffer_size.size = 512
+    system.init()
+    yield system
+    system.release()
+
+
 @pytest.fixture
 def sound(initialized_system):
     sound = initialized_system.create_sound(
@@ -92,6 +103,15 @@ def sound(initialized_system):
     sound.release()
 
 
+@pytest.fixture
+def openonly_sound(initialized_system):
+    sound = initialized_system.create_sound(
+        os.path.join(os.path.dirname(__file__), "test.fsb"), MODE.OPENONLY
+    )
+    yield sound
+    sound.release()
+
+
 @pytest.fixture
 def channel(sound):
     channel = sound.get_subsound(0).play(paused=True)
@@ -1,7 +1,17 @@
+from pyfmodex.studio.enums import LOADING_STATE
+
 def test_event_count(bank):
     assert bank.event_count == 1
 
 def test_events(bank):
     events = bank.events
     assert len(events) == 1
-    assert events[0].path == "event:/Vehicles/Car Engine"
\ No newline at end of file
+    assert events[0].path == "event:/Vehicles/Car Engine"
+
+def test_loading_state(bank):
+    assert bank.loading_state is LOADING_STATE.LOADED
+
+def test_load_sample_data(system_with_banks, bank):
+    bank.load_sample_data()
+    system_with_banks.flush_sample_loading()
+    assert bank.sample_loading_state is LOADING_STATE.LOADED
@@ -1,3 +1,7 @@
+import asyncio
+
+from pyfmodex.studio.enums import LOADING_STATE
+
 def test_path(event):
     assert event.path == "event:/Vehicles/Car Engine"
 
@@ -9,4 +13,22 @@ def test_parameter_description_count(event):
     assert event.parameter_description_count == 8
 
 def test_user_property_count(event):
-    assert event.user_property_count == 0
\ No newline at end of file
+    assert event.user_property_count == 0
+
+def test_get_parameter_description(event):
+    description = event.get_parameter_description_by_name("rpm")
+    assert description.name == b"RPM"
+    assert description.maximum == 10000.0
+    by_index = event.get_parameter_description_by_index(2)
+    assert by_index.id == description.id
+
+def test_get_parameter_id(event):
+    parameter_id = event.get_parameter_id("RPM")
+    assert event.get_parameter_id("rpm") is parameter_id
+    assert parameter_id == event.get_parameter_description_by_name("rpm").id
+    ids = event.get_parameter_ids(["rpm", "load"])
+    assert list(ids) == [parameter_id, event.get_parameter_id("Load")]
+
+def test_load_sample_data_async(system_with_banks, event):
+    asyncio.run(event.load_sample_data_async(system_with_banks))
+    assert event.sample_loading_state is LOADING_STATE.LOADED
@@ -1,4 +1,5 @@
 import time
+import pytest
 from pyfmodex.studio.enums import PLAYBACK_STATE
 
 def test_start(instance):
@@ -29,4 +30,22 @@ def test_set_parameter_by_name(instance):
 
 def test_channel_group(system_with_banks, instance):
     system_with_banks.flush_commands()
-    group = instance.channel_group
\ No newline at end of file
+    group = instance.channel_group
+
+
+def test_set_parameter_by_id(event, instance):
+    parameter_id = event.get_parameter_id("rpm")
+    instance.set_parameter_by_id(parameter_id, 4000)
+    assert instance.get_parameter_by_id(parameter_id)[0] == 4000.0
+    assert instance.get_parameter_by_name("rpm")[0] == 4000.0
+
+
+def test_set_parameters_by_ids(event, instance):
+    ids = event.get_parameter_ids(["rpm", "load"])
+    instance.set_parameters_by_ids(ids, [2000, -0.5])
+    assert instance.get_parameter_by_name("rpm")[0] == 2000.0
+    assert instance.get_parameter_by_name("load")[0] == -0.5
+    instance.set_parameters_by_ids(list(ids), [3000, 0.5])
+    assert instance.get_parameter_by_id(ids[1])[0] == 0.5
+    with pytest.raises(ValueError):
+        instance.set_parameters_by_ids(ids, [1000])
@@ -1,5 +1,12 @@
+import asyncio
 import os
 
+import pytest
+from pyfmodex.enums import RESULT
+from pyfmodex.exceptions import FmodError
+from pyfmodex.studio.enums import LOADING_STATE
+from pyfmodex.studio.utils import wait_until_loaded
+
 BANK_FILE = os.path.join(os.path.dirname(__file__), "..", "Vehicles.bank")
 
 def test_initialize(studio_system):
@@ -44,5 +51,36 @@ def test_load_bank_file(initialized_studio_system):
     bank = initialized_studio_system.load_bank_file(BANK_FILE)
     assert bank.event_count == 1
 
+def test_load_bank_async(initialized_studio_system):
+    bank = asyncio.run(initialized_studio_system.load_bank_async(BANK_FILE))
+    assert bank.loading_state is LOADING_STATE.LOADED
+    assert bank.event_count == 1
+
+def test_load_bank_async_missing(initialized_studio_system):
+    with pytest.raises(FmodError):
+        asyncio.run(initialized_studio_system.load_bank_async(BANK_FILE + ".missing"))
+
+def test_load_bank_async_corrupt(initialized_studio_system, tmp_path):
+    path = tmp_path / "corrupt.bank"
+    with open(BANK_FILE, "rb") as bank_file:
+        path.write_bytes(bank_file.read(64) + bytes(2000))
+    with pytest.raises(FmodError) as excinfo:
+        asyncio.run(initialized_studio_system.load_bank_async(str(path)))
+    assert excinfo.value.result is RESULT.FILE_BAD
+    initialized_studio_system.flush_commands()
+    assert initialized_studio_system.bank_count == 0
+
+def test_wait_until_loaded_result():
+    def get_state():
+        raise FmodError(RESULT.FORMAT)
+    with pytest.raises(FmodError) as excinfo:
+        asyncio.run(wait_until_loaded(get_state, poll_interval=0))
+    assert excinfo.value.result is RESULT.FORMAT
+
+def test_wait_until_loaded_error():
+    states = iter([LOADING_STATE.LOADING, LOADING_STATE.ERROR])
+    with pytest.raises(RuntimeError):
+        asyncio.run(wait_until_loaded(lambda: next(states), poll_interval=0))
+
 def test_event(system_with_banks):
     assert system_with_banks.get_event("event:/Vehicles/Car Engine").path == "event:/Vehicles/Car Engine"
\ No newline at end of file
@@ -0,0 +1,200 @@
+import asyncio
+import os
+import time
+
+import pytest
+from pyfmodex import System
+from pyfmodex.aio import SoundOpener, UpdateDriver
+from pyfmodex.callback_prototypes import SOUND_NONBLOCKCALLBACK
+from pyfmodex.enums import OPENSTATE, RESULT
+from pyfmodex.exceptions import FmodError
+from pyfmodex.flags import MODE
+from pyfmodex.structures import CREATESOUNDEXINFO
+
+SOUND_FILE = os.path.join(os.path.dirname(__file__), "test.fsb")
+
+
+class SlowSystem:
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+        if self.delays:
+            time.sleep(self.delays.pop(0))
+
+
+class FailingSystem:
+    def __init__(self, updates):
+        self.updates = updates
+
+    def update(self):
+        if not self.updates:
+            raise FmodError(RESULT.INVALID_HANDLE)
+        self.updates -= 1
+
+
+def test_next_update():
+    system = SlowSystem([])
+
+    async def main():
+        async with UpdateDriver(system, rate=200) as driver:
+            for _ in range(3):
+                await driver.next_update()
+        return driver
+
+    driver = asyncio.run(main())
+    assert system.updates >= 3
+    assert driver.ticks == system.updates
+    assert not driver.running
+
+
+def test_missed_ticks():
+    system = SlowSystem([0, 0.055])
+
+    async def main():
+        async with UpdateDriver(system, rate=100) as driver:
+            await driver.wait_for(lambda: system.updates >= 3)
+        return driver
+
+    driver = asyncio.run(main())
+    assert driver.missed >= 4
+    assert driver.max_duration >= 0.05
+    assert driver.last_duration < driver.max_duration
+    assert 0 < driver.mean_duration < driver.max_duration
+    driver.reset_stats()
+    assert driver.ticks == driver.missed == 0
+
+
+def test_wait_for_timeout():
+    async def main():
+        async with UpdateDriver(SlowSystem([]), rate=100) as driver:
+            await driver.wait_for(lambda: False, timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(main())
+
+
+@pytest.mark.parametrize("thread", [False, True])
+def test_failed_update(thread):
+    driver = UpdateDriver(FailingSystem(2), rate=200)
+
+    async def main():
+        if thread:
+            driver.start_thread()
+        else:
+            driver.start()
+        try:
+            await driver.wait_for(lambda: False, timeout=5)
+        finally:
+            driver.stop()
+
+    with pytest.raises(FmodError) as excinfo:
+        asyncio.run(main())
+    assert excinfo.value.result is RESULT.INVALID_HANDLE
+    assert driver.error is excinfo.value
+    assert driver.ticks == 2
+    assert not driver.running
+
+
+def test_thread(nrt_system):
+    sound = nrt_system.create_sound(SOUND_FILE, MODE.NONBLOCKING)
+    driver = UpdateDriver(nrt_system, rate=200)
+
+    async def main():
+        await driver.sound_ready(sound, timeout=5)
+        channel = sound.get_subsound(0).play()
+        channel.stop()
+        await driver.channel_ended(channel, timeout=5)
+
+    driver.start_thread()
+    with pytest.raises(RuntimeError):
+        driver.start_thread()
+    try:
+        asyncio.run(main())
+    finally:
+        driver.stop()
+    assert driver.ticks
+    sound.release()
+
+
+def test_open_sound_async(nrt_system):
+    sound = asyncio.run(nrt_system.open_sound_async(SOUND_FILE))
+    assert sound.open_state.state is OPENSTATE.READY
+    assert sound.num_subsounds == 2
+    sound.release()
+
+
+def test_open_sound_async_missing(nrt_system):
+    with pytest.raises(FmodError):
+        asyncio.run(nrt_system.open_sound_async(SOUND_FILE + ".missing"))
+
+
+def test_open_sound_async_shared(nrt_system):
+    sounds = [asyncio.run(nrt_system.open_sound_async(SOUND_FILE)) for _ in range(2)]
+    other = System(nrt_system._ptr)
+    sounds.append(asyncio.run(other.open_sound_async(SOUND_FILE)))
+    opener = SoundOpener(nrt_system)
+    sounds.append(asyncio.run(nrt_system.open_sound_async(SOUND_FILE, opener=opener)))
+    assert opener.in_flight == 0
+    for sound in sounds:
+        assert sound.open_state.state is OPENSTATE.READY
+        sound.release()
+
+
+def test_open_sound_async_corrupt(nrt_system, tmp_path):
+    path = tmp_path / "corrupt.wav"
+    path.write_bytes(b"RIFF" + bytes(300))
+    with pytest.raises(FmodError) as excinfo:
+        asyncio.run(nrt_system.open_sound_async(str(path)))
+    assert excinfo.value.result is RESULT.FORMAT
+
+    exinfo = CREATESOUNDEXINFO()
+    exinfo.nonblockcallback = SOUND_NONBLOCKCALLBACK(lambda sound, result: 0)
+    opener = SoundOpener(nrt_system, poll_interval=0.001)
+    with pytest.raises(FmodError) as excinfo:
+        asyncio.run(opener.open(str(path), exinfo=exinfo))
+    assert excinfo.value.result is RESULT.FORMAT
+
+
+def test_sound_opener_limit(nrt_system):
+    opener = SoundOpener(nrt_system, max_concurrent=3)
+    peak = 0
+
+    async def slow_open(name_or_addr, mode, exinfo):
+        nonlocal peak
+        peak = max(peak, opener.in_flight)
+        await asyncio.sleep(0.01)
+        return nrt_system.create_sound(name_or_addr, mode, exinfo)
+
+    opener._open = slow_open
+
+    async def main():
+        return await asyncio.gather(
+            *(opener.open(SOUND_FILE, MODE.CREATESTREAM) for _ in range(10))
+        )
+
+    # Each event loop gets a semaphore of its own
+    sounds = asyncio.run(main()) + asyncio.run(main())
+    assert len(sounds) == 20
+    assert peak == 3
+    assert opener.in_flight == 0
+    for sound in sounds:
+        sound.release()
+
+
+def test_sound_opener_polling(nrt_system):
+    called = []
+
+    def callback(sound, result):
+        called.append(result)
+        return 0
+
+    exinfo = CREATESOUNDEXINFO()
+    exinfo.nonblockcallback = SOUND_NONBLOCKCALLBACK(callback)
+    opener = SoundOpener(nrt_system, poll_interval=0.001)
+    sound = asyncio.run(opener.open(SOUND_FILE, exinfo=exinfo))
+    assert sound.open_state.state is OPENSTATE.READY
+    assert called == [0]
+    sound.release()
@@ -0,0 +1,41 @@
+import math
+import os
+from array import array
+
+import pytest
+from pyfmodex import batch
+from pyfmodex.enums import SOUND_FORMAT
+from pyfmodex.exceptions import FmodError
+from pyfmodex.structobject import Structobject as so
+
+SOUND_FILE = os.path.join(os.path.dirname(__file__), "test.fsb")
+MISSING_FILE = os.path.join(os.path.dirname(__file__), "missing.fsb")
+
+
+def test_map_files_duration():
+    results = list(batch.map_files([SOUND_FILE] * 3, batch.duration, max_workers=2))
+    assert [path for path, _ in results] == [SOUND_FILE] * 3
+    assert all(result == pytest.approx(1448192 / 44100) for _, result in results)
+
+
+def test_map_files_levels():
+    (_, peak), = batch.map_files([SOUND_FILE], batch.peak, max_workers=1)
+    (_, rms), = batch.map_files([SOUND_FILE], batch.rms, max_workers=1)
+    assert 0 < rms < peak <= 1
+
+
+def test_map_files_exceptions():
+    paths = [MISSING_FILE, SOUND_FILE]
+    results = dict(batch.map_files(paths, batch.duration, max_workers=1, return_exceptions=True))
+    assert isinstance(results[MISSING_FILE], FmodError)
+    assert results[SOUND_FILE] > 0
+    with pytest.raises(FmodError):
+        list(batch.map_files(paths, batch.duration, max_workers=1))
+
+
+def test_levels_reducers():
+    info = so(format=SOUND_FORMAT.PCM16)
+    chunks = [array("h", [16384, -16384, 0, 0]), array("h"), array("h", [-32768, 0])]
+    assert batch.peak(info, (memoryview(chunk) for chunk in chunks)) == 1.0
+    rms = batch.rms(info, (memoryview(chunk) for chunk in chunks))
+    assert rms == pytest.approx(math.sqrt((2 * 16384 ** 2 + 32768 ** 2) / 6) / 32768)
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+from pyfmodex.callback_queue import ChannelCallbackQueue
+from pyfmodex.enums import CHANNELCONTROL_CALLBACK_TYPE
+
+
+@pytest.fixture
+def sound(nrt_system):
+    sound = nrt_system.create_sound(os.path.join(os.path.dirname(__file__), "test.fsb"))
+    yield sound.get_subsound(0)
+    sound.release()
+
+
+def test_end_notifications(nrt_system, sound):
+    queue = ChannelCallbackQueue()
+    channels = [sound.play() for _ in range(3)]
+    for channel in channels:
+        queue.attach(channel)
+        channel.stop()
+    nrt_system.update()
+    assert len(queue) == 3
+
+    handled = []
+    assert queue.dispatch(handled.append) == 3
+    assert all(record.control is channel for record, channel in zip(handled, channels))
+    assert all(record.type is CHANNELCONTROL_CALLBACK_TYPE.END for record in handled)
+    assert not queue.drain()
+
+
+def test_dropped(nrt_system, sound):
+    queue = ChannelCallbackQueue(capacity=2)
+    for _ in range(3):
+        channel = sound.play()
+        queue.attach(channel)
+        channel.stop()
+    nrt_system.update()
+    assert queue.dropped == 1
+    assert len(queue.drain()) == 2
@@ -0,0 +1,31 @@
+from pyfmodex.capture import CaptureTap
+from pyfmodex.enums import CHANNELCONTROL_DSP_INDEX, DSP_TYPE
+
+
+def test_capture_tap(nrt_system):
+    tap = CaptureTap(nrt_system, capacity=1200)
+    assert tap.channels == 2
+    nrt_system.master_channel_group.add_dsp(CHANNELCONTROL_DSP_INDEX.HEAD, tap.dsp)
+    oscillator = nrt_system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)
+    nrt_system.play_dsp(oscillator)
+
+    nrt_system.update()
+    nrt_system.update()
+    assert tap.available == 1024
+    first = tap.read(max_frames=1000)
+    assert first.shape == (1000, 2)
+    assert any(first[frame, 0] for frame in range(1000))
+    assert tap.available == 24
+
+    # The third block wraps around the end of the ring buffer.
+    nrt_system.update()
+    assert tap.available == 536
+    buffer = bytearray(536 * 8)
+    assert tap.read_into(buffer) == 536
+    assert len(tap.read()) == 0
+    assert tap.overruns == 0
+
+    for _ in range(3):
+        nrt_system.update()
+    assert tap.available == 1024
+    assert tap.overruns == 1
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -130,6 +131,8 @@ def test_frequency(channel):
 
 def test_index(channel):
     assert channel.index == 999
+    with pytest.raises(AttributeError):
+        channel.index = 1
 
 
 def test_loop_count(channel):
@@ -209,6 +212,18 @@ def test_volume(channel):
     assert channel.volume == 0.5
 
 
+def test_volume_threads(channel, channel_group):
+    channel.volume = 0.25
+    channel_group.volume = 0.75
+
+    def volumes(_):
+        return [(channel.volume, channel_group.volume) for _ in range(1000)]
+
+    with ThreadPoolExecutor(4) as executor:
+        for result in executor.map(volumes, range(4)):
+            assert set(result) == {(0.25, 0.75)}
+
+
 def test_volume_ramp(channel):
     assert channel.volume_ramp
     channel.volume_ramp = False
@@ -277,3 +292,12 @@ def test_stop(channel):
 
 def test_set_position(channel):
     channel.set_position(0, TIMEUNIT.MS)
+
+
+def test_set_3d_attributes(channel):
+    channel.set_3d_attributes([1.0, 2.0, 3.0], [0.0, 0.0, 1.0])
+    assert channel.position == [1.0, 2.0, 3.0]
+    assert channel.velocity == [0.0, 0.0, 1.0]
+    channel.set_3d_attributes(None, [1.0, 0.0, 0.0])
+    assert channel.position == [1.0, 2.0, 3.0]
+    assert channel.velocity == [1.0, 0.0, 0.0]
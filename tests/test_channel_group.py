@@ -96,6 +96,9 @@ def test_audibility(channel_group):
 def test_get_channel(channel_group, channel):
     assert channel_group.get_channel(0) == channel
 
+def test_get_channel_same_wrapper(channel_group, channel):
+    assert channel_group.get_channel(0) is channel
+
 def test_get_dsp(channel_group, initialized_system):
     dsp = initialized_system.create_dsp_by_type(DSP_TYPE.ECHO)
     channel_group.add_dsp(0, dsp)
@@ -149,6 +152,7 @@ def test_parent_group(channel_group, initialized_system):
     master_group = initialized_system.master_channel_group
     assert master_group.parent_group is None
     assert channel_group.parent_group == master_group
+    assert channel_group.parent_group is master_group
 
 def test_paused(channel_group):
     assert not channel_group.paused
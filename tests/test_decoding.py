@@ -0,0 +1,36 @@
+import os
+
+import pytest
+from pyfmodex.decoding import iter_pcm, iter_sound_pcm
+
+SOUND_FILE = os.path.join(os.path.dirname(__file__), "test.fsb")
+
+
+def test_iter_pcm(initialized_system):
+    chunks = iter_pcm(initialized_system, SOUND_FILE, chunk_frames=65536)
+    first = next(chunks)
+    assert first.format == "h"
+    assert first.shape == (65536, 2)
+    frames = first.shape[0] + sum(chunk.shape[0] for chunk in chunks)
+    assert frames == 1448192
+
+    chunks = iter_pcm(initialized_system, SOUND_FILE, subsound=1)
+    assert sum(chunk.shape[0] for chunk in chunks) == 998400
+
+
+def test_iter_sound_pcm_reuses_buffer(openonly_sound):
+    subsound = openonly_sound.get_subsound(0)
+    chunks = iter_sound_pcm(subsound, chunk_frames=1024)
+    first, second = next(chunks), next(chunks)
+    assert first.obj is second.obj
+    assert sum(1 for _ in chunks) > 0
+
+
+def test_iter_pcm_numpy(initialized_system):
+    numpy = pytest.importorskip("numpy")
+    chunks = iter_pcm(initialized_system, SOUND_FILE, as_numpy=True)
+    chunk = next(chunks)
+    chunks.close()
+    assert isinstance(chunk, numpy.ndarray)
+    assert chunk.dtype == numpy.int16
+    assert chunk.shape == (4096, 2)
@@ -1,4 +1,9 @@
+import pickle
 import pyfmodex
+import pytest
+from pyfmodex.enums import RESULT
+from pyfmodex.exceptions import FmodError
+from pyfmodex.utils import ckresult
 
 def test_get_set_disk_busy(initialized_system):
     assert not pyfmodex.get_disk_busy()
@@ -9,4 +14,20 @@ def test_get_set_disk_busy(initialized_system):
 def test_get_memory_stats(initialized_system):
     stats = pyfmodex.get_memory_stats(True)
     assert stats.current > 0
-    assert stats.maximum > 0
\ No newline at end of file
+    assert stats.maximum > 0
+
+def test_ckresult():
+    ckresult(RESULT.OK.value)
+    with pytest.raises(FmodError) as excinfo:
+        ckresult(RESULT.INVALID_HANDLE.value)
+    assert excinfo.value.result is RESULT.INVALID_HANDLE
+
+def test_fmod_error_pickle():
+    error = pickle.loads(pickle.dumps(FmodError(RESULT.FILE_NOTFOUND)))
+    assert error.result is RESULT.FILE_NOTFOUND
+    assert str(error) == "FILE NOTFOUND"
+
+def test_lazy_submodules():
+    for name in ("enums", "flags", "structures", "callback_prototypes", "channel_control"):
+        assert getattr(pyfmodex, name).__name__ == "pyfmodex." + name
+    assert "enums" in dir(pyfmodex)
@@ -1,7 +1,60 @@
+from array import array
+
+import pytest
+
+
 def test_add_polygon(geometry):
     idx = geometry.add_polygon(0.5, 0.5, False, (0,0,0), (1,1,0), (1,0,0))
     assert idx == 0
 
+def test_add_mesh(geometry):
+    vertices = array("f", [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0])
+    polygons = geometry.add_mesh(vertices, array("i", [0, 1, 2, 1, 3, 2]), 0.5, 0.25, True)
+    assert polygons == range(0, 2)
+    poly = geometry.get_polygon(1)
+    assert poly.direct_occlusion == 0.5
+    assert poly.reverb_occlusion == 0.25
+    assert poly.double_sided
+    assert [poly.get_vertex(i) for i in range(3)] == [
+        [1.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [0.0, 1.0, 0.0],
+    ]
+    quad = geometry.add_mesh(vertices, None, 1.0, 1.0, False, vertices_per_polygon=4)
+    assert quad == range(2, 3)
+    assert geometry.get_polygon(2).num_vertices == 4
+
+def test_add_mesh_invalid(geometry):
+    vertices = array("f", [0, 0, 0, 1, 0, 0, 0, 1, 0])
+    with pytest.raises(ValueError):
+        geometry.add_mesh(array("d", vertices), None, 1.0, 1.0, False)
+    with pytest.raises(ValueError):
+        geometry.add_mesh(vertices[:-1], None, 1.0, 1.0, False)
+    with pytest.raises(ValueError):
+        geometry.add_mesh(vertices, array("q", [0, 1, 2]), 1.0, 1.0, False)
+    with pytest.raises(ValueError):
+        geometry.add_mesh(vertices, array("i", [0, 1, 3]), 1.0, 1.0, False)
+    with pytest.raises(ValueError):
+        geometry.add_mesh(vertices, array("i", [0, 1]), 1.0, 1.0, False)
+    with pytest.raises(ValueError):
+        geometry.add_mesh(vertices, array("i", [0, 1, 2] * 43), 1.0, 1.0, False)
+    assert geometry.num_polygons == 0
+
+def test_add_mesh_vertex_limit(initialized_system):
+    geometry = initialized_system.create_geometry(4, 6)
+    vertices = array("f", [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0])
+    geometry.add_mesh(vertices, array("i", [0, 1, 2]), 1.0, 1.0, False)
+    with pytest.raises(ValueError):
+        geometry.add_mesh(vertices, array("i", [0, 1, 2, 1, 3, 2]), 1.0, 1.0, False)
+    assert geometry.num_polygons == 1
+    geometry.add_polygon(1.0, 1.0, False, (0, 0, 0), (1, 0, 0), (0, 1, 0))
+    # A new wrapper counts the vertices already in the object
+    loaded = initialized_system.load_geometry(geometry.save())
+    with pytest.raises(ValueError):
+        loaded.add_mesh(vertices, array("i", [0, 1, 2]), 1.0, 1.0, False)
+    loaded.release()
+    geometry.release()
+
 def test_active(geometry):
     assert geometry.active
     geometry.active = False
@@ -61,4 +114,41 @@ def test_release(geometry):
 def test_save_and_load(initialized_system, geometry):
     data = geometry.save()
     geom2 = initialized_system.load_geometry(data)
-    assert geom2.num_polygons == 0
\ No newline at end of file
+    assert geom2.num_polygons == 0
+
+
+def test_get_polygons(geometry):
+    vertices = array("f", [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0])
+    geometry.add_mesh(vertices, array("i", [0, 1, 2, 1, 3, 2]), 0.5, 0.25, True)
+    geometry.add_mesh(vertices, None, 1.0, 1.0, False, vertices_per_polygon=4)
+    polygons = geometry.get_polygons()
+    assert len(polygons) == 3
+    assert list(polygons.direct_occlusion) == [0.5, 0.5, 1.0]
+    assert list(polygons.reverb_occlusion) == [0.25, 0.25, 1.0]
+    assert list(polygons.double_sided) == [1, 1, 0]
+    assert list(polygons.vertex_offsets) == [0, 3, 6, 10]
+    assert polygons.vertices[9:18] == array("f", [1, 0, 0, 1, 1, 0, 0, 1, 0])
+    assert polygons.dirty == []
+    assert polygons.commit() == 0
+
+    polygons.reverb_occlusion[0] = 0.75
+    polygons.double_sided[2] = 1
+    polygons.vertices[3 * 7 + 2] = 0.5
+    assert polygons.dirty == [0, 2]
+    assert polygons.commit() == 2
+    assert polygons.dirty == []
+    assert geometry.get_polygon(0).reverb_occlusion == 0.75
+    assert geometry.get_polygon(0).direct_occlusion == 0.5
+    assert geometry.get_polygon(1).reverb_occlusion == 0.25
+    assert geometry.get_polygon(2).double_sided
+    assert geometry.get_polygon(2).get_vertex(1) == [1.0, 0.0, 0.5]
+
+    tail = geometry.get_polygons(1)
+    assert tail.indices == range(1, 3)
+    assert tail.vertices[3 * 4 : 3 * 5] == array("f", [1, 0, 0.5])
+    tail.direct_occlusion[0] = 0.0
+    tail.refresh()
+    assert tail.dirty == []
+    tail.vertices.append(0.0)
+    with pytest.raises(ValueError):
+        tail.commit()
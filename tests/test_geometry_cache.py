@@ -0,0 +1,68 @@
+import os
+from array import array
+
+import pytest
+from pyfmodex.geometry_cache import GeometryCache
+
+VERTICES = array("f", [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0])
+INDICES = array("i", [0, 1, 2, 1, 3, 2])
+
+
+def test_hit_and_miss(nrt_system, tmp_path):
+    cache = GeometryCache(nrt_system, str(tmp_path))
+    built = cache.get(VERTICES, INDICES, 0.5, 0.25, True)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(cache) == 1
+    assert cache.size == os.path.getsize(next(tmp_path.glob("*.geo")))
+
+    loaded = cache.get(VERTICES, INDICES, 0.5, 0.25, True)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert loaded.num_polygons == built.num_polygons == 2
+    assert loaded.max_polygons == 2
+    assert loaded.get_polygon(1).get_vertex(1) == [1.0, 1.0, 0.0]
+    assert loaded.get_polygon(0).reverb_occlusion == 0.25
+
+    # Other parameters are another entry.
+    cache.get(VERTICES, INDICES, 0.5, 0.5, True)
+    cache.get(VERTICES, None, 0.5, 0.25, True, vertices_per_polygon=4)
+    assert cache.misses == 3
+
+    # The files survive the cache object.
+    again = GeometryCache(nrt_system, str(tmp_path))
+    assert len(again) == 3
+    again.get(VERTICES, INDICES, 0.5, 0.25, True)
+    assert again.hits == 1
+    again.clear()
+    assert not list(tmp_path.glob("*.geo"))
+
+
+def test_eviction(nrt_system, tmp_path):
+    cache = GeometryCache(nrt_system, str(tmp_path))
+    cache.get(VERTICES, INDICES, 0.0, 0.0, False)
+    size = cache.size
+    cache.max_size = 2 * size
+    first = GeometryCache.key(VERTICES, INDICES, 0.0, 0.0, False) + ".geo"
+    os.utime(tmp_path / first, ns=(0, 0))
+    cache.get(VERTICES, INDICES, 0.5, 0.0, False)
+    cache.get(VERTICES, INDICES, 1.0, 0.0, False)
+    assert cache.evictions == 1
+    assert len(cache) == 2
+    assert not (tmp_path / first).exists()
+
+
+def test_damaged_file(nrt_system, tmp_path):
+    cache = GeometryCache(nrt_system, str(tmp_path))
+    cache.get(VERTICES, INDICES, 0.5, 0.25, True)
+    next(tmp_path.glob("*.geo")).write_bytes(b"garbage")
+    assert cache.get(VERTICES, INDICES, 0.5, 0.25, True).num_polygons == 2
+    assert cache.misses == 2
+
+
+def test_empty_file(nrt_system, tmp_path):
+    cache = GeometryCache(nrt_system, str(tmp_path))
+    cache.get(VERTICES, INDICES, 0.5, 0.25, True)
+    path = next(tmp_path.glob("*.geo"))
+    path.write_bytes(b"")
+    assert cache.get(VERTICES, INDICES, 0.5, 0.25, True).num_polygons == 2
+    assert cache.misses == 2
+    assert path.stat().st_size == cache.size > 0
@@ -0,0 +1,41 @@
+import wave
+
+from pyfmodex.enums import DSP_TYPE
+from pyfmodex.render import Renderer
+
+
+def test_render():
+    with Renderer(sample_rate=48000, block_size=512) as renderer:
+        oscillator = renderer.system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)
+        start = renderer.to_clock(0.1)
+        renderer.play_dsp(oscillator, start=start, end=start + 4800)
+        mix = renderer.render(6000)
+        assert mix.shape == (6000, 2)
+        assert not any(mix[frame, 0] for frame in range(start + 1))
+        assert any(mix[frame, 0] for frame in range(start, start + 100))
+        assert renderer.position == 6000
+
+        mix = renderer.render(4000)
+        assert mix.shape == (4000, 2)
+        assert not any(mix[frame, 1] for frame in range(4800 + start - 6000, 4000))
+        assert renderer.position == 10000
+
+
+def test_render_to_file(tmp_path):
+    path = str(tmp_path / "mix.wav")
+    with Renderer(sample_rate=44100, path=path, capture=False) as renderer:
+        oscillator = renderer.system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)
+        renderer.play_dsp(oscillator)
+        assert renderer.render(44100) is None
+    with wave.open(path) as wav:
+        assert wav.getframerate() == 44100
+        assert wav.getnchannels() == 2
+        assert wav.getnframes() >= 44100
+
+
+def test_release_twice():
+    renderer = Renderer(capture=False)
+    renderer.render(100)
+    renderer.release()
+    renderer.release()
+    assert renderer.system is None
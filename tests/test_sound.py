@@ -1,7 +1,10 @@
+from array import array
+
 import pytest
 from pyfmodex.enums import SOUND_TYPE, SOUND_FORMAT, OPENSTATE, RESULT, TIMEUNIT
 from pyfmodex.flags import MODE
 from pyfmodex.exceptions import FmodError
+from pyfmodex.structures import CREATESOUNDEXINFO
 
 def test_add_delete_syncpoint(sound):
     point = sound.add_sync_point(1, TIMEUNIT.MS, "test")
@@ -123,6 +126,29 @@ def test_lock_unlock(sound):
     ret = sound.get_subsound(0).lock(0, 16)
     sound.get_subsound(0).unlock(ret[0], ret[1])
 
+def test_locked(initialized_system):
+    exinfo = CREATESOUNDEXINFO(
+        numchannels=1,
+        defaultfrequency=44100,
+        length=2000,
+        format=SOUND_FORMAT.PCM16.value,
+    )
+    sound = initialized_system.create_sound(0, MODE.OPENUSER, exinfo)
+    with sound.locked(0, 2000) as (view1, view2):
+        assert view1.format == "h"
+        assert len(view1) == 1000
+        assert len(view2) == 0
+        view1[:] = array("h", range(1000))
+    with sound.locked(200, 20) as (view1, view2):
+        assert view1.tolist() == list(range(100, 110))
+    with pytest.raises(ValueError):
+        with sound.locked(1, 4):
+            pass
+    with pytest.raises(ValueError):
+        with sound.locked(0, 3):
+            pass
+    sound.release()
+
 def test_music_speed(midi_sound):
     assert midi_sound.music_speed == 1.0
     midi_sound.music_speed = 0.5
@@ -134,3 +160,10 @@ def test_read_data(sound):
         data, length = sound.get_subsound(0).read_data(20)
         assert ex.result is RESULT.UNSUPPORTED
 
+def test_read_into(openonly_sound):
+    subsound = openonly_sound.get_subsound(0)
+    buf = bytearray(4096)
+    assert subsound.read_into(buf) == 4096
+    assert subsound.read_into(memoryview(buf)[:100]) == 100
+    with pytest.raises(TypeError):
+        subsound.read_into(bytes(10))
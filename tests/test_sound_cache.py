@@ -0,0 +1,69 @@
+import os
+
+import pytest
+from pyfmodex.enums import TIMEUNIT
+from pyfmodex.flags import MODE
+from pyfmodex.sound_cache import SoundCache
+from pyfmodex.structures import CREATESOUNDEXINFO
+
+SOUND_FILE = os.path.join(os.path.dirname(__file__), "test.fsb")
+
+
+def sound_size(system):
+    sound = system.create_sound(SOUND_FILE)
+    size = sum(
+        sound.get_subsound(index).get_length(TIMEUNIT.PCMBYTES) for index in range(2)
+    )
+    sound.release()
+    return size
+
+
+def test_hits_and_misses(nrt_system):
+    cache = SoundCache(nrt_system)
+    sound = cache.get(SOUND_FILE)
+    assert cache.get(SOUND_FILE) is sound
+    assert cache.get(SOUND_FILE, MODE.TWOD) is not sound
+    exinfo = CREATESOUNDEXINFO(initialsubsound=1)
+    assert cache.get(SOUND_FILE, exinfo=exinfo) is not sound
+    assert cache.get(SOUND_FILE, exinfo=CREATESOUNDEXINFO(initialsubsound=1)) is not sound
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert len(cache) == 3
+    assert cache.size == 3 * sound_size(nrt_system)
+    assert cache.get(SOUND_FILE, MODE.CREATESTREAM)
+    assert cache.size == 3 * sound_size(nrt_system)
+    with pytest.raises(ValueError):
+        cache.get(SOUND_FILE, MODE.NONBLOCKING)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_eviction(nrt_system):
+    size = sound_size(nrt_system)
+    cache = SoundCache(nrt_system, budget=2 * size)
+    first = cache.get(SOUND_FILE, MODE.TWOD)
+    second = cache.get(SOUND_FILE, MODE.THREED)
+    assert cache.get(SOUND_FILE, MODE.TWOD) is first
+    cache.get(SOUND_FILE, MODE.TWOD | MODE.LOOP_NORMAL)
+    # The second sound was used least recently
+    assert cache.evictions == 1
+    assert cache.size == 2 * size
+    assert cache.get(SOUND_FILE, MODE.THREED) is not second
+    assert cache.evictions == 2
+    cache.clear()
+
+
+def test_playing_sounds_kept(nrt_system):
+    size = sound_size(nrt_system)
+    cache = SoundCache(nrt_system, budget=size)
+    playing = cache.get(SOUND_FILE, MODE.TWOD)
+    channel = playing.get_subsound(0).play()
+    cache.get(SOUND_FILE, MODE.THREED)
+    assert cache.evictions == 0
+    assert cache.size == 2 * size
+    assert channel.is_playing
+    channel.stop()
+    cache.get(SOUND_FILE, MODE.TWOD | MODE.LOOP_NORMAL)
+    assert cache.evictions == 2
+    assert cache.size == size
+    cache.clear()
@@ -0,0 +1,79 @@
+import pytest
+from pyfmodex.spatial_world import SpatialAudioWorld
+
+
+def make_reverb(system, position, max_distance):
+    reverb = system.create_reverb_3d()
+    reverb.position = position
+    reverb.max_distance = max_distance
+    return reverb
+
+
+def test_reverb_culling(nrt_system):
+    world = SpatialAudioWorld(nrt_system, cell_size=10.0)
+    reverbs = [make_reverb(nrt_system, [x * 20.0, 0.0, 0.0], 15.0) for x in range(20)]
+    for reverb in reverbs:
+        world.add_reverb(reverb)
+    assert len(world) == 20
+    assert reverbs[0] in world
+    assert not any(reverb.active for reverb in reverbs)
+
+    assert world.update([[30.0, 0.0, 0.0]]) == 2
+    assert [index for index, reverb in enumerate(reverbs) if reverb.active] == [1, 2]
+    assert (world.num_active, world.num_active_reverbs, world.num_active_geometry) == (2, 2, 0)
+    assert world.passes == 1
+    assert world.max_duration >= world.last_duration > 0.0
+
+    # Two listeners
+    assert world.update([[0.0, 0.0, 0.0], [380.0, 0.0, 5.0]]) == 2
+    assert reverbs[0].active and reverbs[19].active and not reverbs[1].active
+
+    # Moved out of reach of both
+    reverbs[19].position = [380.0, 0.0, 100.0]
+    world.move(reverbs[19])
+    assert world.update([[0.0, 0.0, 0.0], [380.0, 0.0, 5.0]]) == 1
+    assert not reverbs[19].active
+
+    world.remove(reverbs[0])
+    assert reverbs[0] not in world
+    world.update([[500.0, 0.0, 0.0]])
+    assert world.num_active == 0
+    assert reverbs[0].active
+
+
+def test_listener_position(nrt_system):
+    world = SpatialAudioWorld(nrt_system)
+    reverb = make_reverb(nrt_system, [0.0, 0.0, 1000.0], 50.0)
+    world.add_reverb(reverb)
+    assert world.update() == 0
+    nrt_system.listener().position = [0.0, 0.0, 990.0]
+    assert world.update() == 1
+    assert reverb.active
+
+
+def test_geometry_and_margin(nrt_system):
+    world = SpatialAudioWorld(nrt_system, cell_size=8.0, geometry_distance=20.0, margin=5.0)
+    geometry = nrt_system.create_geometry(1, 3)
+    world.add_geometry(geometry, 10.0, [100.0, 0.0, 0.0])
+    assert not geometry.active
+    assert world.update([[68.0, 0.0, 0.0]]) == 0
+    assert world.update([[70.0, 0.0, 0.0]]) == 1
+    assert geometry.active
+    assert world.num_active_geometry == 1
+    # Kept active within the margin
+    assert world.update([[66.0, 0.0, 0.0]]) == 1
+    assert world.update([[64.0, 0.0, 0.0]]) == 0
+    assert not geometry.active
+    with pytest.raises(ValueError):
+        world.add_geometry(geometry, 1.0)
+
+
+def test_large_objects(nrt_system):
+    world = SpatialAudioWorld(nrt_system, cell_size=1.0)
+    reverb = make_reverb(nrt_system, [0.0, 0.0, 0.0], 1000.0)
+    world.add_reverb(reverb)
+    assert world.update([[900.0, 0.0, 0.0]]) == 1
+    assert world.update([[0.0, 0.0, 1001.0]]) == 0
+    world.reset_stats()
+    assert world.passes == 0
+    assert world.mean_duration == 0.0
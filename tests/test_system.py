@@ -1,5 +1,7 @@
 import os
+from array import array
 import unittest.mock as mock
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from pyfmodex.enums import DSP_TYPE, SPEAKERMODE, PLUGINTYPE, OUTPUTTYPE, SPEAKER, SOUND_FORMAT, TIMEUNIT
 from pyfmodex.flags import SYSTEM_CALLBACK_TYPE, MODE
@@ -57,6 +59,24 @@ def test_close():
     system.init()
     system.close()
 
+def test_release_forgets_wrappers(initialized_system):
+    kept = initialized_system.master_channel_group
+    system = System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.init()
+    group = system.master_channel_group
+    channel = system.play_dsp(system.create_dsp_by_type(DSP_TYPE.OSCILLATOR))
+    system.release()
+
+    # The handles of a new system may have the same values
+    system = System()
+    system.output = OUTPUTTYPE.NOSOUND_NRT
+    system.init()
+    assert system.master_channel_group is not group
+    assert system.play_dsp(system.create_dsp_by_type(DSP_TYPE.OSCILLATOR)) is not channel
+    assert initialized_system.master_channel_group is kept
+    system.release()
+
 def test_num_3d_listeners(initialized_system):
     assert initialized_system.num_3d_listeners == 1
     initialized_system.num_3d_listeners = 2
@@ -117,6 +137,7 @@ def test_geometry_max_world_size(system):
 
 def test_master_channel_group(initialized_system):
     assert initialized_system.master_channel_group
+    assert initialized_system.master_channel_group is initialized_system.master_channel_group
 def test_master_sound_group(initialized_system):
     assert initialized_system.master_sound_group
 
@@ -238,3 +259,43 @@ def test_listener(initialized_system):
     assert listener.position == [0.0, 0.0, 0.0]
     listener.position = [1.0, 2.0, 3.0]
     assert listener.position == [1.0, 2.0, 3.0]
+
+def test_set_3d_attributes_batch(initialized_system, sound):
+    channels = [sound.get_subsound(0).play(paused=True) for _ in range(3)]
+    positions = array("f", [1, 2, 3, 4, 5, 6, 7, 8, 9])
+    initialized_system.set_3d_attributes_batch(channels, positions)
+    assert channels[1].position == [4.0, 5.0, 6.0]
+    assert channels[2].velocity == [0.0, 0.0, 0.0]
+    velocities = [[0, 0, 1]] * 3
+    initialized_system.set_3d_attributes_batch(channels, positions, velocities)
+    assert channels[2].velocity == [0.0, 0.0, 1.0]
+    assert channels[2].position == [7.0, 8.0, 9.0]
+    with pytest.raises(ValueError):
+        initialized_system.set_3d_attributes_batch(channels, positions[:6])
+
+def test_get_geometry_occlusion_batch(nrt_system):
+    system = nrt_system
+    geometry = system.create_geometry(1, 4)
+    geometry.add_polygon(1.0, 0.5, True, (-10, -10, 5), (10, -10, 5), (10, 10, 5), (-10, 10, 5))
+    sources = array("f", [0, 0, 10, 0, 0, 2, 1, 1, 20, 0, 0, -3])
+    direct, reverb = system.get_geometry_occlusion_batch((0, 0, 0), sources)
+    expected = [
+        system.get_geometry_occlusion((0, 0, 0), sources[i : i + 3])
+        for i in range(0, 12, 3)
+    ]
+    assert list(direct) == [pytest.approx(occ.direct) for occ in expected]
+    assert list(reverb) == [pytest.approx(occ.reverb) for occ in expected]
+    assert list(direct) == [1.0, 0.0, 1.0, 0.0]
+
+    direct = array("f", [-1.0] * 4)
+    reverb = array("f", [-1.0] * 4)
+    with ThreadPoolExecutor(2) as executor:
+        result = system.get_geometry_occlusion_batch(
+            (0, 0, 0), sources, direct, reverb, max_distance=15, executor=executor, chunk_size=1
+        )
+    assert result == (direct, reverb)
+    assert list(direct) == [1.0, 0.0, -1.0, 0.0]
+    assert list(reverb) == [0.5, 0.0, -1.0, 0.0]
+
+    with pytest.raises(ValueError):
+        system.get_geometry_occlusion_batch((0, 0, 0), sources, array("f", [0.0]))
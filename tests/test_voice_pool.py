@@ -0,0 +1,68 @@
+import os
+
+import pytest
+from pyfmodex.flags import MODE
+from pyfmodex.voice_pool import VoicePool
+
+
+@pytest.fixture
+def sounds(nrt_system):
+    path = os.path.join(os.path.dirname(__file__), "test.fsb")
+    sound = nrt_system.create_sound(path, MODE.LOOP_NORMAL)
+    yield [sound.get_subsound(index) for index in range(2)]
+    sound.release()
+
+
+def test_play_and_update(nrt_system, sounds):
+    pool = VoicePool(nrt_system, max_voices=4, groups=("sfx", "ui"))
+    channel = pool.play(sounds[0], priority=10)
+    assert channel.priority == 10
+    assert not channel.paused
+    assert channel.channel_group is pool.groups["sfx"]
+    assert pool.play(sounds[0], group="ui").channel_group is pool.groups["ui"]
+    assert len(pool) == 2
+    channel.stop()
+    pool.update()
+    assert len(pool) == 1
+    pool.release()
+
+
+def test_throttle(nrt_system, sounds):
+    pool = VoicePool(nrt_system, per_frame=2)
+    assert pool.play(sounds[0])
+    assert pool.play(sounds[0])
+    assert pool.play(sounds[0]) is None
+    assert pool.play(sounds[1])
+    assert pool.throttled == 1
+    pool.update()
+    assert pool.play(sounds[0])
+    pool.release()
+
+
+def test_steal_and_reject(nrt_system, sounds):
+    pool = VoicePool(nrt_system, max_voices=2, per_frame=0)
+    important = pool.play(sounds[0], priority=0)
+    quiet = pool.play(sounds[1], priority=100)
+    quiet.volume = 0.0
+    nrt_system.update()
+
+    louder = pool.play(sounds[0], priority=100)
+    assert pool.stolen == 1
+    assert quiet not in pool.voices
+    assert pool.voices == [important, louder]
+
+    assert pool.play(sounds[1], priority=200) is None
+    assert pool.rejected == 1
+    assert len(pool) == 2
+    pool.release()
+
+
+def test_limit(nrt_system, sounds):
+    pool = VoicePool(nrt_system, per_frame=0)
+    sound_group = pool.limit(sounds[0], 2)
+    assert sound_group.max_audible == 2
+    for _ in range(3):
+        pool.play(sounds[0])
+    nrt_system.update()
+    assert sound_group.num_playing == 2
+    pool.release()